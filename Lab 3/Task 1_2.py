@@ -1,3 +1,6 @@
+from factorials import factorial
+
+
 def calculate_factorial(n):
     """
     Calculate the factorial of a given number.
@@ -14,13 +17,7 @@ def calculate_factorial(n):
     if n < 0:
         raise ValueError("Factorial is not defined for negative numbers")
     
-    if n == 0 or n == 1:
-        return 1
-    
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
+    return factorial(n)
 
 
 def get_user_input():
@@ -1,3 +1,7 @@
+from factorials import factorial as _fast_factorial
+from factorials import factorial_binary_split
+
+
 def factorial(n):
     """
     Calculate the factorial of a given number.
@@ -14,13 +18,8 @@ def factorial(n):
     if n < 0:
         raise ValueError("Factorial is not defined for negative numbers")
     
-    if n == 0 or n == 1:
-        return 1
-    
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
+    # Table lookup, loop or prime swing depending on the size of n
+    return _fast_factorial(n)
 def factorial_recursive(n):
     """
     Calculate factorial using recursive approach.
@@ -38,7 +37,8 @@ def factorial_recursive(n):
         raise ValueError("Factorial is not defined for negative numbers")   
     if n == 0 or n == 1:
         return 1
-    return n * factorial_recursive(n - 1)
+    # Recurse on halves of 2..n so the depth is log2(n), not n
+    return factorial_binary_split(n)
 def main():
     """
     Main function to demonstrate factorial calculations.
@@ -1,3 +1,62 @@
+import argparse
+import bisect
+import csv
+import io
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # batch billing is optional; the scalar calculator needs no extras
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # only needed for bill-run --format parquet
+    pa = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11 can still load JSON tariff files
+    tomllib = None
+
+
+# Tariff rates (per unit) for different customer types
+TARIFFS = {
+    "residential": {
+        "slab1": {"limit": 100, "rate": 3.50},
+        "slab2": {"limit": 200, "rate": 4.50},
+        "slab3": {"limit": float('inf'), "rate": 5.50}
+    },
+    "commercial": {
+        "slab1": {"limit": 200, "rate": 5.00},
+        "slab2": {"limit": 500, "rate": 6.50},
+        "slab3": {"limit": float('inf'), "rate": 7.50}
+    },
+    "industrial": {
+        "slab1": {"limit": 500, "rate": 6.00},
+        "slab2": {"limit": 1000, "rate": 7.50},
+        "slab3": {"limit": float('inf'), "rate": 8.50}
+    }
+}
+
+# Fixed charges based on customer type
+FIXED_CHARGES = {
+    "residential": 50,
+    "commercial": 100,
+    "industrial": 200
+}
+
+# Customer types in the order used for categorical codes in batch billing
+CUSTOMER_TYPES = tuple(TARIFFS)
+
+
 def calculate_power_bill(units_consumed, customer_type="residential"):
     """
     Calculate power bill based on units consumed and customer type.
@@ -9,88 +68,387 @@ def calculate_power_bill(units_consumed, customer_type="residential"):
     Returns:
         dict: Dictionary containing bill details
     """
-    
-    # Tariff rates (per unit) for different customer types
-    tariffs = {
-        "residential": {
-            "slab1": {"limit": 100, "rate": 3.50},
-            "slab2": {"limit": 200, "rate": 4.50},
-            "slab3": {"limit": float('inf'), "rate": 5.50}
-        },
-        "commercial": {
-            "slab1": {"limit": 200, "rate": 5.00},
-            "slab2": {"limit": 500, "rate": 6.50},
-            "slab3": {"limit": float('inf'), "rate": 7.50}
-        },
-        "industrial": {
-            "slab1": {"limit": 500, "rate": 6.00},
-            "slab2": {"limit": 1000, "rate": 7.50},
-            "slab3": {"limit": float('inf'), "rate": 8.50}
+    return DEFAULT_TARIFF_TABLE.calculate_bill(units_consumed, customer_type)
+
+
+def calculate_power_bills(units_array, customer_types="residential"):
+    """
+    Calculate power bills for many readings at once.
+
+    This is the batch counterpart of calculate_power_bill. Both bill with
+    DEFAULT_TARIFF_TABLE, so every total matches the scalar function exactly.
+
+    Args:
+        units_array: NumPy array, array.array or sequence of units consumed
+        customer_types: Customer type name for every reading, or a column of
+                        names / integer codes into CUSTOMER_TYPES
+
+    Returns:
+        dict: Columnar bill details - each value is an array with one entry
+              per reading ("customer_type" holds codes into CUSTOMER_TYPES)
+    """
+    return DEFAULT_TARIFF_TABLE.calculate_bills(units_array, customer_types)
+
+
+def benchmark_power_bills(count=1_000_000, seed=42):
+    """
+    Compare calculate_power_bills against a calculate_power_bill loop.
+
+    Args:
+        count (int): Number of synthetic meter readings to bill
+        seed (int): Seed for the random readings
+
+    Returns:
+        tuple: (loop seconds, batch seconds)
+    """
+    rng = np.random.default_rng(seed)
+    units = np.round(rng.uniform(0, 2000, count), 2)
+    codes = rng.integers(0, len(CUSTOMER_TYPES), count)
+    types = [CUSTOMER_TYPES[code] for code in codes.tolist()]
+
+    start = time.perf_counter()
+    loop_totals = [
+        calculate_power_bill(u, t)["total_amount"]
+        for u, t in zip(units.tolist(), types)
+    ]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = calculate_power_bills(units, np.array(types))
+    batch_seconds = time.perf_counter() - start
+
+    mismatches = np.count_nonzero(
+        np.round(batch["total_amount"], 2) != np.round(loop_totals, 2)
+    )
+
+    print(f"Bills:        {count:,}")
+    print(f"Scalar loop:  {loop_seconds:.3f} s")
+    print(f"Batch engine: {batch_seconds:.3f} s ({loop_seconds / batch_seconds:.1f}x faster)")
+    print(f"Mismatches:   {mismatches}")
+    return loop_seconds, batch_seconds
+
+
+class TariffTable:
+    """
+    Precompiled slab tariffs for any number of slabs and customer types.
+
+    Each customer type is compiled into cumulative slab boundaries and the
+    amount already charged at each boundary, so billing a reading is one
+    binary search plus one multiply instead of a walk over the slabs.
+    """
+
+    def __init__(self, tariffs):
+        """
+        Compile a tariff definition.
+
+        Args:
+            tariffs (dict): Maps customer type to {"fixed_charge": number,
+                            "slabs": [{"limit": number or None, "rate": number}, ...]}
+                            with increasing limits; a None limit means unbounded
+                            and is only allowed on the last slab
+        """
+        if not tariffs:
+            raise ValueError("Tariff table must define at least one customer type")
+
+        self._compiled = {}
+        for customer_type, spec in tariffs.items():
+            slabs = spec.get("slabs")
+            if not slabs:
+                raise ValueError(f"Customer type '{customer_type}' has no slabs")
+
+            boundaries = [0.0]
+            cumulative = [0.0]
+            rates = []
+            for index, slab in enumerate(slabs):
+                limit = slab.get("limit")
+                rate = float(slab["rate"])
+                rates.append(rate)
+                if limit is None or limit == float('inf'):
+                    if index != len(slabs) - 1:
+                        raise ValueError(f"Only the last slab of '{customer_type}' may be unbounded")
+                    break
+                limit = float(limit)
+                if limit <= boundaries[-1]:
+                    raise ValueError(f"Slab limits for '{customer_type}' must increase")
+                if index == len(slabs) - 1:
+                    raise ValueError(f"The last slab of '{customer_type}' must be unbounded")
+                cumulative.append(cumulative[-1] + (limit - boundaries[-1]) * rate)
+                boundaries.append(limit)
+
+            self._compiled[customer_type] = (
+                float(spec.get("fixed_charge", 0)),
+                boundaries,
+                cumulative,
+                rates,
+            )
+
+        # Array form of the same table for calculate_bills, built once here
+        self._columns = self._compile_columns() if np is not None else None
+
+    def _compile_columns(self):
+        """
+        Pack the compiled slabs into per-type arrays for batch billing.
+
+        Returns:
+            tuple: (fixed charges, slab lower bounds, slab widths, cumulative
+                   amounts, slab rates, boundary arrays for searchsorted); the
+                   2-D columns are indexed [type code, slab] and padded so a
+                   type with fewer slabs bills nothing in the missing ones
+        """
+        compiled = list(self._compiled.values())
+        shape = (len(compiled), max(len(rates) for _, _, _, rates in compiled))
+        lower = np.full(shape, np.inf)
+        width = np.zeros(shape)
+        cumulative = np.zeros(shape)
+        rates = np.zeros(shape)
+        searchable = []
+        for code, (_, boundaries, amounts, slab_rates) in enumerate(compiled):
+            slabs = len(slab_rates)
+            lower[code, :slabs] = boundaries
+            width[code, :slabs] = np.diff(boundaries + [np.inf])
+            cumulative[code, :slabs] = amounts
+            rates[code, :slabs] = slab_rates
+            searchable.append(np.array(boundaries, dtype=np.float64))
+        fixed = np.array([spec[0] for spec in compiled], dtype=np.float64)
+        return fixed, lower, width, cumulative, rates, searchable
+
+    @classmethod
+    def from_legacy(cls, tariffs=None, fixed_charges=None):
+        """
+        Build a table from the TARIFFS / FIXED_CHARGES dictionary layout.
+
+        Args:
+            tariffs (dict): Nested slab dictionaries (defaults to TARIFFS)
+            fixed_charges (dict): Fixed charge per customer type (defaults to FIXED_CHARGES)
+
+        Returns:
+            TariffTable: The compiled table
+        """
+        tariffs = TARIFFS if tariffs is None else tariffs
+        fixed_charges = FIXED_CHARGES if fixed_charges is None else fixed_charges
+        return cls({
+            customer_type: {
+                "fixed_charge": fixed_charges[customer_type],
+                "slabs": list(slabs.values()),
+            }
+            for customer_type, slabs in tariffs.items()
+        })
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Load and compile a tariff table from a JSON or TOML file.
+
+        Args:
+            path (str): Path to a .json or .toml tariff file
+
+        Returns:
+            TariffTable: The compiled table
+        """
+        if path.lower().endswith(".toml"):
+            if tomllib is None:
+                raise ValueError("TOML tariff files need Python 3.11 or newer")
+            with open(path, "rb") as f:
+                return cls(tomllib.load(f))
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @property
+    def customer_types(self):
+        """tuple: Customer types defined by this table."""
+        return tuple(self._compiled)
+
+    def _type_codes(self, customer_types, size):
+        """
+        Convert a customer type column into integer codes into customer_types.
+
+        Args:
+            customer_types: A single type name, a sequence/array of names, or an
+                            integer array of codes already indexing customer_types
+            size (int): Number of readings the column must cover
+
+        Returns:
+            numpy.ndarray: Integer codes, one per reading
+        """
+        names = self.customer_types
+        if isinstance(customer_types, str):
+            if customer_types not in self._compiled:
+                raise ValueError(f"Invalid customer type. Use one of: {', '.join(names)}")
+            return np.full(size, names.index(customer_types), dtype=np.intp)
+
+        column = np.asarray(customer_types)
+        if column.shape != (size,):
+            raise ValueError("customer_types must have one entry per reading")
+
+        if np.issubdtype(column.dtype, np.integer):
+            if size and (column.min() < 0 or column.max() >= len(names)):
+                raise ValueError("Customer type codes must index customer_types")
+            return column.astype(np.intp, copy=False)
+
+        # Categorical strings: map each distinct value once, not once per row
+        uniques, inverse = np.unique(column, return_inverse=True)
+        lookup = []
+        for name in uniques.tolist():
+            if name not in self._compiled:
+                raise ValueError(f"Invalid customer type. Use one of: {', '.join(names)}")
+            lookup.append(names.index(name))
+        return np.array(lookup, dtype=np.intp)[inverse.reshape(-1)]
+
+    def _lookup(self, units_consumed, customer_type):
+        if customer_type not in self._compiled:
+            raise ValueError(f"Invalid customer type. Use one of: {', '.join(self._compiled)}")
+        if units_consumed < 0:
+            raise ValueError("Units consumed cannot be negative")
+        fixed_charge, boundaries, cumulative, rates = self._compiled[customer_type]
+        index = bisect.bisect_left(boundaries, units_consumed) - 1
+        return fixed_charge, boundaries, cumulative, rates, max(index, 0)
+
+    def subtotal(self, units_consumed, customer_type="residential"):
+        """
+        Return the pre-tax amount (fixed charge plus energy charge).
+
+        Args:
+            units_consumed (float): Number of units consumed
+            customer_type (str): A customer type defined by this table
+
+        Returns:
+            float: Subtotal before GST and surcharge
+        """
+        fixed_charge, boundaries, cumulative, rates, i = self._lookup(units_consumed, customer_type)
+        return fixed_charge + cumulative[i] + (units_consumed - boundaries[i]) * rates[i]
+
+    def calculate_bill(self, units_consumed, customer_type="residential"):
+        """
+        Calculate a full bill in the same shape as calculate_power_bill.
+
+        Args:
+            units_consumed (float): Number of units consumed
+            customer_type (str): A customer type defined by this table
+
+        Returns:
+            dict: Dictionary containing bill details
+        """
+        fixed_charge, boundaries, cumulative, rates, i = self._lookup(units_consumed, customer_type)
+        total_amount = fixed_charge + cumulative[i] + (units_consumed - boundaries[i]) * rates[i]
+
+        # Only the slabs the reading reaches are listed, as in the scalar calculator
+        slab_details = []
+        for slab in range(i + 1):
+            upper = boundaries[slab + 1] if slab < i else units_consumed
+            units_in_slab = upper - boundaries[slab]
+            if units_in_slab > 0:
+                slab_details.append({
+                    "slab": f"slab{slab + 1}",
+                    "units": units_in_slab,
+                    "rate": rates[slab],
+                    "amount": units_in_slab * rates[slab]
+                })
+
+        gst = total_amount * 0.05  # 5% GST
+        surcharge = total_amount * 0.02  # 2% surcharge
+
+        return {
+            "customer_type": customer_type,
+            "units_consumed": units_consumed,
+            "fixed_charge": fixed_charge,
+            "slab_details": slab_details,
+            "subtotal": total_amount,
+            "gst": gst,
+            "surcharge": surcharge,
+            "total_amount": total_amount + gst + surcharge
         }
-    }
-    
-    # Fixed charges based on customer type
-    fixed_charges = {
-        "residential": 50,
-        "commercial": 100,
-        "industrial": 200
-    }
-    
-    if customer_type not in tariffs:
-        raise ValueError("Invalid customer type. Use 'residential', 'commercial', or 'industrial'")
-    
-    if units_consumed < 0:
-        raise ValueError("Units consumed cannot be negative")
-    
-    # Get tariff structure for customer type
-    tariff = tariffs[customer_type]
-    fixed_charge = fixed_charges[customer_type]
-    
-    # Calculate bill based on slabs
-    total_amount = fixed_charge
-    remaining_units = units_consumed
-    slab_details = []
-    
-    for slab_name, slab_info in tariff.items():
-        if remaining_units <= 0:
-            break
-            
-        if slab_name == "slab1":
-            units_in_slab = min(remaining_units, slab_info["limit"])
-        elif slab_name == "slab2":
-            units_in_slab = min(remaining_units, slab_info["limit"] - tariff["slab1"]["limit"])
-        else:  # slab3
-            units_in_slab = remaining_units
-            
-        if units_in_slab > 0:
-            slab_amount = units_in_slab * slab_info["rate"]
-            total_amount += slab_amount
-            
-            slab_details.append({
-                "slab": slab_name,
-                "units": units_in_slab,
-                "rate": slab_info["rate"],
-                "amount": slab_amount
-            })
-            
-            remaining_units -= units_in_slab
-    
-    # Calculate taxes and surcharges
-    gst = total_amount * 0.05  # 5% GST
-    surcharge = total_amount * 0.02  # 2% surcharge
-    
-    final_amount = total_amount + gst + surcharge
-    
-    return {
-        "customer_type": customer_type,
-        "units_consumed": units_consumed,
-        "fixed_charge": fixed_charge,
-        "slab_details": slab_details,
-        "subtotal": total_amount,
-        "gst": gst,
-        "surcharge": surcharge,
-        "total_amount": final_amount
-    }
+
+    def calculate_bills(self, units_array, customer_types="residential"):
+        """
+        Calculate many bills at once, the batch form of calculate_bill.
+
+        Each customer type's readings are placed in their slab by one
+        searchsorted over its compiled boundaries, and the totals use the
+        same arithmetic as calculate_bill, so they match it exactly.
+
+        Args:
+            units_array: NumPy array, array.array or sequence of units consumed
+            customer_types: Customer type name for every reading, or a column of
+                            names / integer codes into customer_types
+
+        Returns:
+            dict: Columnar bill details - each value is an array with one entry
+                  per reading ("customer_type" holds codes into customer_types,
+                  "slabN_units" the units billed in slab N)
+        """
+        if np is None:
+            raise ImportError("Batch billing requires NumPy")
+
+        units = np.asarray(units_array, dtype=np.float64).reshape(-1)
+        codes = self._type_codes(customer_types, units.size)
+
+        if units.size and units.min() < 0:
+            raise ValueError("Units consumed cannot be negative")
+
+        fixed, lower, width, cumulative, rates, boundaries = self._columns
+        if len(boundaries) == 1:
+            index = boundaries[0].searchsorted(units, side="left") - 1
+        else:
+            index = np.empty(units.size, dtype=np.intp)
+            for code, bounds in enumerate(boundaries):
+                rows = codes == code
+                index[rows] = bounds.searchsorted(units[rows], side="left") - 1
+        np.maximum(index, 0, out=index)
+
+        fixed_charge = fixed[codes]
+        subtotal = fixed_charge + cumulative[codes, index]
+        subtotal += (units - lower[codes, index]) * rates[codes, index]
+
+        bills = {
+            "customer_type": codes,
+            "units_consumed": units,
+            "fixed_charge": fixed_charge,
+        }
+        for slab in range(lower.shape[1]):
+            bills[f"slab{slab + 1}_units"] = np.clip(units - lower[codes, slab], 0, width[codes, slab])
+
+        gst = subtotal * 0.05  # 5% GST
+        surcharge = subtotal * 0.02  # 2% surcharge
+
+        bills.update({
+            "subtotal": subtotal,
+            "gst": gst,
+            "surcharge": surcharge,
+            "total_amount": subtotal + gst + surcharge,
+        })
+        return bills
+
+
+# The built-in TARIFFS / FIXED_CHARGES, compiled once for calculate_power_bill(s)
+DEFAULT_TARIFF_TABLE = TariffTable.from_legacy(TARIFFS, FIXED_CHARGES)
+
+
+# Compiled tables keyed by absolute path, stored with the mtime they were read at
+_TARIFF_CACHE = {}
+
+
+def load_tariff_table(path):
+    """
+    Return the compiled TariffTable for a tariff file, reusing a cached copy.
+
+    The file is recompiled only when its modification time changes, so a
+    long-running billing worker picks up a revised tariff on its next call.
+
+    Args:
+        path (str): Path to a .json or .toml tariff file
+
+    Returns:
+        TariffTable: The compiled table
+    """
+    key = os.path.abspath(path)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _TARIFF_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    table = TariffTable.from_file(key)
+    _TARIFF_CACHE[key] = (mtime, table)
+    return table
 
 
 def display_bill(bill_details):
@@ -203,5 +561,238 @@ def main():
         print(f"Error: {e}")
 
 
+# Columns written by bill-run, in output order
+BILL_RUN_COLUMNS = (
+    "customer_id", "customer_type", "units_consumed", "fixed_charge",
+    "subtotal", "gst", "surcharge", "total_amount",
+)
+
+
+def _bill_chunk(lines, columns, tariff_path, output_format, part_path):
+    """
+    Bill one chunk of meter-reading CSV lines (runs in a worker process).
+
+    Args:
+        lines (list): Raw CSV lines (bytes) of the chunk, without the header
+        columns (tuple): Indexes of the customer id, type and units fields
+        tariff_path (str): Tariff file to bill with, or None for the built-in tariffs
+        output_format (str): "csv" or "parquet"
+        part_path (str): File the parquet part is written to (parquet only)
+
+    Returns:
+        tuple: (rows billed, CSV bytes for the chunk or None for parquet)
+    """
+    table = DEFAULT_TARIFF_TABLE if tariff_path is None else load_tariff_table(tariff_path)
+    id_col, type_col, units_col = columns
+
+    customer_ids = []
+    customer_types = []
+    units = []
+    reader = csv.reader(line.decode("utf-8") for line in lines)
+    for row in reader:
+        if not row:
+            continue
+        try:
+            units.append(float(row[units_col]))
+        except ValueError as e:
+            raise ValueError(f"Customer {row[id_col]}: {e}") from None
+        customer_ids.append(row[id_col])
+        customer_types.append(row[type_col].strip().lower())
+
+    # The whole chunk is billed in one vectorized call
+    try:
+        bills = table.calculate_bills(units, np.array(customer_types, dtype=str))
+    except ValueError:
+        # Find the offending reading so the error names its customer
+        for customer_id, reading, customer_type in zip(customer_ids, units, customer_types):
+            try:
+                table.calculate_bill(reading, customer_type)
+            except ValueError as e:
+                raise ValueError(f"Customer {customer_id}: {e}") from None
+        raise
+
+    count = len(customer_ids)
+    if output_format == "parquet":
+        billed = {"customer_id": customer_ids, "customer_type": customer_types}
+        billed.update((name, bills[name]) for name in BILL_RUN_COLUMNS[2:])
+        pq.write_table(pa.table(billed), part_path)
+        return count, None
+
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    amounts = [[f"{value:.2f}" for value in bills[name].tolist()] for name in BILL_RUN_COLUMNS[3:]]
+    writer.writerows(zip(customer_ids, customer_types, units, *amounts))
+    return count, out.getvalue().encode("utf-8")
+
+
+def _read_checkpoint(path):
+    """
+    Load a bill-run checkpoint, or None if there is none.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_checkpoint(path, state):
+    """
+    Atomically replace the bill-run checkpoint file.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def _checkpoint_matches_output(state, output, output_format):
+    """
+    Check that the output a checkpoint describes is still on disk.
+
+    A CSV output must hold at least the checkpointed bytes; anything past
+    them is an unfinished chunk that resuming truncates. Parquet output
+    must still have every checkpointed part file.
+    """
+    if output_format == "parquet":
+        return all(
+            os.path.exists(os.path.join(output, f"part-{index:05d}.parquet"))
+            for index in range(state["chunks"])
+        )
+    try:
+        return os.path.getsize(output) >= state["output_offset"]
+    except OSError:
+        return False
+
+
+def bill_run(argv=None):
+    """
+    Bill a meter-reading CSV file in parallel, streaming chunk by chunk.
+
+    The input needs a header with customer_id, customer_type and units
+    columns. Chunks are billed in a process pool but written strictly in
+    input order, and only a few chunks per worker are ever in flight, so
+    memory stays bounded whatever the file size. After each chunk the input
+    byte offset is checkpointed; --resume continues from there after a crash.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        int: Process exit status
+    """
+    parser = argparse.ArgumentParser(prog="bill-run", description="Bill a meter-reading CSV file.")
+    parser.add_argument("input", help="CSV with customer_id, customer_type and units columns")
+    parser.add_argument("output", help="output CSV file, or directory of part files for parquet")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv", dest="output_format")
+    parser.add_argument("--tariffs", help="JSON/TOML tariff file (defaults to the built-in tariffs)")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="rows per chunk")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--checkpoint", help="checkpoint file (defaults to OUTPUT.checkpoint)")
+    parser.add_argument("--resume", action="store_true", help="continue from the last checkpoint")
+    args = parser.parse_args(argv)
+
+    if args.chunk_size < 1 or args.workers < 1:
+        parser.error("--chunk-size and --workers must be positive")
+    if np is None:
+        parser.error("bill-run requires NumPy")
+    if args.output_format == "parquet" and pa is None:
+        parser.error("--format parquet requires pyarrow")
+
+    checkpoint_path = args.checkpoint or args.output.rstrip("/\\") + ".checkpoint"
+    state = _read_checkpoint(checkpoint_path) if args.resume else None
+    if state is None:
+        state = {"input_offset": None, "output_offset": 0, "chunks": 0, "rows": 0}
+    elif not _checkpoint_matches_output(state, args.output, args.output_format):
+        print(
+            f"Error: {args.output} does not match checkpoint {checkpoint_path}; "
+            "restore the output or rerun without --resume",
+            file=sys.stderr,
+        )
+        return 1
+    tariff_path = os.path.abspath(args.tariffs) if args.tariffs else None
+
+    with open(args.input, "rb") as infile:
+        header = next(csv.reader([infile.readline().decode("utf-8-sig")]), [])
+        header = [name.strip().lower() for name in header]
+        try:
+            columns = tuple(header.index(name) for name in ("customer_id", "customer_type", "units"))
+        except ValueError:
+            print("Error: input needs customer_id, customer_type and units columns", file=sys.stderr)
+            return 1
+        if state["input_offset"] is not None:
+            infile.seek(state["input_offset"])
+
+        if args.output_format == "parquet":
+            os.makedirs(args.output, exist_ok=True)
+            outfile = None
+        else:
+            resuming = state["input_offset"] is not None
+            outfile = open(args.output, "r+b" if resuming else "wb")
+            if resuming:
+                # Drop anything written after the last checkpoint
+                outfile.truncate(state["output_offset"])
+                outfile.seek(state["output_offset"])
+            else:
+                outfile.write((",".join(BILL_RUN_COLUMNS) + "\n").encode("utf-8"))
+
+        started = time.perf_counter()
+        rows_this_run = 0
+        pending = deque()
+        try:
+            with ProcessPoolExecutor(max_workers=args.workers) as pool:
+                while True:
+                    # Keep the pool busy but never buffer more than 2 chunks per worker
+                    while len(pending) < 2 * args.workers:
+                        lines = list(itertools.islice(infile, args.chunk_size))
+                        if not lines:
+                            break
+                        index = state["chunks"] + len(pending)
+                        part_path = os.path.join(args.output, f"part-{index:05d}.parquet")
+                        future = pool.submit(
+                            _bill_chunk, lines, columns, tariff_path, args.output_format, part_path
+                        )
+                        pending.append((future, infile.tell()))
+                    if not pending:
+                        break
+
+                    future, input_offset = pending.popleft()
+                    count, data = future.result()
+                    if outfile is not None:
+                        outfile.write(data)
+                        outfile.flush()
+                        os.fsync(outfile.fileno())
+                        state["output_offset"] = outfile.tell()
+                    state["input_offset"] = input_offset
+                    state["chunks"] += 1
+                    state["rows"] += count
+                    _write_checkpoint(checkpoint_path, state)
+
+                    rows_this_run += count
+                    elapsed = time.perf_counter() - started
+                    print(
+                        f"{state['rows']:,} rows billed ({rows_this_run / elapsed:,.0f} rows/sec)",
+                        file=sys.stderr,
+                    )
+        except ValueError as e:
+            print(f"Error: {e} (rerun with --resume to continue from the last checkpoint)", file=sys.stderr)
+            return 1
+        finally:
+            if outfile is not None:
+                outfile.close()
+
+    elapsed = time.perf_counter() - started
+    rate = rows_this_run / elapsed if elapsed else 0.0
+    print(f"Done: {state['rows']:,} rows in {elapsed:.2f} s ({rate:,.0f} rows/sec)")
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return 0
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["bill-run"]:
+        sys.exit(bill_run(sys.argv[2:]))
+    elif "--benchmark" in sys.argv:
+        benchmark_power_bills()
+    else:
+        main()
@@ -1,10 +1,465 @@
-# Global dictionary to store user credentials
-users_db = {}
+import argparse
+import asyncio
+import hashlib
+import hmac
+import itertools
+import math
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-def register_user():
+
+# Default hashing cost per algorithm: log2(N) for scrypt, iterations for PBKDF2
+DEFAULT_COSTS = {
+    "scrypt": 14,
+    "pbkdf2_sha256": 600_000,
+}
+
+
+def hash_password(password, algorithm="scrypt", cost=None):
+    """
+    Hash a password with a fresh random salt.
+    
+    Args:
+        password (str): Plaintext password
+        algorithm (str): "scrypt" or "pbkdf2_sha256"
+        cost (int): log2(N) for scrypt or the PBKDF2 iteration count;
+                    defaults to DEFAULT_COSTS[algorithm]
+        
+    Returns:
+        str: Encoded hash "algorithm$cost$salt$digest" (hex salt and digest)
+    """
+    if algorithm not in DEFAULT_COSTS:
+        raise ValueError("Unsupported algorithm. Use 'scrypt' or 'pbkdf2_sha256'")
+    cost = DEFAULT_COSTS[algorithm] if cost is None else int(cost)
+    salt = os.urandom(16)
+    digest = _derive(password, salt, algorithm, cost)
+    return f"{algorithm}${cost}${salt.hex()}${digest.hex()}"
+
+
+def _derive(password, salt, algorithm, cost):
+    """
+    Run the key derivation function for hash_password/verify_password.
+    """
+    data = password.encode("utf-8")
+    if algorithm == "scrypt":
+        n = 1 << cost
+        return hashlib.scrypt(data, salt=salt, n=n, r=8, p=1, maxmem=256 * n * 8 + 1024 * 1024, dklen=32)
+    if algorithm == "pbkdf2_sha256":
+        return hashlib.pbkdf2_hmac("sha256", data, salt, cost)
+    raise ValueError(f"Unsupported algorithm '{algorithm}'")
+
+
+def verify_password(password, encoded):
     """
-    Register a new user by adding username and password to users_db dictionary.
+    Check a password against a hash produced by hash_password.
     
+    Args:
+        password (str): Plaintext password to check
+        encoded (str): Stored hash string
+        
+    Returns:
+        bool: True if the password matches
+    """
+    algorithm, cost, salt, digest = encoded.split("$")
+    candidate = _derive(password, bytes.fromhex(salt), algorithm, int(cost))
+    return hmac.compare_digest(candidate, bytes.fromhex(digest))
+
+
+class BloomFilter:
+    """
+    Bloom filter answering "username definitely not registered".
+    
+    Lookups that miss the filter never touch the database, which keeps
+    credential-stuffing traffic for unknown usernames cheap. Counters record
+    how often the filter short-circuited a lookup and how often it let a
+    lookup through that the database then rejected (a false positive).
+    """
+
+    def __init__(self, capacity=1_000_000, error_rate=0.01):
+        """
+        Args:
+            capacity (int): Expected number of usernames
+            error_rate (float): Target false-positive rate at that capacity
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.negatives = 0
+        self.passes = 0
+        self.false_positives = 0
+
+    def _positions(self, username):
+        digest = hashlib.blake2b(username.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, username):
+        """
+        Record a registered username.
+        """
+        positions = self._positions(username)
+        with self._lock:
+            for pos in positions:
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+            self.count += 1
+
+    def __contains__(self, username):
+        bits = self._bits
+        found = all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(username))
+        # The pooled stores share one filter, so counters are only updated under the lock
+        with self._lock:
+            if found:
+                self.passes += 1
+            else:
+                self.negatives += 1
+        return found
+
+    def record_false_positive(self):
+        """
+        Count a lookup the filter let through but the database rejected.
+        """
+        with self._lock:
+            self.false_positives += 1
+
+    def stats(self):
+        """
+        Return sizing and hit/miss counters.
+        
+        Returns:
+            dict: Capacity, fill and counter values
+        """
+        fill = 1 - math.exp(-self.num_hashes * self.count / self.num_bits)
+        return {
+            "capacity": self.capacity,
+            "count": self.count,
+            "bits": self.num_bits,
+            "hashes": self.num_hashes,
+            "estimated_false_positive_rate": fill ** self.num_hashes,
+            "negatives": self.negatives,
+            "passes": self.passes,
+            "false_positives": self.false_positives,
+        }
+
+
+class SessionCache:
+    """
+    LRU cache of recently authenticated username/password pairs with a TTL.
+    
+    A repeat login that hits the cache skips the database and the slow
+    password hash. Entries are keyed by a keyed HMAC of the credentials, so
+    plaintext passwords are never held in memory.
+    """
+
+    def __init__(self, maxsize=10_000, ttl=300.0):
+        """
+        Args:
+            maxsize (int): Maximum cached sessions (0 disables the cache)
+            ttl (float): Seconds a cached session stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._secret = os.urandom(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def key(self, username, password):
+        """
+        Derive the cache key for a pair of credentials.
+        """
+        message = username.encode("utf-8") + b"\0" + password.encode("utf-8")
+        return hmac.new(self._secret, message, hashlib.sha256).digest()
+
+    def get(self, key):
+        """
+        Check whether a session is cached and still fresh.
+        
+        Returns:
+            bool: True on a cache hit
+        """
+        now = time.monotonic()
+        with self._lock:
+            expires = self._entries.get(key)
+            if expires is None:
+                self.misses += 1
+                return False
+            if expires <= now:
+                del self._entries[key]
+                self.expired += 1
+                self.misses += 1
+                return False
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True
+
+    def put(self, key):
+        """
+        Cache a freshly authenticated session.
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = time.monotonic() + self.ttl
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+
+    def stats(self):
+        """
+        Return sizing and hit/miss counters.
+        
+        Returns:
+            dict: Size and counter values
+        """
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
+
+
+class UserStore:
+    """
+    Persistent credential store backed by SQLite.
+    
+    Passwords are kept only as salted scrypt/PBKDF2 hashes. The table is
+    keyed (and therefore indexed) by username and the database runs in WAL
+    mode so readers are not blocked by writers. The algorithm and cost used
+    for new hashes are configurable; each stored hash records its own
+    parameters, and a successful login upgrades hashes made with older ones.
+    
+    A BloomFilter in front of the table rejects unknown usernames without a
+    query, and a SessionCache lets repeat logins skip re-hashing. Stores that
+    share a database file should share these objects too, since the filter
+    only learns about registrations made through the stores using it.
+    """
+
+    def __init__(self, path="users.db", algorithm="scrypt", cost=None, check_same_thread=True,
+                 bloom=None, sessions=None):
+        """
+        Open (or create) a user store.
+        
+        Args:
+            path (str): SQLite database file, or ":memory:"
+            algorithm (str): Hash algorithm for new passwords
+            cost (int): Hash cost for new passwords (see hash_password)
+            check_same_thread (bool): Pass False to hand the store between
+                                      threads (one thread at a time)
+            bloom (BloomFilter): Shared username filter; by default a new one
+                                 is built from the usernames already stored
+            sessions (SessionCache): Shared session cache (defaults to a new one)
+        """
+        if algorithm not in DEFAULT_COSTS:
+            raise ValueError("Unsupported algorithm. Use 'scrypt' or 'pbkdf2_sha256'")
+        self.algorithm = algorithm
+        self.cost = DEFAULT_COSTS[algorithm] if cost is None else int(cost)
+        self._conn = sqlite3.connect(path, check_same_thread=check_same_thread)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS users ("
+            " username TEXT PRIMARY KEY,"
+            " password_hash TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+        if bloom is None:
+            bloom = BloomFilter(capacity=max(2 * len(self), 1_000_000))
+            for (username,) in self._conn.execute("SELECT username FROM users"):
+                bloom.add(username)
+        self.bloom = bloom
+        self.sessions = sessions if sessions is not None else SessionCache()
+
+    def close(self):
+        """
+        Close the underlying database connection.
+        """
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __contains__(self, username):
+        if username not in self.bloom:
+            return False
+        row = self._conn.execute(
+            "SELECT 1 FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        if row is None:
+            self.bloom.record_false_positive()
+            return False
+        return True
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def usernames(self):
+        """
+        Return all registered usernames in sorted order.
+        
+        Returns:
+            list: Usernames
+        """
+        return [row[0] for row in self._conn.execute("SELECT username FROM users ORDER BY username")]
+
+    def add_user(self, username, password):
+        """
+        Register a user.
+        
+        Args:
+            username (str): New username
+            password (str): Plaintext password (stored hashed)
+            
+        Returns:
+            bool: True if added, False if the username already exists
+        """
+        encoded = hash_password(password, self.algorithm, self.cost)
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO users (username, password_hash) VALUES (?, ?)",
+                    (username, encoded),
+                )
+        except sqlite3.IntegrityError:
+            return False
+        self.bloom.add(username)
+        return True
+
+    def verify(self, username, password):
+        """
+        Check a username/password pair.
+        
+        Args:
+            username (str): Username
+            password (str): Plaintext password
+            
+        Returns:
+            bool: True if the user exists and the password matches
+        """
+        session_key = self.sessions.key(username, password)
+        if self.sessions.get(session_key):
+            return True
+        if username not in self.bloom:
+            return False
+
+        row = self._conn.execute(
+            "SELECT password_hash FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        if row is None:
+            self.bloom.record_false_positive()
+            return False
+        if not verify_password(password, row[0]):
+            return False
+
+        # Re-hash with the current settings if the stored cost is out of date
+        algorithm, cost = row[0].split("$", 2)[:2]
+        if algorithm != self.algorithm or int(cost) != self.cost:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE users SET password_hash = ? WHERE username = ?",
+                    (hash_password(password, self.algorithm, self.cost), username),
+                )
+        self.sessions.put(session_key)
+        return True
+
+    def stats(self):
+        """
+        Return hit/miss counters for the username filter and session cache.
+        
+        Returns:
+            dict: {"bloom": ..., "sessions": ...}
+        """
+        return {"bloom": self.bloom.stats(), "sessions": self.sessions.stats()}
+
+    def bulk_import(self, users, workers=None, batch_size=10_000):
+        """
+        Add many users in a single transaction.
+        
+        Hashing dominates the cost of an import, and hashlib releases the GIL
+        while deriving keys, so passwords are hashed in batches on a thread pool.
+        
+        Args:
+            users: Iterable of (username, password) pairs
+            workers (int): Hashing threads (defaults to the CPU count)
+            batch_size (int): Users hashed and inserted per batch
+            
+        Returns:
+            int: Number of users added (existing usernames are skipped)
+        """
+        def _hash(password):
+            return hash_password(password, self.algorithm, self.cost)
+
+        before = self._conn.total_changes
+        users = iter(users)
+        with self._conn, ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            while True:
+                batch = list(itertools.islice(users, batch_size))
+                if not batch:
+                    break
+                hashes = pool.map(_hash, [password for _, password in batch])
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO users (username, password_hash) VALUES (?, ?)",
+                    zip((username for username, _ in batch), hashes),
+                )
+                for username, _ in batch:
+                    self.bloom.add(username)
+        return self._conn.total_changes - before
+
+
+# Registration rules shared by the interactive menu and the login service
+MIN_USERNAME_LENGTH = 3
+MIN_PASSWORD_LENGTH = 6
+
+
+def validate_credentials(username, password):
+    """
+    Check a new username/password pair against the registration rules.
+    
+    Args:
+        username (str): Requested username
+        password (str): Requested password
+        
+    Returns:
+        str: Error message, or None if the pair is acceptable
+    """
+    if len(username) < MIN_USERNAME_LENGTH:
+        return f"Username must be at least {MIN_USERNAME_LENGTH} characters long!"
+    if len(password) < MIN_PASSWORD_LENGTH:
+        return f"Password must be at least {MIN_PASSWORD_LENGTH} characters long!"
+    return None
+
+
+def register_user(store):
+    """
+    Register a new user by adding username and password to the user store.
+    
+    Args:
+        store (UserStore): Store to register the user in
+        
     Returns:
         bool: True if registration successful, False otherwise
     """
@@ -14,21 +469,21 @@ def register_user():
     username = input("Enter username: ").strip()
     
     # Check if username already exists
-    if username in users_db:
+    if username in store:
         print("Error: Username already exists!")
         return False
     
     # Validate username
-    if len(username) < 3:
-        print("Error: Username must be at least 3 characters long!")
+    if len(username) < MIN_USERNAME_LENGTH:
+        print(f"Error: Username must be at least {MIN_USERNAME_LENGTH} characters long!")
         return False
     
     # Get password
     password = input("Enter password: ").strip()
     
     # Validate password
-    if len(password) < 6:
-        print("Error: Password must be at least 6 characters long!")
+    if len(password) < MIN_PASSWORD_LENGTH:
+        print(f"Error: Password must be at least {MIN_PASSWORD_LENGTH} characters long!")
         return False
     
     # Confirm password
@@ -39,15 +494,20 @@ def register_user():
         return False
     
     # Store user credentials
-    users_db[username] = password
+    if not store.add_user(username, password):
+        print("Error: Username already exists!")
+        return False
     print(f"Success: User '{username}' registered successfully!")
     return True
 
 
-def login_user():
+def login_user(store):
     """
-    Authenticate a user by checking username and password against users_db dictionary.
+    Authenticate a user by checking username and password against the user store.
     
+    Args:
+        store (UserStore): Store holding registered users
+        
     Returns:
         bool: True if login successful, False otherwise
     """
@@ -57,7 +517,7 @@ def login_user():
     username = input("Enter username: ").strip()
     
     # Check if username exists
-    if username not in users_db:
+    if username not in store:
         print("Error: Username not found!")
         return False
     
@@ -65,7 +525,7 @@ def login_user():
     password = input("Enter password: ").strip()
     
     # Check if password matches
-    if users_db[username] == password:
+    if store.verify(username, password):
         print(f"Success: Welcome back, {username}!")
         return True
     else:
@@ -73,22 +533,29 @@ def login_user():
         return False
 
 
-def display_users():
+def display_users(store):
     """
     Display all registered users (for demonstration purposes).
+    
+    Args:
+        store (UserStore): Store holding registered users
     """
     print("\n=== REGISTERED USERS ===")
-    if not users_db:
+    usernames = store.usernames()
+    if not usernames:
         print("No users registered yet.")
     else:
-        for username in users_db.keys():
+        for username in usernames:
             print(f"Username: {username}")
     print("=" * 25)
 
 
-def main():
+def main(store):
     """
     Main function to demonstrate user registration and login system.
+    
+    Args:
+        store (UserStore): Store holding registered users
     """
     print("User Authentication System")
     print("=" * 30)
@@ -103,11 +570,11 @@ def main():
         choice = input("\nEnter your choice (1-4): ").strip()
         
         if choice == "1":
-            register_user()
+            register_user(store)
         elif choice == "2":
-            login_user()
+            login_user(store)
         elif choice == "3":
-            display_users()
+            display_users(store)
         elif choice == "4":
             print("Goodbye!")
             break
@@ -115,9 +582,12 @@ def main():
             print("Invalid choice! Please select 1-4.")
 
 
-def demo_registration_and_login():
+def demo_registration_and_login(store):
     """
     Demonstrate the registration and login functions with example users.
+    
+    Args:
+        store (UserStore): Store to register the example users in
     """
     print("Demo: Registration and Login System")
     print("=" * 40)
@@ -133,8 +603,7 @@ def demo_registration_and_login():
     ]
     
     for username, password in test_users:
-        if username not in users_db:
-            users_db[username] = password
+        if store.add_user(username, password):
             print(f"Registered: {username}")
     
     # Demo login
@@ -144,23 +613,264 @@ def demo_registration_and_login():
     test_username = "john_doe"
     test_password = "password123"
     
-    if test_username in users_db and users_db[test_username] == test_password:
+    if store.verify(test_username, test_password):
         print(f"Login successful for: {test_username}")
     else:
         print(f"Login failed for: {test_username}")
     
     # Test failed login
     wrong_password = "wrongpass"
-    if test_username in users_db and users_db[test_username] == wrong_password:
+    if store.verify(test_username, wrong_password):
         print(f"Login successful for: {test_username}")
     else:
         print(f"Login failed for: {test_username} (wrong password)")
 
 
-if __name__ == "__main__":
-    # Run demo first
-    demo_registration_and_login()
+class RateLimiter:
+    """
+    Per-client token bucket: each client may make `rate` requests per second
+    on average, with bursts of up to `burst` requests.
+    
+    A bucket left idle for burst / rate seconds has refilled completely and
+    is indistinguishable from a new one, so it is dropped. Buckets are kept
+    in order of last use and pruned from the oldest end on every call, so
+    memory is bounded by the clients seen in the last burst / rate seconds
+    rather than by every address that ever connected.
+    """
+
+    def __init__(self, rate=5.0, burst=10):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._buckets = OrderedDict()
+
+    def allow(self, client):
+        """
+        Spend one token for a client if it has one.
+        
+        Args:
+            client (str): Client key (the peer IP address)
+            
+        Returns:
+            bool: True if the request may proceed
+        """
+        if self.rate <= 0:
+            return True
+        now = time.monotonic()
+        self._prune(now)
+        tokens, last = self._buckets.pop(client, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        if tokens < 1:
+            self._buckets[client] = (tokens, now)
+            return False
+        self._buckets[client] = (tokens - 1, now)
+        return True
+
+    def _prune(self, now):
+        # Drop buckets that have been idle long enough to be full again
+        idle = self.burst / self.rate
+        buckets = self._buckets
+        while buckets:
+            client, (_, last) = next(iter(buckets.items()))
+            if now - last < idle:
+                break
+            del buckets[client]
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class LoginService:
+    """
+    Asyncio line-protocol server for registration and login.
+    
+    Each request is one UTF-8 line, answered with "OK" or "ERR <reason>":
+    
+        REGISTER <username> <password>
+        LOGIN <username> <password>
+    
+    Password hashing runs on a thread pool so the event loop keeps serving
+    other clients, and every job borrows one of a fixed pool of store
+    connections to the same SQLite database.
+    """
+
+    def __init__(self, path="users.db", workers=None, rate_limiter=None, **store_options):
+        """
+        Args:
+            path (str): SQLite database file shared by the pooled stores
+            workers (int): Hashing threads and pooled connections (defaults to the CPU count)
+            rate_limiter (RateLimiter): Per-IP limiter (defaults to RateLimiter())
+            **store_options: algorithm / cost passed to each UserStore
+        """
+        self.workers = workers or os.cpu_count()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        # Pooled connections share one username filter and session cache
+        first = UserStore(path, check_same_thread=False, **store_options)
+        self._stores = [first] + [
+            UserStore(path, check_same_thread=False, bloom=first.bloom,
+                      sessions=first.sessions, **store_options)
+            for _ in range(self.workers - 1)
+        ]
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._pool = None
+
+    async def _run(self, method, *args):
+        """
+        Run a UserStore method on a pooled connection in the hashing pool.
+        """
+        if self._pool is None:
+            self._pool = asyncio.Queue()
+            for store in self._stores:
+                self._pool.put_nowait(store)
+        store = await self._pool.get()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, getattr(store, method), *args)
+        finally:
+            self._pool.put_nowait(store)
+
+    async def handle_request(self, line, client):
+        """
+        Answer a single protocol line.
+        
+        Args:
+            line (str): Request line without the newline
+            client (str): Client key used for rate limiting
+            
+        Returns:
+            str: Response line without the newline
+        """
+        parts = line.split(" ", 2)
+        if len(parts) != 3 or parts[0].upper() not in ("REGISTER", "LOGIN"):
+            return "ERR usage: REGISTER|LOGIN <username> <password>"
+        if not self.rate_limiter.allow(client):
+            return "ERR rate limit exceeded"
+
+        command, username, password = parts[0].upper(), parts[1], parts[2]
+        if command == "REGISTER":
+            error = validate_credentials(username, password)
+            if error:
+                return f"ERR {error}"
+            if not await self._run("add_user", username, password):
+                return "ERR Username already exists!"
+            return "OK"
+
+        if await self._run("verify", username, password):
+            return "OK"
+        return "ERR Invalid username or password"
+
+    async def handle_client(self, reader, writer):
+        """
+        Serve one connection until the client disconnects.
+        """
+        client = (writer.get_extra_info("peername") or ("unknown",))[0]
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self.handle_request(line.decode("utf-8", "replace").strip(), client)
+                writer.write(response.encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        """
+        Listen for clients until cancelled.
+        """
+        server = await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+        print(f"Login service listening on {host}:{port} with {self.workers} workers")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Stop the hashing pool and close the pooled connections.
+        """
+        self._executor.shutdown(wait=True)
+        for store in self._stores:
+            store.close()
+
+
+def serve(argv=None):
+    """
+    Command-line entry point for the login service.
     
-    # Then run interactive system
-    print("\n" + "=" * 50)
-    main()
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(prog="serve", description="Run the async login service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--db", default="users.db", help="SQLite database file")
+    parser.add_argument("--workers", type=int, default=None, help="hashing threads / pooled connections")
+    parser.add_argument("--algorithm", default="scrypt", choices=sorted(DEFAULT_COSTS))
+    parser.add_argument("--cost", type=int, default=None, help="hash cost for new passwords")
+    parser.add_argument("--rate", type=float, default=5.0, help="requests/sec per IP (0 disables limiting)")
+    parser.add_argument("--burst", type=int, default=10, help="burst size per IP")
+    args = parser.parse_args(argv)
+
+    service = LoginService(
+        args.db,
+        workers=args.workers,
+        rate_limiter=RateLimiter(args.rate, args.burst),
+        algorithm=args.algorithm,
+        cost=args.cost,
+    )
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nService stopped.")
+
+
+def benchmark_user_store(count=1_000_000, logins=2_000, algorithm="pbkdf2_sha256", cost=1_000):
+    """
+    Bulk-load users into a fresh store and measure login throughput.
+    
+    Args:
+        count (int): Number of users to import in one transaction
+        logins (int): Number of successful logins to time
+        algorithm (str): Hash algorithm for the benchmark store
+        cost (int): Hash cost; raise it to see the latency/security trade-off
+        
+    Returns:
+        tuple: (import seconds, logins per second)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        with UserStore(os.path.join(tmp, "bench.db"), algorithm, cost) as store:
+            start = time.perf_counter()
+            store.bulk_import((f"user{i}", f"password{i}") for i in range(count))
+            import_seconds = time.perf_counter() - start
+
+            step = max(count // logins, 1)
+            start = time.perf_counter()
+            for i in range(0, step * logins, step):
+                store.verify(f"user{i % count}", f"password{i % count}")
+            login_seconds = time.perf_counter() - start
+
+    rate = logins / login_seconds
+    print(f"Users imported: {count:,} in {import_seconds:.2f} s ({algorithm}, cost {cost})")
+    print(f"Logins:         {logins:,} in {login_seconds:.2f} s ({rate:,.0f} logins/sec)")
+    return import_seconds, rate
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["serve"]:
+        serve(sys.argv[2:])
+        sys.exit()
+    if "--benchmark" in sys.argv:
+        benchmark_user_store()
+        sys.exit()
+
+    with UserStore("users.db") as store:
+        # Run demo first
+        demo_registration_and_login(store)
+        
+        # Then run interactive system
+        print("\n" + "=" * 50)
+        main(store)
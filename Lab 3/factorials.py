@@ -0,0 +1,456 @@
+"""
+Fast Factorial Algorithms
+
+- Precomputed table for small n (everything that fits in 64 bits)
+- Iterative loop for modest n
+- Binary-splitting product tree for large n
+- Prime-swing (Luschny) algorithm for very large n
+- Growable factorial cache and binomial coefficients, exact or mod a prime
+- Benchmark against the plain 2..n loop used by the lab scripts
+"""
+
+import math
+import sys
+import time
+from array import array
+
+
+# Largest n whose factorial is kept in SMALL_FACTORIALS (20! < 2**63)
+SMALL_LIMIT = 20
+
+SMALL_FACTORIALS = [1] * (SMALL_LIMIT + 1)
+for _i in range(2, SMALL_LIMIT + 1):
+    SMALL_FACTORIALS[_i] = SMALL_FACTORIALS[_i - 1] * _i
+del _i
+
+# Below this n a straight loop beats the bookkeeping of the faster methods;
+# above it prime swing wins (binary splitting sits between the two)
+ITERATIVE_LIMIT = 700
+
+METHODS = ("auto", "table", "iterative", "binary_split", "prime_swing")
+
+
+def _check(n):
+    if not isinstance(n, int) or isinstance(n, bool):
+        raise TypeError("Factorial is only defined for integers")
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers")
+
+
+def _product(values, lo, hi):
+    """
+    Multiply values[lo:hi] as a balanced product tree.
+
+    Balanced splitting keeps the operands of each multiplication about the
+    same size, so the big-integer multiplies stay in their fast regime
+    instead of repeatedly multiplying a huge number by a tiny one.
+    """
+    if hi - lo <= 8:
+        result = 1
+        for i in range(lo, hi):
+            result *= values[i]
+        return result
+    mid = (lo + hi) // 2
+    return _product(values, lo, mid) * _product(values, mid, hi)
+
+
+def _range_product(lo, hi):
+    """
+    Return lo * (lo + 1) * ... * (hi - 1) by binary splitting.
+    """
+    if hi - lo <= 8:
+        result = 1
+        for i in range(lo, hi):
+            result *= i
+        return result
+    mid = (lo + hi) // 2
+    return _range_product(lo, mid) * _range_product(mid, hi)
+
+
+def factorial_iterative(n):
+    """
+    Calculate n! by multiplying 2..n one at a time.
+
+    Args:
+        n (int): A non-negative integer
+
+    Returns:
+        int: The factorial of n (n!)
+    """
+    _check(n)
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
+
+
+def factorial_binary_split(n):
+    """
+    Calculate n! as a balanced product tree over 2..n.
+
+    Args:
+        n (int): A non-negative integer
+
+    Returns:
+        int: The factorial of n (n!)
+    """
+    _check(n)
+    if n < 2:
+        return 1
+    return _range_product(2, n + 1)
+
+
+def _primes_up_to(n):
+    """
+    Return all primes <= n using a bytearray Sieve of Eratosthenes.
+    """
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(n) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [i for i, is_prime in enumerate(sieve) if is_prime]
+
+
+def _swing(n, primes):
+    """
+    Return the swinging factorial n! / (n // 2)!**2 from its prime factors.
+    """
+    root = math.isqrt(n)
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        if p > n // 2:
+            factors.append(p)
+        elif p > n // 3:
+            continue
+        elif p > root:
+            if (n // p) & 1:
+                factors.append(p)
+        else:
+            q, power = n, 1
+            while q:
+                q //= p
+                if q & 1:
+                    power *= p
+            if power > 1:
+                factors.append(power)
+    return _product(factors, 0, len(factors))
+
+
+def factorial_prime_swing(n):
+    """
+    Calculate n! with Luschny's prime-swing algorithm.
+
+    Uses n! = ((n // 2)!)**2 * swing(n), where the swinging factorial is
+    assembled from prime powers, so most of the work is a handful of large,
+    balanced multiplications and squarings.
+
+    Args:
+        n (int): A non-negative integer
+
+    Returns:
+        int: The factorial of n (n!)
+    """
+    _check(n)
+    if n <= SMALL_LIMIT:
+        return SMALL_FACTORIALS[n]
+    primes = _primes_up_to(n)
+
+    # Unroll the recursion n -> n // 2 into a loop, innermost first
+    chain = []
+    while n > SMALL_LIMIT:
+        chain.append(n)
+        n //= 2
+    result = SMALL_FACTORIALS[n]
+    for m in reversed(chain):
+        result = result * result * _swing(m, primes)
+    return result
+
+
+def factorial(n, method="auto"):
+    """
+    Calculate the factorial of a given number.
+
+    Args:
+        n (int): A non-negative integer
+        method (str): "auto" (pick the fastest for n), "table", "iterative",
+                      "binary_split" or "prime_swing"
+
+    Returns:
+        int: The factorial of n (n!)
+
+    Raises:
+        ValueError: If n is negative, or "table" is requested beyond SMALL_LIMIT
+    """
+    _check(n)
+    if method == "auto":
+        if n <= SMALL_LIMIT:
+            return SMALL_FACTORIALS[n]
+        if n < ITERATIVE_LIMIT:
+            return factorial_iterative(n)
+        return factorial_prime_swing(n)
+    if method == "table":
+        if n > SMALL_LIMIT:
+            raise ValueError(f"The factorial table only covers n <= {SMALL_LIMIT}")
+        return SMALL_FACTORIALS[n]
+    if method == "iterative":
+        return factorial_iterative(n)
+    if method == "binary_split":
+        return factorial_binary_split(n)
+    if method == "prime_swing":
+        return factorial_prime_swing(n)
+    raise ValueError(f"Unknown method '{method}'. Use one of: {', '.join(METHODS)}")
+
+
+def _factorial_bytes(n):
+    # Approximate size of n! in bytes, from log(n!) = lgamma(n + 1)
+    return int(math.lgamma(n + 1) / math.log(256)) + 1
+
+
+def digit_count(value):
+    """
+    Return the number of decimal digits of a non-negative integer.
+
+    Works from bit_length() instead of str(), which is quadratic for huge
+    integers and refused above sys.get_int_max_str_digits() on Python 3.11+.
+    """
+    digits = int(value.bit_length() * math.log10(2)) + 1
+    if digits > 1 and 10 ** (digits - 1) > value:
+        digits -= 1
+    elif 10 ** digits <= value:
+        digits += 1
+    return digits
+
+
+class FactorialCache:
+    """
+    Growable cache of exact factorials for many queries in a row.
+
+    Factorials are kept in a list at every `stride`-th n and extended from
+    the largest cached value, so a new query only multiplies the numbers
+    past what is already known. When the cached integers exceed max_bytes
+    the stride doubles and every other entry is dropped; a query between
+    two entries is finished from the nearest lower one with a short range
+    product, so memory stays bounded at the cost of a little recomputation.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        Args:
+            max_bytes (int): Soft limit on the memory held by cached integers
+        """
+        self.max_bytes = max_bytes
+        self.stride = 1
+        self._values = [1]
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def _thin(self):
+        # Keep every other checkpoint at twice the stride
+        self.stride *= 2
+        self._values = self._values[::2]
+        self._bytes = sum((v.bit_length() + 7) // 8 for v in self._values)
+
+    def _extend(self, n):
+        # Start sparse enough that the checkpoints up to n fit the budget:
+        # their sizes grow about linearly, so they total about half of
+        # (number of checkpoints) * (size of n!)
+        size = _factorial_bytes(n)
+        while self.stride < n and size * (n // self.stride) // 2 > self.max_bytes:
+            self._thin()
+        while len(self._values) <= n // self.stride:
+            last = (len(self._values) - 1) * self.stride
+            value = self._values[-1] * _range_product(last + 1, last + self.stride + 1)
+            self._values.append(value)
+            self._bytes += (value.bit_length() + 7) // 8
+            # Thin as soon as the budget is exceeded, not after the whole extension
+            if self._bytes > self.max_bytes and len(self._values) > 2:
+                self._thin()
+
+    def factorial(self, n):
+        """
+        Return n!, extending the cache if needed.
+
+        Args:
+            n (int): A non-negative integer
+
+        Returns:
+            int: The factorial of n (n!)
+        """
+        _check(n)
+        if n // self.stride >= len(self._values):
+            self._extend(n)
+        index = n // self.stride
+        base = index * self.stride
+        return self._values[index] * _range_product(base + 1, n + 1)
+
+    def binomial(self, n, k):
+        """
+        Return n choose k from cached factorials.
+
+        Args:
+            n (int): Size of the set
+            k (int): Number of elements chosen
+
+        Returns:
+            int: The binomial coefficient (0 if k is outside 0..n)
+        """
+        _check(n)
+        if not 0 <= k <= n:
+            return 0
+        return self.factorial(n) // (self.factorial(k) * self.factorial(n - k))
+
+
+class ModFactorialTable:
+    """
+    Factorials and inverse factorials modulo a prime p.
+
+    The table is built in O(n) - one modular inverse plus a backward sweep
+    of multiplications - after which factorial and binomial queries are O(1).
+    It grows by doubling when a larger n is requested and never needs more
+    than p entries, since Lucas's theorem handles n >= p.
+    """
+
+    def __init__(self, mod, size=1024):
+        """
+        Args:
+            mod (int): A prime modulus
+            size (int): Initial number of table entries
+        """
+        if mod < 2:
+            raise ValueError("mod must be a prime")
+        self.mod = mod
+        # Residues are stored in compact int64 arrays when they fit
+        self._typecode = "q" if mod < 2 ** 63 else None
+        self._fact = None
+        self._inv_fact = None
+        self._build(min(size, mod))
+
+    def _build(self, size):
+        p = self.mod
+        fact = [1] * size
+        for i in range(1, size):
+            fact[i] = fact[i - 1] * i % p
+        inv = pow(fact[-1], p - 2, p)
+        if fact[-1] * inv % p != 1:
+            raise ValueError("mod must be a prime")
+        inv_fact = [1] * size
+        inv_fact[-1] = inv
+        for i in range(size - 1, 0, -1):
+            inv_fact[i - 1] = inv_fact[i] * i % p
+        if self._typecode:
+            fact, inv_fact = array(self._typecode, fact), array(self._typecode, inv_fact)
+        self._fact, self._inv_fact = fact, inv_fact
+
+    def _ensure(self, n):
+        if n >= len(self._fact):
+            self._build(min(max(n + 1, 2 * len(self._fact)), self.mod))
+
+    def factorial(self, n):
+        """
+        Return n! mod p.
+        """
+        _check(n)
+        if n >= self.mod:
+            return 0
+        self._ensure(n)
+        return self._fact[n]
+
+    def binomial(self, n, k):
+        """
+        Return (n choose k) mod p, using Lucas's theorem when n >= p.
+        """
+        _check(n)
+        if not 0 <= k <= n:
+            return 0
+        p = self.mod
+        result = 1
+        while n and result:
+            n_digit, k_digit = n % p, k % p
+            if k_digit > n_digit:
+                return 0
+            self._ensure(n_digit)
+            result = (result * self._fact[n_digit] % p
+                      * self._inv_fact[k_digit] % p
+                      * self._inv_fact[n_digit - k_digit] % p)
+            n //= p
+            k //= p
+        return result
+
+
+# Shared tables used by binomial(), keyed by modulus (None for exact values)
+_TABLES = {}
+
+
+def binomial(n, k, mod=None):
+    """
+    Calculate n choose k, reusing factorials from earlier calls.
+
+    Args:
+        n (int): Size of the set
+        k (int): Number of elements chosen
+        mod (int): Optional prime modulus
+
+    Returns:
+        int: The binomial coefficient, reduced mod `mod` if given
+    """
+    table = _TABLES.get(mod)
+    if table is None:
+        table = FactorialCache() if mod is None else ModFactorialTable(mod)
+        _TABLES[mod] = table
+    return table.binomial(n, k)
+
+
+def benchmark(sizes=(10_000, 100_000, 1_000_000)):
+    """
+    Time each method against the plain 2..n loop.
+
+    Args:
+        sizes (tuple): Values of n to benchmark
+
+    Returns:
+        dict: Seconds per (n, method)
+    """
+    timings = {}
+    for n in sizes:
+        print(f"\nn = {n:,}")
+        print("-" * 40)
+        expected = None
+        for method in ("iterative", "binary_split", "prime_swing"):
+            start = time.perf_counter()
+            result = factorial(n, method)
+            elapsed = time.perf_counter() - start
+            timings[(n, method)] = elapsed
+            if expected is None:
+                expected = result
+            status = "ok" if result == expected else "MISMATCH"
+            print(f"{method:<14} {elapsed:10.3f} s  {status}")
+    return timings
+
+
+def main():
+    """
+    Demonstrate the factorial methods and optionally run the benchmark.
+    """
+    print("Fast Factorial Algorithms")
+    print("=" * 30)
+    for n in (0, 1, 5, 10, 20, 25):
+        print(f"{n}! = {factorial(n)}")
+
+    n = 5_000
+    digits = digit_count(factorial(n, "prime_swing"))
+    print(f"\n{n}! has {digits} digits (all methods agree: "
+          f"{len({factorial(n, m) for m in METHODS[2:]}) == 1})")
+
+    if "--benchmark" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
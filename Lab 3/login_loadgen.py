@@ -0,0 +1,155 @@
+"""
+Load generator for the login service in Task 4.py.
+
+Opens many concurrent client connections, has each one log in repeatedly,
+and reports p50/p99 login latency. Logins are spread over freshly registered
+accounts, and --hit-ratio sets how many of them the session cache may
+answer (the default, 0, times full password verification). Start the
+service with rate limiting disabled first, since all clients share one IP
+address:
+
+    python "Task 4.py" serve --rate 0
+    python login_loadgen.py --clients 1000
+    python login_loadgen.py --clients 1000 --hit-ratio 0.9 --users 200
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+# Connections used to register (and warm up) the test accounts
+SETUP_CONNECTIONS = 64
+
+
+async def _send_all(host, port, command, credentials):
+    # Send one command per account over a single connection, in order
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for username, password in credentials:
+            writer.write(f"{command} {username} {password}\n".encode("utf-8"))
+            await writer.drain()
+            response = (await reader.readline()).strip()
+            if response != b"OK":
+                raise RuntimeError(f"{command} {username} failed: {response.decode('utf-8', 'replace')}")
+    finally:
+        writer.close()
+
+
+async def _setup(host, port, command, credentials):
+    # Spread the setup requests over a few concurrent connections
+    connections = max(1, min(SETUP_CONNECTIONS, len(credentials)))
+    await asyncio.gather(*(
+        _send_all(host, port, command, credentials[i::connections])
+        for i in range(connections)
+    ))
+
+
+async def _client(host, port, logins, latencies, failures):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for username, password in logins:
+            request = f"LOGIN {username} {password}\n".encode("utf-8")
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            response = await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            if response.strip() != b"OK":
+                failures.append(response.decode("utf-8", "replace").strip())
+    finally:
+        writer.close()
+
+
+async def run_load(host="127.0.0.1", port=8765, clients=1000, requests=5,
+                   users=100, hit_ratio=0.0, seed=None):
+    """
+    Drive concurrent logins against a running service.
+    
+    The service caches recent logins, so the mix of cached and uncached
+    logins is set explicitly. Each run registers its own accounts under a
+    random prefix, so earlier runs never leave them cached:
+    
+    - hit_ratio of the logins go to `users` warm accounts, logged in once
+      before timing starts, so they are session-cache hits
+    - the other logins each use a fresh account that has never logged in,
+      so they pay for the full password verification
+    
+    Args:
+        host (str): Service host
+        port (int): Service port
+        clients (int): Concurrent client connections
+        requests (int): Logins sent by each client
+        users (int): Distinct warm accounts the cached logins are spread over
+        hit_ratio (float): Fraction of logins expected to hit the session cache
+        seed (int): Seed for the order of logins
+        
+    Returns:
+        dict: Request count, failures, throughput, hit ratio and latency percentiles (ms)
+    """
+    if not 0 <= hit_ratio <= 1:
+        raise ValueError("hit_ratio must be between 0 and 1")
+    if hit_ratio > 0 and users < 1:
+        raise ValueError("users must be at least 1 when hit_ratio is above 0")
+    rng = random.Random(seed)
+    total = clients * requests
+    cold_count = round(total * (1 - hit_ratio))
+    hot_count = total - cold_count
+    run_id = os.urandom(4).hex()
+    cold = [(f"cold{run_id}_{i}", f"pw{run_id}_{i}") for i in range(cold_count)]
+    hot = [(f"warm{run_id}_{i}", f"pw{run_id}_{i}") for i in range(users if hot_count else 0)]
+
+    await _setup(host, port, "REGISTER", hot + cold)
+    await _setup(host, port, "LOGIN", hot)
+
+    plan = cold + [rng.choice(hot) for _ in range(hot_count)]
+    rng.shuffle(plan)
+    latencies, failures = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, plan[i * requests:(i + 1) * requests], latencies, failures)
+        for i in range(clients)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+    return {
+        "requests": len(latencies),
+        "failures": len(failures),
+        "throughput": len(latencies) / elapsed,
+        "hit_ratio": hot_count / total if total else 0.0,
+        "p50": percentile(0.50),
+        "p99": percentile(0.99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure login latency under concurrent load.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=5, help="logins per client")
+    parser.add_argument("--users", type=int, default=100, help="warm accounts for cached logins")
+    parser.add_argument("--hit-ratio", type=float, default=0.0,
+                        help="fraction of logins that hit the session cache (0 measures hashing)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        stats = asyncio.run(run_load(args.host, args.port, args.clients, args.requests,
+                                     args.users, args.hit_ratio, args.seed))
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Logins:     {stats['requests']:,} ({stats['failures']:,} failed)")
+    print(f"Cache hits: {stats['hit_ratio']:.0%} (planned)")
+    print(f"Throughput: {stats['throughput']:,.0f} logins/sec")
+    print(f"p50:        {stats['p50']:.1f} ms")
+    print(f"p99:        {stats['p99']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,11 @@
+import csv
+import json
+import sys
+from itertools import islice
+
+from student_analytics import StudentAnalytics
+
+
 def student_information():
     """
     Function that represents student information using nested dictionaries.
@@ -70,8 +78,54 @@ def create_student_dictionary():
     
     return students
 
+# Bulk alternative: build the same nested dictionary from a roster file
+def load_student_dictionary(path, batch_size=10_000):
+    """
+    Function to create the student dictionary from a CSV or JSON Lines file.
+    
+    Rows are read and converted in batches rather than one prompt at a time.
+    Files ending in .jsonl or .ndjson hold one JSON object per line; anything
+    else is read as CSV. Both use the keys "Full Name", "Branch" and "SGPA".
+    
+    Args:
+        path (str): Roster file
+        batch_size (int): Rows converted per batch
+        
+    Returns:
+        dict: {"student1": {"Full Name": ..., "Branch": ..., "SGPA": ...}, ...}
+    """
+    
+    students = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            rows = csv.DictReader(f)
+        
+        batch = list(islice(rows, batch_size))
+        while batch:
+            start = len(students) + 1
+            students.update(
+                (f"student{number}", {
+                    "Full Name": row["Full Name"],
+                    "Branch": row["Branch"],
+                    "SGPA": float(row["SGPA"])
+                })
+                for number, row in enumerate(batch, start)
+            )
+            batch = list(islice(rows, batch_size))
+    
+    return students
+
 # Run the functions
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        students = load_student_dictionary(sys.argv[1])
+        print(f"Loaded {len(students)} students from {sys.argv[1]}")
+        if "--stats" in sys.argv:
+            StudentAnalytics.from_dictionary(students).report()
+        sys.exit()
+    
     print("Method 1: Pre-defined student information")
     print("-" * 40)
     student_information()
@@ -1,3 +1,6 @@
+# One line of the report, shared by get_student_info() and get_students_info()
+STUDENT_INFO_TEMPLATE = "Full Name : {} , Branch : {} , SGPA : {}"
+
 def get_student_info(student: dict) -> str:
     """
     Extracts and returns student information from a nested dictionary.
@@ -6,11 +9,18 @@ def get_student_info(student: dict) -> str:
     full_name = student.get('full_name', 'N/A')
     branch = student.get('branch', 'N/A')
     sgpa = student.get('sgpa', 'N/A')
-    return f"Full Name : {full_name} , Branch : {branch} , SGPA : {sgpa}"
+    return STUDENT_INFO_TEMPLATE.format(full_name, branch, sgpa)
+
+def get_students_info(students) -> str:
+    """
+    Formats many students at once, one get_student_info() line each.
+    The whole report is built with a single join, so it can be printed
+    or written with one call instead of one per student.
+    """
+    return "".join([get_student_info(student) + "\n" for student in students])
 
 # Example usage:
 student1 = {'full_name': 'Siddu', 'branch': 'CSE', 'sgpa': 9.0}
 student2 = {'full_name': 'harsha', 'branch': 'CSM', 'sgpa': 9.2}
 
-print(get_student_info(student1))
-print(get_student_info(student2))
\ No newline at end of file
+print(get_students_info([student1, student2]), end="")
\ No newline at end of file
@@ -1,5 +1,40 @@
+import argparse
+import codecs
+import hashlib
+import heapq
+import math
+import os
+import random
 import re
-from collections import Counter
+import sys
+import tempfile
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Characters removed before splitting into words (compiled once, reused per chunk)
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+
+class _TokenTable(dict):
+    """
+    str.translate table that lowercases and drops punctuation in one pass.
+    
+    Each character maps to its lowercase form minus anything _PUNCTUATION_RE
+    would remove, so text.translate(table).split() gives the same words as
+    re.sub + lower() + split() without the two intermediate copies. (The only
+    difference is the context-dependent Greek final sigma, which lower()
+    handles and a per-character table cannot.) Entries are computed on first
+    use, so only characters that actually occur are stored.
+    """
+    
+    def __missing__(self, code):
+        mapped = _PUNCTUATION_RE.sub('', chr(code).lower())
+        value = self[code] = mapped if mapped else None
+        return value
+
+
+_TOKEN_TABLE = _TokenTable()
 
 def analyze_word_frequency():
     """
@@ -80,8 +115,799 @@ def get_most_frequent_word(text):
     word_count = Counter(words)
     return word_count.most_common(1)[0][0]
 
+class CountMinSketch:
+    """
+    Fixed-size frequency sketch.
+    
+    Estimates never undercount, and with probability 1 - delta they
+    overcount by at most epsilon * N, where N is the number of words added.
+    Words are hashed with BLAKE2b rather than hash(), which is salted per
+    process, so sketches built in different worker processes line up and
+    can be merged.
+    """
+    
+    def __init__(self, epsilon=1e-4, delta=1e-3):
+        """
+        Args:
+            epsilon (float): Error bound as a fraction of all words counted
+            delta (float): Probability of exceeding the error bound
+        """
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.rows = [[0] * self.width for _ in range(self.depth)]
+        self.total = 0
+    
+    def _columns(self, word):
+        h = int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little")
+        h1, h2 = h & 0xFFFFFFFF, ((h >> 32) & 0xFFFFFFFF) | 1
+        width = self.width
+        return [(h1 + i * h2) % width for i in range(self.depth)]
+    
+    def add(self, word, count=1):
+        """
+        Add occurrences of a word and return its new estimate.
+        """
+        estimate = None
+        for row, column in zip(self.rows, self._columns(word)):
+            row[column] += count
+            if estimate is None or row[column] < estimate:
+                estimate = row[column]
+        self.total += count
+        return estimate
+    
+    def estimate(self, word):
+        """
+        Return the estimated count of a word (never below the true count).
+        """
+        return min(row[column] for row, column in zip(self.rows, self._columns(word)))
+    
+    @property
+    def error_bound(self):
+        """float: Maximum overcount with probability 1 - delta."""
+        return self.epsilon * self.total
+    
+    def merge(self, other):
+        """
+        Add the counts of a sketch with the same epsilon and delta.
+        
+        The result is identical to one sketch fed both streams.
+        """
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Only sketches with the same epsilon and delta can be merged")
+        for row, other_row in zip(self.rows, other.rows):
+            row[:] = [a + b for a, b in zip(row, other_row)]
+        self.total += other.total
+        return self
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitters summary monitoring at most `capacity` words.
+    
+    When a new word arrives and the summary is full, it replaces the word
+    with the smallest count and inherits that count as its error. Any word
+    occurring more than N / capacity times is guaranteed to be monitored.
+    """
+    
+    def __init__(self, capacity=1000):
+        """
+        Args:
+            capacity (int): Number of words monitored
+        """
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        # Min-heap of (count, word); entries go stale when a count grows
+        self._heap = []
+    
+    def add(self, word, count=1):
+        """
+        Record occurrences of a word.
+        """
+        counts = self.counts
+        if word in counts:
+            counts[word] += count
+            return
+        if len(counts) < self.capacity:
+            counts[word] = count
+            self.errors[word] = 0
+            heapq.heappush(self._heap, (count, word))
+            return
+        # Evict the true minimum, refreshing stale heap entries on the way
+        heap = self._heap
+        while True:
+            low, victim = heapq.heappop(heap)
+            current = counts[victim]
+            if current == low:
+                break
+            heapq.heappush(heap, (current, victim))
+        del counts[victim]
+        del self.errors[victim]
+        counts[word] = low + count
+        self.errors[word] = low
+        heapq.heappush(heap, (low + count, word))
+    
+    def top(self, n=None):
+        """
+        Return (word, count, error) for the n largest monitored counts.
+        """
+        ranked = heapq.nlargest(n or len(self.counts), self.counts.items(), key=lambda item: item[1])
+        return [(word, count, self.errors[word]) for word, count in ranked]
+    
+    def merge(self, other):
+        """
+        Combine with a summary of another stream (Agarwal et al.).
+        
+        A word missing from a full summary may have occurred up to that
+        summary's minimum count, so it is credited with that minimum, both
+        as count and as error. The largest `capacity` words are kept, and
+        counts still never undercount.
+        """
+        def floor(summary):
+            full = len(summary.counts) >= summary.capacity
+            return min(summary.counts.values()) if full and summary.counts else 0
+        
+        floors = (floor(self), floor(other))
+        counts, errors = {}, {}
+        for word in self.counts.keys() | other.counts.keys():
+            count = error = 0
+            for summary, low in zip((self, other), floors):
+                if word in summary.counts:
+                    count += summary.counts[word]
+                    error += summary.errors[word]
+                else:
+                    count += low
+                    error += low
+            counts[word], errors[word] = count, error
+        kept = heapq.nlargest(self.capacity, counts, key=counts.get)
+        self.counts = {word: counts[word] for word in kept}
+        self.errors = {word: errors[word] for word in kept}
+        self._heap = [(count, word) for word, count in self.counts.items()]
+        heapq.heapify(self._heap)
+        return self
+
+
+class ApproximateTopK:
+    """
+    Fixed-memory top-k word finder combining Space-Saving and Count-Min.
+    
+    Space-Saving tracks which words are heavy hitters; the Count-Min sketch
+    tightens their counts, since both only ever overestimate.
+    """
+    
+    def __init__(self, k=10, capacity=None, epsilon=1e-4, delta=1e-3):
+        """
+        Args:
+            k (int): Number of words reported by default
+            capacity (int): Words monitored by Space-Saving (defaults to 50 * k)
+            epsilon (float): Count-Min error bound as a fraction of all words
+            delta (float): Count-Min failure probability
+        """
+        self.k = k
+        self.summary = SpaceSaving(capacity or 50 * k)
+        self.sketch = CountMinSketch(epsilon, delta)
+    
+    @property
+    def total(self):
+        """int: Number of words counted."""
+        return self.sketch.total
+    
+    def update(self, words):
+        """
+        Count an iterable of words.
+        """
+        sketch_add = self.sketch.add
+        summary_add = self.summary.add
+        for word in words:
+            sketch_add(word)
+            summary_add(word)
+    
+    def merge(self, other):
+        """
+        Fold in an ApproximateTopK built on another part of the input,
+        e.g. by a worker process.
+        """
+        self.sketch.merge(other.sketch)
+        self.summary.merge(other.summary)
+        return self
+    
+    def top(self, n=None):
+        """
+        Return the n most frequent words with error estimates.
+        
+        Returns:
+            list: (word, estimated count, maximum overcount) tuples
+        """
+        n = n or self.k
+        results = []
+        for word, count, error in self.summary.top(self.summary.capacity):
+            estimate = min(count, self.sketch.estimate(word))
+            results.append((word, estimate, min(error, self.sketch.error_bound)))
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results[:n]
+
+
+class WordCounter:
+    """
+    Streaming word-frequency counter with flat memory use.
+    
+    Text is consumed in fixed-size chunks and tokenized exactly like
+    get_most_frequent_word (lowercase, punctuation removed, split on
+    whitespace). A word cut off at the end of a chunk is carried over to the
+    next one, so memory is bounded by the chunk size plus the vocabulary.
+    
+    With approximate=True, words go to a fixed-memory ApproximateTopK
+    instead of an exact Counter, for inputs with too many distinct tokens
+    (IDs, hashes) to count exactly.
+    """
+    
+    def __init__(self, chunk_size=1 << 20, approximate=False, k=10, epsilon=1e-4, delta=1e-3):
+        """
+        Args:
+            chunk_size (int): Characters read per chunk
+            approximate (bool): Use fixed-memory approximate counting
+            k, epsilon, delta: ApproximateTopK settings for approximate mode
+        """
+        self.chunk_size = chunk_size
+        self.counts = Counter()
+        self.approximate = ApproximateTopK(k, epsilon=epsilon, delta=delta) if approximate else None
+        self.bytes_read = 0
+        self.elapsed = 0.0
+        # Already-translated pieces of a word running across chunks
+        self._carry = []
+    
+    def _count(self, words):
+        if self.approximate is not None:
+            self.approximate.update(words)
+        else:
+            self.counts.update(words)
+    
+    def feed(self, chunk):
+        """
+        Count the complete words in a chunk of a larger text.
+        
+        The chunk is tokenized in a single translate + split pass. Only the
+        new chunk is examined for a trailing partial word, and a word running
+        across many chunks is collected as a list of pieces, so a long run
+        without whitespace stays linear.
+        
+        Args:
+            chunk (str): Next piece of the text
+        """
+        text = chunk.translate(_TOKEN_TABLE)
+        if not text:
+            return
+        words = text.split()
+        starts_word = not text[0].isspace()
+        ends_word = not text[-1].isspace()
+        if starts_word and ends_word and len(words) == 1 and len(words[0]) == len(text):
+            # No whitespace at all: the whole chunk continues the carried word
+            self._carry.append(text)
+            return
+        # Hold back a trailing partial word until the next chunk arrives
+        partial = words.pop() if ends_word else None
+        if self._carry:
+            carried = "".join(self._carry)
+            if starts_word:
+                words[0] = carried + words[0]
+            else:
+                words.append(carried)
+        self._carry = [] if partial is None else [partial]
+        self._count(words)
+    
+    def flush(self):
+        """
+        Count the word held back from the last chunk.
+        """
+        if self._carry:
+            self._count(["".join(self._carry)])
+            self._carry = []
+    
+    def update(self, text):
+        """
+        Count every word in a complete text.
+        
+        Args:
+            text (str): Text to analyze
+        """
+        self.feed(text)
+        self.flush()
+    
+    def update_stream(self, stream):
+        """
+        Count the words of a text stream, reading it chunk by chunk.
+        
+        Args:
+            stream: Text file object
+        """
+        start = time.perf_counter()
+        read = stream.read
+        while True:
+            chunk = read(self.chunk_size)
+            if not chunk:
+                break
+            self.feed(chunk)
+        self.flush()
+        self.elapsed += time.perf_counter() - start
+    
+    def update_file(self, path, encoding="utf-8"):
+        """
+        Count the words of a file.
+        
+        Args:
+            path (str): File to read
+            encoding (str): Text encoding (undecodable bytes are replaced)
+        """
+        with open(path, "r", encoding=encoding, errors="replace") as f:
+            self.update_stream(f)
+            self.bytes_read += f.buffer.tell()
+    
+    @property
+    def total_words(self):
+        """int: Number of words counted."""
+        if self.approximate is not None:
+            return self.approximate.total
+        return sum(self.counts.values())
+    
+    def most_common(self, n=None):
+        """
+        Return the n most frequent words and their counts.
+        
+        In approximate mode the counts are estimates; use
+        most_common_with_error for their error bounds.
+        """
+        if self.approximate is not None:
+            return [(word, count) for word, count, _ in self.approximate.top(n)]
+        return self.counts.most_common(n)
+    
+    def most_common_with_error(self, n=None):
+        """
+        Return (word, count, maximum overcount) for the n most frequent words.
+        """
+        if self.approximate is not None:
+            return self.approximate.top(n)
+        return [(word, count, 0) for word, count in self.counts.most_common(n)]
+    
+    def most_frequent_word(self):
+        """
+        Return the most frequent word, or None if nothing was counted.
+        """
+        top = self.most_common(1)
+        return top[0][0] if top else None
+    
+    def mb_per_second(self):
+        """
+        Return the read throughput of update_file calls in MB/s.
+        """
+        return self.bytes_read / (1024 * 1024) / self.elapsed if self.elapsed else 0.0
+
+
+# ASCII whitespace bytes; in UTF-8 they never occur inside a multi-byte character
+_WHITESPACE_BYTES = b" \t\n\r\x0b\x0c"
+
+
+def _aligned_offset(f, offset, size):
+    """
+    Move a byte offset forward to just past the next whitespace byte.
+    """
+    if offset <= 0 or offset >= size:
+        return min(max(offset, 0), size)
+    f.seek(offset - 1)
+    while True:
+        block = f.read(64 * 1024)
+        if not block:
+            return size
+        for i, byte in enumerate(block):
+            if byte in _WHITESPACE_BYTES:
+                return min(f.tell() - len(block) + i + 1, size)
+
+
+def split_file(path, parts):
+    """
+    Split a file into byte ranges whose boundaries fall just after whitespace.
+    
+    Args:
+        path (str): File to split
+        parts (int): Desired number of ranges
+        
+    Returns:
+        list: (path, start, end) tuples covering the whole file
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        bounds = sorted({_aligned_offset(f, size * i // parts, size) for i in range(parts + 1)})
+    if bounds[0] != 0:
+        bounds.insert(0, 0)
+    return [(path, start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _count_range(counter, path, start, end, encoding="utf-8", chunk_size=1 << 20):
+    """
+    Feed the words in one byte range of a file to a WordCounter.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(chunk_size, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            counter.feed(decoder.decode(block))
+    counter.feed(decoder.decode(b"", final=True))
+    counter.flush()
+
+
+def _count_ranges(ranges, encoding="utf-8"):
+    """
+    Count a group of byte ranges into one Counter (runs in a worker process).
+    """
+    counter = WordCounter()
+    for path, start, end in ranges:
+        _count_range(counter, path, start, end, encoding)
+    return counter.counts
+
+
+def _group_ranges(ranges, groups):
+    """
+    Split byte ranges into contiguous groups of roughly equal size.
+    """
+    total = sum(end - start for _, start, end in ranges) or 1
+    grouped = [[] for _ in range(groups)]
+    done = 0
+    for path, start, end in ranges:
+        # Place each range by where its midpoint falls in the whole input
+        grouped[min(groups - 1, (done + (end - start) // 2) * groups // total)].append((path, start, end))
+        done += end - start
+    return [group for group in grouped if group]
+
+
+def count_words_parallel(paths, workers=None, encoding="utf-8", timings=None):
+    """
+    Count words across files in parallel and merge the results.
+    
+    Each file is cut into whitespace-aligned byte ranges, and every worker
+    counts one contiguous group of them into a single Counter, so each
+    worker sends back one partial result. The parent merges those as they
+    arrive, folding each into the largest one so far, and no Counter is
+    shipped back to a worker to be merged.
+    
+    Args:
+        paths (list): Files to analyze
+        workers (int): Worker processes (defaults to the CPU count)
+        encoding (str): Text encoding of the files
+        timings (dict): If given, receives the "count" and "merge" seconds
+        
+    Returns:
+        Counter: Word counts over all files
+    """
+    workers = workers or os.cpu_count()
+    timings = {} if timings is None else timings
+    start = time.perf_counter()
+    if workers <= 1:
+        counter = WordCounter()
+        for path in paths:
+            counter.update_file(path, encoding)
+        timings.update(count=time.perf_counter() - start, merge=0.0)
+        return counter.counts
+    
+    total = sum(os.path.getsize(path) for path in paths) or 1
+    ranges = []
+    for path in paths:
+        parts = max(1, round(workers * os.path.getsize(path) / total))
+        ranges.extend(split_file(path, parts))
+    
+    merged = Counter()
+    merging = 0.0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_count_ranges, group, encoding) for group in _group_ranges(ranges, workers)]
+        for future in as_completed(futures):
+            partial = future.result()
+            merge_start = time.perf_counter()
+            if len(partial) > len(merged):
+                merged, partial = partial, merged
+            merged.update(partial)
+            merging += time.perf_counter() - merge_start
+    timings.update(count=time.perf_counter() - start - merging, merge=merging)
+    return merged
+
+
+def benchmark_parallel(size_mb=200, worker_counts=(1, 2, 4, 8, 16), vocabulary_size=200_000, seed=7):
+    """
+    Time count_words_parallel on a synthetic corpus for several worker counts.
+    
+    The corpus repeats a 1 MB block drawn from a large vocabulary, so every
+    worker's partial Counter holds most of the vocabulary and the merge
+    time reported next to the total is close to its worst case.
+    
+    Args:
+        size_mb (int): Size of the generated corpus
+        worker_counts (tuple): Worker counts to time
+        vocabulary_size (int): Distinct words in the corpus
+        seed (int): Seed for the generated text
+        
+    Returns:
+        dict: Seconds per worker count
+    """
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(vocabulary_size)] + ["the", "and", "error", "request"] * 500
+    words = []
+    length = 0
+    while length < 1024 * 1024:
+        line = " ".join(rng.choices(vocabulary, k=20)) + ".\n"
+        words.append(line)
+        length += len(line)
+    block = "".join(words)
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(size_mb):
+                f.write(block)
+        
+        print(f"Corpus: {os.path.getsize(path) / (1024 * 1024):.0f} MB, {os.cpu_count()} CPUs")
+        expected = None
+        for workers in worker_counts:
+            phases = {}
+            start = time.perf_counter()
+            counts = count_words_parallel([path], workers, timings=phases)
+            timings[workers] = time.perf_counter() - start
+            expected = counts if expected is None else expected
+            status = "ok" if counts == expected else "MISMATCH"
+            print(f"{workers:>3} workers: {timings[workers]:7.2f} s "
+                  f"({timings[worker_counts[0]] / timings[workers]:.2f}x)  "
+                  f"merge {phases['merge']:.3f} s  {status}")
+    return timings
+
+
+def compare_approximate(num_words=500_000, vocabulary=200_000, skew=1.2, k=20, seed=7):
+    """
+    Check approximate top-k against an exact Counter on Zipf-skewed words.
+    
+    Args:
+        num_words (int): Words in the synthetic stream
+        vocabulary (int): Distinct words available
+        skew (float): Zipf exponent (larger is more skewed)
+        k (int): Number of top words compared
+        seed (int): Random seed
+        
+    Returns:
+        tuple: (recall of the exact top k, largest overcount, largest error bound)
+    """
+    rng = random.Random(seed)
+    weights = [1 / (rank ** skew) for rank in range(1, vocabulary + 1)]
+    words = [f"id{n:x}" for n in rng.choices(range(vocabulary), weights, k=num_words)]
+    
+    exact = Counter(words)
+    approx = ApproximateTopK(k)
+    approx.update(words)
+    
+    exact_top = {word for word, _ in exact.most_common(k)}
+    approx_top = approx.top(k)
+    recall = len(exact_top & {word for word, _, _ in approx_top}) / k
+    overcount = max(count - exact[word] for word, count, _ in approx_top)
+    bound = max(error for _, _, error in approx_top)
+    
+    print(f"Words: {num_words:,}, distinct: {len(exact):,}, monitored: {approx.summary.capacity}")
+    print(f"Top-{k} recall: {recall:.0%}")
+    print(f"Largest overcount: {overcount} (reported bound {bound:.0f})")
+    for (word, count, error), (exact_word, exact_count) in zip(approx_top[:5], exact.most_common(5)):
+        print(f"  {word:<10} ~{count} (+/-{error:.0f})   exact: {exact_word:<10} {exact_count}")
+    return recall, overcount, bound
+
+
+class WindowedWordCounter:
+    """
+    Word counts over a sliding window of the last N seconds or last M lines.
+    
+    Counts are kept per bucket (a slice of the window) plus a running total,
+    so adding a word is O(1) and expiring the oldest bucket costs one
+    decrement per word it held. The top-k heap is refreshed only for words
+    whose totals changed since the last query, and stale heap entries are
+    skipped lazily, so asking for the trending words never rescans the window.
+    """
+    
+    def __init__(self, window=300.0, buckets=60, by_lines=False, clock=time.monotonic):
+        """
+        Args:
+            window (float): Window length in seconds, or in lines if by_lines
+            buckets (int): Number of buckets the window is divided into
+            by_lines (bool): Measure the window in lines instead of seconds
+            clock (callable): Time source for time-based windows
+        """
+        if window <= 0 or buckets < 1:
+            raise ValueError("window and buckets must be positive")
+        self.window = window
+        self.num_buckets = buckets
+        self.bucket_size = window / buckets
+        self.by_lines = by_lines
+        self.clock = clock
+        self.totals = Counter()
+        self.lines = 0
+        self._buckets = deque()
+        self._heap = []
+        self._dirty = set()
+    
+    def _position(self):
+        return self.lines if self.by_lines else self.clock()
+    
+    def _expire(self, current):
+        oldest = current - self.num_buckets + 1
+        totals, dirty = self.totals, self._dirty
+        while self._buckets and self._buckets[0][0] < oldest:
+            _, counts = self._buckets.popleft()
+            for word, count in counts.items():
+                remaining = totals[word] - count
+                if remaining:
+                    totals[word] = remaining
+                else:
+                    del totals[word]
+                dirty.add(word)
+    
+    def add_line(self, line):
+        """
+        Count the words of one line at the current time (or line number).
+        
+        Args:
+            line (str): A line of text
+        """
+        bucket_id = int(self._position() // self.bucket_size)
+        self.lines += 1
+        self._expire(bucket_id)
+        if not self._buckets or self._buckets[-1][0] != bucket_id:
+            self._buckets.append((bucket_id, Counter()))
+        words = _PUNCTUATION_RE.sub('', line.lower()).split()
+        self._buckets[-1][1].update(words)
+        self.totals.update(words)
+        self._dirty.update(words)
+    
+    def top(self, k=10):
+        """
+        Return the k most frequent words currently inside the window.
+        
+        Args:
+            k (int): Number of words
+            
+        Returns:
+            list: (word, count) pairs, most frequent first
+        """
+        if not self.by_lines:
+            self._expire(int(self.clock() // self.bucket_size))
+        totals, heap = self.totals, self._heap
+        
+        # Rebuild when stale entries dominate; otherwise push only what changed
+        if len(heap) > 4 * len(totals) + 1024:
+            heap[:] = [(-count, word) for word, count in totals.items()]
+            heapq.heapify(heap)
+        else:
+            for word in self._dirty:
+                count = totals.get(word)
+                if count:
+                    heapq.heappush(heap, (-count, word))
+        self._dirty.clear()
+        
+        result, seen, popped = [], set(), []
+        while heap and len(result) < k:
+            entry = heapq.heappop(heap)
+            word = entry[1]
+            if word in seen or totals.get(word) != -entry[0]:
+                continue  # stale or duplicate entry
+            seen.add(word)
+            result.append((word, -entry[0]))
+            popped.append(entry)
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return result
+
+
+def follow(path, poll_interval=0.5, from_start=False):
+    """
+    Yield lines appended to a growing file, like `tail -f`.
+    
+    Args:
+        path (str): File to follow
+        poll_interval (float): Seconds to wait when no new data is available
+        from_start (bool): Read the existing contents first instead of skipping them
+        
+    Yields:
+        str: Complete lines as they are written
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        if not from_start:
+            f.seek(0, os.SEEK_END)
+        partial = ""
+        while True:
+            line = f.readline()
+            if not line:
+                time.sleep(poll_interval)
+                continue
+            partial += line
+            if partial.endswith("\n"):
+                yield partial
+                partial = ""
+
+
+def trending(argv=None):
+    """
+    Print the trending words of a live text stream.
+    
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(prog="trending", description="Trending words over a sliding window.")
+    parser.add_argument("--follow", metavar="PATH", help="follow a growing file instead of reading stdin")
+    window = parser.add_mutually_exclusive_group()
+    window.add_argument("--minutes", type=float, default=5.0, help="window length in minutes")
+    window.add_argument("--lines", type=int, help="window length in lines")
+    parser.add_argument("--top", type=int, default=10, help="number of words shown")
+    parser.add_argument("--every", type=int, default=1000, help="report after this many lines")
+    args = parser.parse_args(argv)
+    
+    if args.lines:
+        counter = WindowedWordCounter(args.lines, buckets=min(args.lines, 100), by_lines=True)
+    else:
+        counter = WindowedWordCounter(args.minutes * 60, buckets=60)
+    source = follow(args.follow) if args.follow else sys.stdin
+    
+    try:
+        for line in source:
+            counter.add_line(line)
+            if counter.lines % args.every == 0:
+                ranked = ", ".join(f"{word} ({count})" for word, count in counter.top(args.top))
+                print(f"[{counter.lines} lines] {ranked}", flush=True)
+    except KeyboardInterrupt:
+        pass
+    ranked = ", ".join(f"{word} ({count})" for word, count in counter.top(args.top))
+    print(f"[{counter.lines} lines] {ranked}")
+
+
+def count_files(paths, top=10, workers=1):
+    """
+    Count the words of one or more files and print a report.
+    
+    Args:
+        paths (list): Files to analyze
+        top (int): Number of most frequent words to list
+        workers (int): Worker processes (1 streams the files in this process)
+        
+    Returns:
+        Counter: Word counts over all files
+    """
+    start = time.perf_counter()
+    counts = count_words_parallel(paths, workers)
+    elapsed = time.perf_counter() - start
+    size_mb = sum(os.path.getsize(path) for path in paths) / (1024 * 1024)
+    
+    print("Word Frequency Report")
+    print("=" * 30)
+    print(f"Files: {len(paths)}, Total words: {sum(counts.values())}, Unique words: {len(counts)}")
+    for word, count in counts.most_common(top):
+        print(f"'{word}': {count} times")
+    print(f"Throughput: {size_mb / elapsed if elapsed else 0.0:.1f} MB/s")
+    return counts
+
 # Run the function
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_parallel()
+        sys.exit()
+    if sys.argv[1:2] == ["--trending"]:
+        trending(sys.argv[2:])
+        sys.exit()
+    if "--approx-check" in sys.argv:
+        compare_approximate()
+        sys.exit()
+    if len(sys.argv) > 1:
+        args = sys.argv[1:]
+        workers = 1
+        if args[0] == "--workers":
+            workers, args = int(args[1]), args[2:]
+        count_files(args, workers=workers)
+        sys.exit()
+    
     print("Word Frequency Analyzer")
     print("=" * 25)
     analyze_word_frequency()
@@ -0,0 +1,379 @@
+"""
+Student SGPA Analytics
+
+- SGPA kept in a growable float array, branch as integer category codes
+- Per-branch count, mean, median and percentiles computed for all branches
+  at once with bincount and one sort, instead of dict-of-lists loops
+- Top-N students overall or within a branch via argpartition
+- SGPA histograms, overall or per branch
+- Incremental add() and bulk extend(), fed from the nested dictionaries of
+  Task 3 C
+- Benchmark against the equivalent dictionary loops
+"""
+
+import random
+import statistics
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Initial capacity of the SGPA and branch arrays; they double when full
+INITIAL_CAPACITY = 1024
+
+# SGPA scale used for default histogram ranges
+SGPA_RANGE = (0.0, 10.0)
+
+
+class StudentAnalytics:
+    """
+    Columnar store of (Full Name, Branch, SGPA) with vectorized aggregates.
+
+    Branches are interned into small integer codes the first time they are
+    seen, so every group-by is a bincount or a sort over two flat arrays.
+    Running per-branch counts and sums are updated on every add, so counts
+    and means never rescan the data. The sort used for medians and
+    percentiles is cached; add() inserts into it, and only extend() makes
+    the next query sort again.
+    """
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        if np is None:
+            raise ImportError("StudentAnalytics requires NumPy")
+        self.names = []
+        self.branches = []
+        self._branch_codes = {}
+        self._sgpa = np.empty(capacity, dtype=np.float64)
+        self._codes = np.empty(capacity, dtype=np.int32)
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._sums = np.zeros(0, dtype=np.float64)
+        self._sorted = None
+
+    @classmethod
+    def from_dictionary(cls, students):
+        """
+        Build analytics from a {"student1": {"Full Name", "Branch", "SGPA"}} dictionary.
+        """
+        analytics = cls(max(len(students), INITIAL_CAPACITY))
+        analytics.extend((data["Full Name"], data["Branch"], data["SGPA"])
+                         for data in students.values())
+        return analytics
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def sgpa(self):
+        return self._sgpa[:len(self.names)]
+
+    @property
+    def codes(self):
+        return self._codes[:len(self.names)]
+
+    def _branch_code(self, branch):
+        code = self._branch_codes.get(branch)
+        if code is None:
+            code = self._branch_codes[branch] = len(self.branches)
+            self.branches.append(branch)
+            self._counts = np.append(self._counts, 0)
+            self._sums = np.append(self._sums, 0.0)
+        return code
+
+    def _reserve(self, extra):
+        needed = len(self.names) + extra
+        if needed > len(self._sgpa):
+            capacity = max(needed, 2 * len(self._sgpa))
+            size = len(self.names)
+            for attr in ("_sgpa", "_codes"):
+                old = getattr(self, attr)
+                grown = np.empty(capacity, dtype=old.dtype)
+                grown[:size] = old[:size]
+                setattr(self, attr, grown)
+
+    def add(self, full_name, branch, sgpa):
+        """
+        Add one student, updating the running branch totals.
+
+        Args:
+            full_name (str): Student name
+            branch (str): Branch, e.g. "CSE"
+            sgpa (float): SGPA
+        """
+        sgpa = float(sgpa)
+        code = self._branch_code(branch)
+        self._reserve(1)
+        index = len(self.names)
+        self._sgpa[index] = sgpa
+        self._codes[index] = code
+        self.names.append(full_name)
+        if self._sorted is not None:
+            self._insert_sorted(code, sgpa)
+        self._counts[code] += 1
+        self._sums[code] += sgpa
+
+    def extend(self, students):
+        """
+        Add many (full_name, branch, sgpa) rows at once.
+
+        The SGPA and branch columns are filled with one array assignment and
+        the branch totals updated with one bincount, rather than per row.
+        """
+        rows = list(students)
+        if not rows:
+            return
+        values = np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+        branches = [row[1] for row in rows]
+        # Intern new branches in order of first appearance, then look up in bulk
+        for branch in dict.fromkeys(branches):
+            self._branch_code(branch)
+        codes = np.fromiter(map(self._branch_codes.__getitem__, branches),
+                            dtype=np.int32, count=len(rows))
+        names = [row[0] for row in rows]
+        self._reserve(len(rows))
+        start = len(self.names)
+        self._sgpa[start:start + len(rows)] = values
+        self._codes[start:start + len(rows)] = codes
+        self.names.extend(names)
+        self._counts += np.bincount(codes, minlength=len(self.branches))
+        self._sums += np.bincount(codes, weights=values, minlength=len(self.branches))
+        self._sorted = None
+
+    def _sorted_by_branch(self):
+        # SGPA sorted within each branch, and where each branch starts
+        if self._sorted is None:
+            sgpa, codes = self.sgpa, self.codes
+            order = np.lexsort((sgpa, codes))
+            starts = np.concatenate(([0], np.cumsum(self._counts)[:-1]))
+            self._sorted = (sgpa[order], starts)
+        return self._sorted
+
+    def _insert_sorted(self, code, sgpa):
+        # Keep the cached order valid: one insertion instead of a full re-sort
+        values, starts = self._sorted
+        if code == len(starts):
+            starts = np.append(starts, len(values))
+        begin = starts[code]
+        position = begin + np.searchsorted(values[begin:begin + self._counts[code]], sgpa)
+        starts[code + 1:] += 1
+        self._sorted = (np.insert(values, position, sgpa), starts)
+
+    def branch_counts(self):
+        """
+        Return {branch: number of students}.
+        """
+        return dict(zip(self.branches, self._counts.tolist()))
+
+    def branch_means(self):
+        """
+        Return {branch: mean SGPA}, from the running totals.
+        """
+        return dict(zip(self.branches, (self._sums / self._counts).tolist()))
+
+    def branch_percentiles(self, q):
+        """
+        Return {branch: q-th percentile of SGPA} for every branch.
+
+        Uses linear interpolation, as numpy.percentile does by default. All
+        branches are answered from one sort of the data, with no per-branch
+        loop.
+
+        Args:
+            q (float): Percentile between 0 and 100
+
+        Returns:
+            dict: Percentile per branch
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        values, starts = self._sorted_by_branch()
+        position = starts + (self._counts - 1) * (q / 100)
+        low = np.floor(position).astype(np.int64)
+        high = np.ceil(position).astype(np.int64)
+        result = values[low] + (values[high] - values[low]) * (position - low)
+        return dict(zip(self.branches, result.tolist()))
+
+    def branch_medians(self):
+        """
+        Return {branch: median SGPA}.
+        """
+        return self.branch_percentiles(50)
+
+    def top_n(self, n, branch=None):
+        """
+        Return the n students with the highest SGPA, best first.
+
+        argpartition selects the n best in linear time, so only those n are
+        sorted.
+
+        Args:
+            n (int): Number of students
+            branch (str): Only consider this branch; None for everyone
+
+        Returns:
+            list: (full_name, branch, sgpa) tuples
+        """
+        if branch is None:
+            candidates = np.arange(len(self))
+        elif branch in self._branch_codes:
+            candidates = np.flatnonzero(self.codes == self._branch_codes[branch])
+        else:
+            return []
+        n = min(n, len(candidates))
+        if n <= 0:
+            return []
+        values = self.sgpa[candidates]
+        if n < len(candidates):
+            best = np.argpartition(-values, n - 1)[:n]
+        else:
+            best = np.arange(len(candidates))
+        best = best[np.argsort(-values[best], kind="stable")]
+        return [(self.names[i], self.branches[self._codes[i]], float(self._sgpa[i]))
+                for i in candidates[best].tolist()]
+
+    def histogram(self, bins=10, value_range=SGPA_RANGE, branch=None):
+        """
+        Return (counts, edges) of SGPA, overall or for one branch.
+        """
+        values = self.sgpa
+        if branch is not None:
+            values = values[self.codes == self._branch_codes.get(branch, -1)]
+        return np.histogram(values, bins=bins, range=value_range)
+
+    def branch_histograms(self, bins=10, value_range=SGPA_RANGE):
+        """
+        Return {branch: bin counts} for every branch with one bincount.
+
+        Bins are equal-width over value_range; values outside it are ignored,
+        like numpy.histogram. The edges are the same as histogram()'s.
+        """
+        low, high = value_range
+        sgpa, codes = self.sgpa, self.codes
+        inside = (sgpa >= low) & (sgpa <= high)
+        index = ((sgpa[inside] - low) * (bins / (high - low))).astype(np.int64)
+        # The top edge belongs to the last bin
+        np.minimum(index, bins - 1, out=index)
+        counts = np.bincount(codes[inside].astype(np.int64) * bins + index,
+                             minlength=len(self.branches) * bins)
+        return dict(zip(self.branches, counts.reshape(-1, bins)))
+
+    def branch_summary(self):
+        """
+        Return {branch: {"count", "mean", "median", "p25", "p75"}}.
+        """
+        columns = {
+            "count": self.branch_counts(),
+            "mean": self.branch_means(),
+            "median": self.branch_medians(),
+            "p25": self.branch_percentiles(25),
+            "p75": self.branch_percentiles(75),
+        }
+        return {branch: {name: column[branch] for name, column in columns.items()}
+                for branch in self.branches}
+
+    def report(self, top=3):
+        """
+        Print the per-branch summary and the top students.
+        """
+        print("SGPA by Branch:")
+        print("=" * 30)
+        for branch, row in self.branch_summary().items():
+            print(f"{branch}: {row['count']} students, mean {row['mean']:.2f}, "
+                  f"median {row['median']:.2f}, IQR {row['p25']:.2f}-{row['p75']:.2f}")
+        print(f"Top {top}:")
+        for full_name, branch, sgpa in self.top_n(top):
+            print(f"Full Name : {full_name} , Branch : {branch} , SGPA : {sgpa}")
+
+
+def _dictionary_stats(students, n):
+    # The same aggregates with plain dictionary loops, for the benchmark
+    groups = {}
+    for data in students.values():
+        groups.setdefault(data["Branch"], []).append(data["SGPA"])
+    stats = {branch: (len(values), sum(values) / len(values), statistics.median(values),
+                      statistics.quantiles(values, n=4, method="inclusive"))
+             for branch, values in groups.items()}
+    top = sorted(students.values(), key=lambda data: data["SGPA"], reverse=True)[:n]
+    return stats, top
+
+
+def _sample_dictionary(count, seed=0):
+    rng = random.Random(seed)
+    branches = ["CSE", "CSM", "ECE", "EEE", "MECH", "CIVIL", "IT", "AIDS"]
+    return {
+        f"student{number}": {
+            "Full Name": f"Student {number}",
+            "Branch": rng.choice(branches),
+            "SGPA": round(rng.uniform(5.0, 10.0), 2)
+        }
+        for number in range(1, count + 1)
+    }
+
+
+def benchmark(count=500_000, n=10):
+    """
+    Time branch aggregates and top-n: dictionary loops against StudentAnalytics.
+
+    Args:
+        count (int): Number of students
+        n (int): Size of the top-n list
+
+    Returns:
+        dict: Seconds per approach
+    """
+    students = _sample_dictionary(count)
+    timings = {}
+
+    start = time.perf_counter()
+    stats, top = _dictionary_stats(students, n)
+    timings["dictionary loops"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    analytics = StudentAnalytics.from_dictionary(students)
+    timings["build analytics"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    summary = analytics.branch_summary()
+    best = analytics.top_n(n)
+    timings["analytics queries"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    analytics.add("Late Student", "CSE", 7.5)
+    analytics.branch_summary()
+    timings["add + requery"] = time.perf_counter() - start
+
+    match = all(
+        summary[branch]["count"] == count_
+        and abs(summary[branch]["mean"] - mean) < 1e-9
+        and abs(summary[branch]["median"] - median) < 1e-9
+        and abs(summary[branch]["p25"] - quartiles[0]) < 1e-9
+        and abs(summary[branch]["p75"] - quartiles[2]) < 1e-9
+        for branch, (count_, mean, median, quartiles) in stats.items()
+    ) and [sgpa for _, _, sgpa in best] == [data["SGPA"] for data in top]
+
+    print(f"{count:,} students")
+    for name, seconds in timings.items():
+        print(f"  {name:<18} {seconds * 1000:9.1f} ms")
+    print("Results match" if match else "Results DIFFER")
+    return timings
+
+
+def main():
+    """
+    Show analytics for a small example and optionally run the benchmark.
+    """
+    analytics = StudentAnalytics()
+    analytics.add("Siddu", "CSE", 9.0)
+    analytics.add("harsha", "CSM", 9.2)
+    analytics.extend([("Anil", "CSE", 8.1), ("Divya", "CSM", 8.7), ("Ravi", "ECE", 7.9)])
+    analytics.report()
+
+    if "--benchmark" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,236 @@
-with open("example.txt","w") as f:
-    f.write("Hello,world!")
-f1 = open("data1.txt","w")
-f2 = open("data2.txt","w")
-f1.write("First file content\n")
-f2.write("Second file content\n")
-print("Files written successfully")
-data = open("input.txt","r").readlines()
-output = open("output.txt","w")
-for line in data:
-    output.write(line.upper())
-print("Processing done")
-f = open("numbers.txt", "r")
-nums = f.readlines()
-
-squares = []
-for n in nums:
-    n = n.strip()
-    if n.isdigit():
-        squares.append(int(n) * int(n))
-
-f2 = open("squares.txt", "w")
-for sq in squares:
-    f2.write(str(sq) + "\n")
-
-print("Squares written")
+import codecs
+import io
+import queue
+import threading
+
+# Bytes read (and written) per block
+BUFFER_SIZE = 1 << 20
+
+# Blocks the reader may run ahead of the slowest stage
+QUEUE_DEPTH = 4
+
+
+class _Failure:
+    # Carries an exception from the reader thread to the consumer
+    def __init__(self, exc):
+        self.exc = exc
+
+
+_DONE = object()
+
+
+def read_blocks(path, block_size=BUFFER_SIZE, encoding="utf-8"):
+    """
+    Yield the text of a file in blocks of about block_size bytes.
+
+    The file is read in binary and decoded incrementally, so a multi-byte
+    character or a CRLF split across two reads is never broken. Line endings
+    are translated to newlines, as when reading in text mode.
+
+    Args:
+        path (str): File to read
+        block_size (int): Bytes per read
+        encoding (str): Text encoding of the file
+
+    Yields:
+        str: Consecutive blocks of text
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(), translate=True)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            data = f.read(block_size)
+            if not data:
+                break
+            text = decoder.decode(data)
+            if text:
+                yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def prefetch(items, depth=QUEUE_DEPTH):
+    """
+    Pull items from a background thread, at most `depth` ahead of the consumer.
+
+    The bounded queue is the back-pressure: when the downstream stages fall
+    behind, the producer blocks instead of reading the whole file into
+    memory, and when they catch up, reading overlaps with processing.
+
+    Args:
+        items (iterable): Source to read ahead, e.g. read_blocks(...)
+        depth (int): Maximum number of items buffered
+
+    Yields:
+        The items of `items`, in order
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(_DONE)
+        except BaseException as exc:
+            put(_Failure(exc))
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def write_blocks(path, blocks, encoding="utf-8"):
+    """
+    Write text blocks to a file.
+
+    Args:
+        path (str): File to write
+        blocks (iterable): Blocks of text
+        encoding (str): Text encoding of the file
+
+    Returns:
+        int: Number of bytes written
+    """
+    written = 0
+    with open(path, "wb", buffering=BUFFER_SIZE) as f:
+        for block in blocks:
+            if block:
+                written += f.write(block.encode(encoding))
+    return written
+
+
+def map_stage(func):
+    """
+    Return a stage that applies func to every item (e.g. str.upper to blocks).
+    """
+    def stage(items):
+        for item in items:
+            yield func(item)
+    return stage
+
+
+def split_lines(blocks):
+    """
+    Regroup text blocks into lists of complete lines, without their newlines.
+
+    A line running across several blocks is joined back together, so later
+    stages can work line by line while still receiving a whole block's worth
+    of lines at a time.
+    """
+    pending = []
+    for block in blocks:
+        lines = block.split("\n")
+        if len(lines) == 1:
+            pending.append(block)
+            continue
+        lines[0] = "".join(pending) + lines[0]
+        pending = [lines.pop()]
+        yield lines
+    tail = "".join(pending)
+    if tail:
+        yield [tail]
+
+
+def map_lines(func):
+    """
+    Return a stage that applies func to every line of every batch.
+    """
+    def stage(batches):
+        for lines in batches:
+            yield [func(line) for line in lines]
+    return stage
+
+
+def filter_lines(predicate):
+    """
+    Return a stage that keeps only the lines for which predicate is true.
+    """
+    def stage(batches):
+        for lines in batches:
+            yield [line for line in lines if predicate(line)]
+    return stage
+
+
+def join_lines(batches):
+    """
+    Turn batches of lines back into text blocks, one line per newline.
+    """
+    for lines in batches:
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+
+def run_pipeline(source, destination, *stages, depth=QUEUE_DEPTH):
+    """
+    Stream a file through a chain of stages: read -> stages... -> write.
+
+    Each stage takes an iterable and returns an iterable. Only `depth`
+    blocks are ever in flight, so files larger than RAM are fine.
+
+    Args:
+        source (str): Input file
+        destination (str): Output file
+        *stages (callable): Stages applied in order to the stream of text blocks
+        depth (int): Blocks the reader may run ahead
+
+    Returns:
+        int: Number of bytes written
+    """
+    items = prefetch(read_blocks(source), depth)
+    for stage in stages:
+        items = stage(items)
+    return write_blocks(destination, items)
+
+
+def square(line):
+    n = int(line)
+    return str(n * n)
+
+
+# Upper-case whole blocks at once rather than line by line
+UPPERCASE = (map_stage(str.upper),)
+
+# Square every line that is a non-negative integer, skipping the rest
+SQUARES = (split_lines, map_lines(str.strip), filter_lines(str.isdigit),
+           map_lines(square), join_lines)
+
+
+if __name__ == "__main__":
+    with open("example.txt", "w") as f:
+        f.write("Hello,world!")
+    with open("data1.txt", "w") as f1, open("data2.txt", "w") as f2:
+        f1.write("First file content\n")
+        f2.write("Second file content\n")
+    print("Files written successfully")
+
+    run_pipeline("input.txt", "output.txt", *UPPERCASE)
+    print("Processing done")
+
+    run_pipeline("numbers.txt", "squares.txt", *SQUARES)
+    print("Squares written")
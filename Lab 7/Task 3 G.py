@@ -1,33 +1,168 @@
-with open("example.txt", "w") as f:
-    f.write("Hello,world!")
+import io
+import os
+import random
+import sys
+import tempfile
+import time
 
-with open("data1.txt", "w") as f1:
-    f1.write("First file content\n")
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-with open("data2.txt", "w") as f2:
-    f2.write("Second file content\n")
+# Bytes of numbers.txt parsed per chunk by the fast path
+CHUNK_SIZE = 16 << 20
 
-print("Files written successfully")
+# Largest value whose square still fits in int64 (isqrt(2**63 - 1))
+INT64_SQUARE_LIMIT = 3037000499
 
-try:
-    with open("input.txt", "r") as infile, open("output.txt", "w") as outfile:
-        for line in infile:
-            outfile.write(line.upper())
-    print("Processing done")
-except FileNotFoundError:
-    print("input.txt not found.")
+# Chunks made only of these bytes can be parsed in bulk by numpy;
+# anything else (signs, spaces inside a line, ...) takes the exact path
+_BULK_BYTES = b"0123456789\r\n"
 
-try:
-    with open("numbers.txt", "r") as numfile:
+
+def _square_lines(text):
+    # The original per-line rule: keep stripped lines that are all digits
+    squares = []
+    for n in io.StringIO(text, newline=None):
+        n = n.strip()
+        if n.isdigit():
+            squares.append(int(n) * int(n))
+    return squares
+
+
+def _square_chunk(data):
+    """
+    Square the numbers in a chunk of complete lines.
+
+    Returns the formatted output and the number of values squared. Plain
+    digit lines whose squares fit in int64 are parsed and squared as numpy
+    arrays; otherwise the chunk falls back to exact Python ints.
+    """
+    if not data.strip():
+        return b"", 0
+    squares = None
+    if np is not None and not data.translate(None, _BULK_BYTES):
+        values = np.fromstring(data, dtype=np.int64, sep=" ")
+        # Values too large to square in int64 (or to parse at all) saturate
+        if values.max() <= INT64_SQUARE_LIMIT:
+            squares = (values * values).tolist()
+    if squares is None:
+        squares = _square_lines(data.decode())
+    # One formatting call for the whole chunk instead of str() per value
+    return (("%d\n" * len(squares)) % tuple(squares)).encode(), len(squares)
+
+
+def square_numbers(source, destination, chunk_size=CHUNK_SIZE):
+    """
+    Write the square of every integer line in source to destination.
+
+    The file is processed in chunks cut at line boundaries, so memory stays
+    bounded however many numbers it holds. Lines that are not plain
+    non-negative integers are skipped, as before.
+
+    Args:
+        source (str): File with one integer per line
+        destination (str): File to write the squares to
+        chunk_size (int): Bytes read per chunk
+
+    Returns:
+        int: Number of squares written
+    """
+    count = 0
+    with open(source, "rb") as infile, open(destination, "wb") as outfile:
+        tail = b""
+        while True:
+            block = infile.read(chunk_size)
+            if not block:
+                break
+            block = tail + block
+            cut = block.rfind(b"\n") + 1
+            tail = block[cut:]
+            if cut:
+                output, written = _square_chunk(block[:cut])
+                outfile.write(output)
+                count += written
+        if tail:
+            output, written = _square_chunk(tail)
+            outfile.write(output)
+            count += written
+    return count
+
+
+def square_numbers_loop(source, destination):
+    """
+    The original line-by-line squares job, kept for benchmarking.
+    """
+    with open(source, "r") as numfile:
         nums = numfile.readlines()
     squares = []
     for n in nums:
         n = n.strip()
         if n.isdigit():
             squares.append(int(n) * int(n))
-    with open("squares.txt", "w") as sqfile:
+    with open(destination, "w") as sqfile:
         for sq in squares:
             sqfile.write(str(sq) + "\n")
-    print("Squares written")
-except FileNotFoundError:
-    print("numbers.txt not found.")
\ No newline at end of file
+    return len(squares)
+
+
+def benchmark(count=10_000_000):
+    """
+    Time square_numbers against the line-by-line loop on random integers.
+
+    Args:
+        count (int): Number of integers in the generated file
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "numbers.txt")
+        with open(source, "w") as f:
+            for start in range(0, count, 1_000_000):
+                block = [random.randrange(INT64_SQUARE_LIMIT)
+                         for _ in range(min(1_000_000, count - start))]
+                f.write("\n".join(map(str, block)) + "\n")
+        size_mb = os.path.getsize(source) / 1e6
+        print(f"{count:,} integers ({size_mb:.0f} MB)")
+
+        results = {}
+        for name, run in (("line loop", square_numbers_loop), ("square_numbers", square_numbers)):
+            destination = os.path.join(tmp, name.replace(" ", "_") + ".txt")
+            start = time.perf_counter()
+            run(source, destination)
+            elapsed = time.perf_counter() - start
+            with open(destination, "rb") as f:
+                results[name] = hash(f.read())
+            print(f"{name:<16} {elapsed:7.2f} s  {size_mb / elapsed:6.1f} MB/s  "
+                  f"{count / elapsed / 1e6:5.2f} M numbers/s")
+        print("Outputs match" if len(set(results.values())) == 1 else "Outputs DIFFER")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+        sys.exit()
+
+    with open("example.txt", "w") as f:
+        f.write("Hello,world!")
+
+    with open("data1.txt", "w") as f1:
+        f1.write("First file content\n")
+
+    with open("data2.txt", "w") as f2:
+        f2.write("Second file content\n")
+
+    print("Files written successfully")
+
+    try:
+        with open("input.txt", "r") as infile, open("output.txt", "w") as outfile:
+            for line in infile:
+                outfile.write(line.upper())
+        print("Processing done")
+    except FileNotFoundError:
+        print("input.txt not found.")
+
+    try:
+        square_numbers("numbers.txt", "squares.txt")
+        print("Squares written")
+    except FileNotFoundError:
+        print("numbers.txt not found.")
@@ -1,12 +1,4 @@
-def compute_ratios(values):
-    results = []
-    for i in range(len(values)):
-        for j in range(i, len(values)):
-            if values[j] - values[i] == 0:
-                continue  # Skip division by zero
-            ratio = values[i] / (values[j] - values[i])
-            results.append((i, j, ratio))
-    return results
+from ratios import compute_ratios
 
 nums = [5, 10, 15, 20, 25]
-print(compute_ratios(nums))
\ No newline at end of file
+print(compute_ratios(nums))
@@ -0,0 +1,412 @@
+"""
+Pairwise Ratios
+
+- values[i] / (values[j] - values[i]) for every pair i < j, skipping
+  zero denominators, as computed by compute_ratios in Task 4
+- Upper-triangle row blocks computed with NumPy and streamed as arrays,
+  so memory is bounded by the block size rather than n**2
+- Streaming to a memory-mapped .npy file
+- Top-k largest ratios without materializing all pairs
+- Multi-process tiles over shared memory, streamed in a fixed order
+- Benchmarks against the original double loop and across worker counts
+"""
+
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Pairs computed per block (a few tens of MB of temporaries)
+BLOCK_PAIRS = 1 << 22
+
+# Pairs per tile handed to a worker by compute_ratios_parallel
+TILE_PAIRS = 1 << 19
+
+if np is not None:
+    # Record layout of write_ratios() output
+    RATIO_DTYPE = np.dtype([("i", np.int32), ("j", np.int32), ("ratio", np.float64)])
+
+
+def _require_numpy(name):
+    if np is None:
+        raise ImportError(f"{name} requires NumPy")
+
+
+def compute_ratios(values):
+    """
+    Return (i, j, values[i] / (values[j] - values[i])) for all pairs i < j.
+
+    Pairs with a zero denominator are skipped. This builds a Python list of
+    n**2 / 2 tuples, and creating those tuples costs more than the arithmetic,
+    so a plain loop is as fast as anything here. For large inputs use
+    ratio_blocks, write_ratios or top_k_ratios instead.
+
+    Args:
+        values (sequence): Numbers to compare
+
+    Returns:
+        list: (i, j, ratio) tuples ordered by i, then j
+    """
+    results = []
+    for i in range(len(values)):
+        for j in range(i + 1, len(values)):
+            denom = values[j] - values[i]
+            if denom == 0:
+                continue
+            ratio = values[i] / denom
+            results.append((i, j, ratio))
+    return results
+
+
+def _row_blocks(n, block_pairs):
+    """
+    Yield (start, stop) row ranges of the upper triangle with about
+    block_pairs pairs each (at least one row).
+    """
+    start = 0
+    while start < n - 1:
+        width = n - start - 1
+        stop = min(n - 1, start + max(1, block_pairs // width))
+        yield start, stop
+        start = stop
+
+
+def _block_ratios(a, start, stop):
+    """
+    Return the (i, j, ratio) arrays for rows start..stop-1 and all j > i.
+    """
+    width = len(a) - start - 1
+    rows = a[start:stop, None]
+    # Column c of row r is j = start + 1 + c, so j > i exactly when c >= r
+    mask = np.arange(width)[None, :] >= np.arange(stop - start)[:, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        denom = a[None, start + 1:] - rows
+        mask &= denom != 0
+        # Dividing the whole rectangle and then selecting is much
+        # cheaper than gathering the selected pairs before dividing
+        ratio = (rows / denom)[mask]
+    flat = np.flatnonzero(mask)
+    i = np.repeat(np.arange(start, stop), np.count_nonzero(mask, axis=1))
+    return i, flat - (i - start) * width + start + 1, ratio
+
+
+def ratio_blocks(values, block_pairs=BLOCK_PAIRS):
+    """
+    Yield the ratios of all pairs i < j in row blocks.
+
+    Each block covers a run of rows i and every column j > i, computed
+    as one broadcast subtraction and division. Pairs whose denominator is
+    zero are masked out. Pairs come out in the same (i, j) order as
+    compute_ratios.
+
+    Args:
+        values (sequence): Numbers to compare
+        block_pairs (int): Approximate number of pairs per block
+
+    Yields:
+        tuple: (i, j, ratio) NumPy arrays of equal length
+    """
+    _require_numpy("ratio_blocks")
+    a = np.asarray(values, dtype=np.float64)
+    for start, stop in _row_blocks(len(a), block_pairs):
+        yield _block_ratios(a, start, stop)
+
+
+# Shared-memory views attached once per worker process by _attach_shared()
+_SHARED = {}
+
+
+def _slot_arrays(buf, num_slots, capacity):
+    # Three (num_slots, capacity) arrays laid out back to back in one buffer
+    size = num_slots * capacity * 8
+    return (np.ndarray((num_slots, capacity), np.int64, buffer=buf),
+            np.ndarray((num_slots, capacity), np.int64, buffer=buf, offset=size),
+            np.ndarray((num_slots, capacity), np.float64, buffer=buf, offset=2 * size))
+
+
+def _attach_shared(values_name, n, slots_name, num_slots, capacity):
+    values_shm = shared_memory.SharedMemory(name=values_name)
+    slots_shm = shared_memory.SharedMemory(name=slots_name)
+    # Keep the SharedMemory objects alive as long as the views
+    _SHARED["memory"] = (values_shm, slots_shm)
+    _SHARED["values"] = np.ndarray((n,), np.float64, buffer=values_shm.buf)
+    _SHARED["slots"] = _slot_arrays(slots_shm.buf, num_slots, capacity)
+
+
+def _shared_tile(start, stop, slot):
+    # Compute one tile in a worker and leave the result in its slot
+    i, j, ratio = _block_ratios(_SHARED["values"], start, stop)
+    out_i, out_j, out_ratio = _SHARED["slots"]
+    count = len(ratio)
+    out_i[slot, :count] = i
+    out_j[slot, :count] = j
+    out_ratio[slot, :count] = ratio
+    return count
+
+
+def compute_ratios_parallel(values, workers=None, tile_pairs=TILE_PAIRS):
+    """
+    Yield the same blocks as ratio_blocks, computed by a pool of processes.
+
+    The upper triangle is cut into row tiles of about tile_pairs pairs
+    each, so every tile costs the same. Workers read `values` from one
+    shared-memory copy. Each worker writes its tile into one of a ring of
+    shared result slots, so only a count crosses the process boundary.
+    Tiles are yielded strictly in row order, whatever order they finish
+    in. The tiles do not depend on the worker count, so neither does
+    the output. A slot is reused only after its tile has been copied out,
+    which caps how far the workers can run ahead of the consumer.
+
+    Args:
+        values (sequence): Numbers to compare
+        workers (int): Worker processes (defaults to the number of CPUs)
+        tile_pairs (int): Approximate number of pairs per tile
+
+    Yields:
+        tuple: (i, j, ratio) NumPy arrays of equal length
+    """
+    _require_numpy("compute_ratios_parallel")
+    a = np.asarray(values, dtype=np.float64)
+    n = len(a)
+    if n < 2:
+        return
+    workers = workers or os.cpu_count() or 1
+    # A tile holds at most tile_pairs pairs, or one full row when rows are longer
+    capacity = max(tile_pairs, n - 1)
+    num_slots = 2 * workers
+
+    values_shm = shared_memory.SharedMemory(create=True, size=a.nbytes)
+    slots_shm = shared_memory.SharedMemory(create=True, size=3 * num_slots * capacity * 8)
+    slots = None
+    try:
+        np.ndarray((n,), np.float64, buffer=values_shm.buf)[:] = a
+        slots = _slot_arrays(slots_shm.buf, num_slots, capacity)
+        initargs = (values_shm.name, n, slots_shm.name, num_slots, capacity)
+        with ProcessPoolExecutor(workers, initializer=_attach_shared, initargs=initargs) as pool:
+            tiles = _row_blocks(n, tile_pairs)
+            free = deque(range(num_slots))
+            pending = deque()
+            try:
+                while True:
+                    while free:
+                        tile = next(tiles, None)
+                        if tile is None:
+                            break
+                        slot = free.popleft()
+                        pending.append((slot, pool.submit(_shared_tile, *tile, slot)))
+                    if not pending:
+                        break
+                    slot, future = pending.popleft()
+                    count = future.result()
+                    block = tuple(array[slot, :count].copy() for array in slots)
+                    free.append(slot)
+                    yield block
+            finally:
+                for _, future in pending:
+                    future.cancel()
+    finally:
+        # The views must go before the segments can be closed
+        slots = None
+        values_shm.close()
+        values_shm.unlink()
+        slots_shm.close()
+        slots_shm.unlink()
+
+
+def count_ratios(values):
+    """
+    Return how many pairs i < j have a non-zero denominator.
+
+    Only pairs of equal values are skipped, so the count follows from the
+    size of each group of equal values without visiting the pairs.
+    """
+    _require_numpy("count_ratios")
+    a = np.asarray(values, dtype=np.float64)
+    n = len(a)
+    # inf - inf and nan - nan are nan, not zero, so only finite values pair up
+    _, counts = np.unique(a[np.isfinite(a)], return_counts=True)
+    return n * (n - 1) // 2 - int((counts * (counts - 1) // 2).sum())
+
+
+def write_ratios(values, path, block_pairs=BLOCK_PAIRS):
+    """
+    Stream every ratio into a memory-mapped .npy file.
+
+    The file is a structured array of RATIO_DTYPE records (i, j, ratio),
+    sized exactly up front and filled block by block. It can be reopened
+    with np.load(path, mmap_mode="r").
+
+    Args:
+        values (sequence): Numbers to compare
+        path (str): Output .npy file
+        block_pairs (int): Approximate number of pairs per block
+
+    Returns:
+        numpy.memmap: The written records
+    """
+    _require_numpy("write_ratios")
+    if len(values) > np.iinfo(np.int32).max:
+        raise ValueError("write_ratios supports at most 2**31 - 1 values")
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=RATIO_DTYPE,
+                                    shape=(count_ratios(values),))
+    offset = 0
+    for i, j, ratio in ratio_blocks(values, block_pairs):
+        end = offset + len(ratio)
+        out["i"][offset:end] = i
+        out["j"][offset:end] = j
+        out["ratio"][offset:end] = ratio
+        offset = end
+    out.flush()
+    return out
+
+
+def top_k_ratios(values, k, block_pairs=BLOCK_PAIRS):
+    """
+    Return the k largest ratios without keeping all pairs in memory.
+
+    Blocks are scanned in order while only the best k candidates so far
+    are kept. Once k are known, a block contributes only the ratios that
+    beat the current k-th best. Ties go to the smaller (i, j), and NaN
+    ratios are ignored.
+
+    Args:
+        values (sequence): Numbers to compare
+        k (int): Number of ratios to return
+        block_pairs (int): Approximate number of pairs per block
+
+    Returns:
+        list: Up to k (i, j, ratio) tuples, largest ratio first
+    """
+    _require_numpy("top_k_ratios")
+    best_i = best_j = np.empty(0, dtype=np.int64)
+    best_r = np.empty(0, dtype=np.float64)
+    if k <= 0:
+        return []
+    for i, j, ratio in ratio_blocks(values, block_pairs):
+        if len(best_r) == k:
+            keep = ratio > best_r[-1]
+        else:
+            keep = ~np.isnan(ratio)
+        if not keep.any():
+            continue
+        i, j, ratio = i[keep], j[keep], ratio[keep]
+        if len(ratio) > k:
+            # Keep everything tied with the k-th largest so ties resolve by (i, j)
+            threshold = np.partition(ratio, len(ratio) - k)[len(ratio) - k]
+            keep = ratio >= threshold
+            i, j, ratio = i[keep], j[keep], ratio[keep]
+        best_i = np.concatenate((best_i, i))
+        best_j = np.concatenate((best_j, j))
+        best_r = np.concatenate((best_r, ratio))
+        order = np.lexsort((best_j, best_i, -best_r))[:k]
+        best_i, best_j, best_r = best_i[order], best_j[order], best_r[order]
+    return list(zip(best_i.tolist(), best_j.tolist(), best_r.tolist()))
+
+
+def benchmark(n=3_000, large_n=50_000, k=10):
+    """
+    Time compute_ratios against the block-wise NumPy versions.
+
+    Args:
+        n (int): Number of values for the full comparison
+        large_n (int): Number of values for the streaming and top-k runs
+        k (int): Number of ratios returned by top_k_ratios
+    """
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 1_000_000, size=n).tolist()
+    pairs = n * (n - 1) // 2
+
+    print(f"n = {n:,} ({pairs:,} pairs)")
+    start = time.perf_counter()
+    expected = compute_ratios(values)
+    loop_time = time.perf_counter() - start
+    print(f"  compute_ratios:  {loop_time:7.2f} s")
+
+    start = time.perf_counter()
+    blocks = list(ratio_blocks(values))
+    elapsed = time.perf_counter() - start
+    result = [pair for i, j, ratio in blocks
+              for pair in zip(i.tolist(), j.tolist(), ratio.tolist())]
+    print(f"  ratio_blocks:    {elapsed:7.2f} s  "
+          f"({'match' if result == expected else 'MISMATCH'})")
+    del expected, result, blocks
+
+    values = rng.integers(0, 1_000_000, size=large_n)
+    pairs = large_n * (large_n - 1) // 2
+    print(f"n = {large_n:,} ({pairs:,} pairs)")
+    start = time.perf_counter()
+    total = sum(len(ratio) for _, _, ratio in ratio_blocks(values))
+    elapsed = time.perf_counter() - start
+    print(f"  ratio_blocks:    {elapsed:7.2f} s  ({total / elapsed / 1e6:.0f} M pairs/s)")
+    # A 3-tuple with its two ints and a float, plus the list slot: ~150 bytes
+    print(f"  compute_ratios: ~{loop_time * pairs / (n * (n - 1) // 2):7.0f} s (extrapolated, "
+          f"~{total * 150 / 1e9:.0f} GB as a list)")
+
+    start = time.perf_counter()
+    top = top_k_ratios(values, k)
+    elapsed = time.perf_counter() - start
+    print(f"  top_k_ratios:    {elapsed:7.2f} s  (largest {top[0][2]:.1f})")
+
+
+def benchmark_parallel(n=30_000, worker_counts=(1, 2, 4, 8, 16)):
+    """
+    Time compute_ratios_parallel for several worker counts.
+
+    Args:
+        n (int): Number of values
+        worker_counts (tuple): Worker counts to time
+
+    Returns:
+        dict: Seconds per worker count
+    """
+    values = np.random.default_rng(0).integers(0, 1_000_000, size=n)
+    print(f"n = {n:,} ({n * (n - 1) // 2:,} pairs), {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    for _ in ratio_blocks(values):
+        pass
+    print(f"ratio_blocks: {time.perf_counter() - start:7.2f} s")
+
+    timings = {}
+    expected = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        count = total = 0
+        for _, _, ratio in compute_ratios_parallel(values, workers):
+            count += len(ratio)
+            total += ratio.sum()
+        timings[workers] = time.perf_counter() - start
+        # Tiles are the same for every worker count, so the sums agree exactly
+        expected = (count, total) if expected is None else expected
+        status = "ok" if (count, total) == expected else "MISMATCH"
+        print(f"{workers:>3} workers: {timings[workers]:7.2f} s "
+              f"({timings[worker_counts[0]] / timings[workers]:.2f}x)  {status}")
+    return timings
+
+
+def main():
+    """
+    Show the ratios for a small example and optionally run the benchmark.
+    """
+    print("Pairwise Ratios")
+    print("=" * 30)
+    nums = [5, 10, 15, 20, 25]
+    print(compute_ratios(nums))
+    print(f"Top 3: {top_k_ratios(nums, 3) if np is not None else 'requires NumPy'}")
+
+    if "--benchmark" in sys.argv:
+        benchmark()
+    if "--parallel" in sys.argv:
+        benchmark_parallel()
+
+
+if __name__ == "__main__":
+    main()
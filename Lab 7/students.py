@@ -0,0 +1,865 @@
+"""
+Student Records
+
+- StudentRecord and Department from Task 5, with __slots__ instead of a
+  per-instance __dict__
+- StudentTable: columnar storage for millions of students (ids in an
+  int64 array, names packed into one UTF-8 buffer, course codes interned
+  and stored as small-int arrays)
+- Lazy StudentRow views that behave like StudentRecord
+- Department indexes by student id and by course
+- Batched CSV / JSON Lines roster import and a memory-mapped binary
+  snapshot of a StudentTable
+- Batch report rendering (plain, CSV or JSON) into one buffered writer
+- tracemalloc benchmark of the three layouts, and a load-time benchmark
+  of CSV import against the snapshot
+"""
+
+import csv
+import io
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from itertools import islice
+
+
+# Rows parsed per batch by read_roster()
+ROSTER_BATCH = 50_000
+
+# Separator between course names in the courses column of a CSV roster
+COURSE_SEPARATOR = ";"
+
+# Students formatted per write by render_report()
+REPORT_BATCH = 10_000
+
+REPORT_FORMATS = ("plain", "csv", "json")
+
+# The get_summary() line, also used for each student of a plain report
+SUMMARY_TEMPLATE = "Student: {}, ID: {}, Courses: {}"
+
+# Snapshot header: magic, byte order of the arrays, course code typecode,
+# then counts of students, name bytes, course codes, courses and course
+# name bytes. Every section after it starts on an 8-byte boundary.
+SNAPSHOT_MAGIC = b"STUDTBL1"
+_SNAPSHOT_HEADER = struct.Struct("<8scc6xQQQQQ")
+
+
+class StudentRecord:
+    """
+    A student with a name, an id and a list of courses.
+    """
+
+    __slots__ = ("studentName", "student_id", "courses")
+
+    def __init__(self, name, student_id, courses=None):
+        self.studentName = name
+        self.student_id = student_id
+        self.courses = list(courses) if courses is not None else []
+
+    def add_course(self, course):
+        self.courses.append(course)
+
+    def get_summary(self):
+        return _summary(self.studentName, self.student_id, self.courses)
+
+
+class StudentRow:
+    """
+    A lightweight view of one row of a StudentTable.
+
+    Rows are created on access rather than stored, and read and write
+    through to the table, so they can be used wherever a StudentRecord is.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def studentName(self):
+        return self._table.name(self._row)
+
+    @property
+    def student_id(self):
+        return self._table.student_id(self._row)
+
+    @property
+    def courses(self):
+        return self._table.courses(self._row)
+
+    def add_course(self, course):
+        self._table.add_course(self._row, course)
+
+    def get_summary(self):
+        return self._table.get_summary(self._row)
+
+    def __repr__(self):
+        return f"StudentRow({self.studentName!r}, {self.student_id!r}, {self.courses!r})"
+
+
+class StudentTable:
+    """
+    Column-oriented storage for many students.
+
+    Instead of one object per student (each with its own name string,
+    list and int objects), every field is kept in a flat array:
+
+    - ids in an int64 array
+    - names concatenated in one UTF-8 bytearray, with an array of offsets
+    - courses interned to small integer codes; each student's codes are a
+      slice of one shared array (compressed sparse row layout)
+
+    A course added to a student other than the last one goes to a small
+    overflow map, so appending never shifts the shared arrays.
+
+    StudentTable.load() maps a snapshot written by save() straight into
+    memory: the columns are read-only views of the file, rows are decoded
+    only when accessed, and the columns are copied into growable arrays
+    on the first change.
+    """
+
+    def __init__(self, records=None):
+        """
+        Args:
+            records (iterable): Optional StudentRecord-like objects to add
+        """
+        self._ids = array("q")
+        self._name_data = bytearray()
+        self._name_offsets = array("Q", [0])
+        self._course_ids = array("H")
+        self._course_offsets = array("Q", [0])
+        self._extra_courses = {}
+        self._course_codes = {}
+        self._course_names = []
+        self._mmap = None
+        if records is not None:
+            for record in records:
+                self.append(record.studentName, record.student_id, record.courses)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self._ids)
+        if not 0 <= row < len(self._ids):
+            raise IndexError("student row out of range")
+        return StudentRow(self, row)
+
+    def __iter__(self):
+        for row in range(len(self._ids)):
+            yield StudentRow(self, row)
+
+    @property
+    def course_names(self):
+        """list: Interned course names, indexed by course code."""
+        return self._course_names
+
+    def course_code(self, course):
+        """
+        Return the small-int code of a course, interning it if new.
+        """
+        code = self._course_codes.get(course)
+        if code is None:
+            if self._mmap is not None:
+                self._detach()
+            code = len(self._course_names)
+            if code > 0xFFFF and self._course_ids.typecode == "H":
+                # More distinct courses than fit in 16 bits: widen once
+                self._course_ids = array("I", self._course_ids)
+            self._course_codes[course] = code
+            self._course_names.append(course)
+        return code
+
+    def append(self, name, student_id, courses=()):
+        """
+        Add a student.
+
+        Args:
+            name (str): Student name
+            student_id (int): Student id
+            courses (iterable): Course names
+
+        Returns:
+            int: Row of the new student
+        """
+        if self._mmap is not None:
+            self._detach()
+        self._ids.append(student_id)
+        self._name_data += name.encode("utf-8")
+        self._name_offsets.append(len(self._name_data))
+        # Intern first: a new code may widen (replace) the course array
+        codes = [self.course_code(course) for course in courses]
+        self._course_ids.extend(codes)
+        self._course_offsets.append(len(self._course_ids))
+        return len(self._ids) - 1
+
+    def extend(self, rows):
+        """
+        Add a batch of students at once.
+
+        The batch is collected in plain lists and then appended to each
+        column in one call, about 1.5x faster than append() per student.
+
+        Args:
+            rows (iterable): (name, student_id, courses) tuples
+        """
+        if self._mmap is not None:
+            self._detach()
+        ids, names, name_ends, codes, course_ends = [], [], [], [], []
+        name_end = self._name_offsets[-1]
+        course_base = self._course_offsets[-1]
+        course_code = self.course_code
+        for name, student_id, courses in rows:
+            ids.append(student_id)
+            encoded = name.encode("utf-8")
+            names.append(encoded)
+            name_end += len(encoded)
+            name_ends.append(name_end)
+            for course in courses:
+                codes.append(course_code(course))
+            course_ends.append(course_base + len(codes))
+        self._ids.extend(ids)
+        self._name_data += b"".join(names)
+        self._name_offsets.extend(name_ends)
+        self._course_ids.extend(codes)
+        self._course_offsets.extend(course_ends)
+
+    def add_course(self, row, course):
+        """
+        Add a course to the student in `row`.
+        """
+        code = self.course_code(course)
+        if self._mmap is not None:
+            self._detach()
+        if row == len(self._ids) - 1 and row not in self._extra_courses:
+            self._course_ids.append(code)
+            self._course_offsets[-1] += 1
+        else:
+            self._extra_courses.setdefault(row, []).append(code)
+
+    def name(self, row):
+        start, end = self._name_offsets[row], self._name_offsets[row + 1]
+        return str(self._name_data[start:end], "utf-8")
+
+    def student_id(self, row):
+        return self._ids[row]
+
+    def course_codes(self, row):
+        """
+        Return the course codes of the student in `row`.
+        """
+        codes = self._course_ids[self._course_offsets[row]:self._course_offsets[row + 1]].tolist()
+        extra = self._extra_courses.get(row)
+        return codes + extra if extra else codes
+
+    def courses(self, row):
+        names = self._course_names
+        return [names[code] for code in self.course_codes(row)]
+
+    def get_summary(self, row):
+        return _summary(self.name(row), self._ids[row], self.courses(row))
+
+    def rows(self, start=0, stop=None):
+        """
+        Yield (name, student_id, courses) tuples read straight from the columns.
+
+        This is much cheaper than going through a StudentRow per student
+        when every row is needed, e.g. for a report.
+        """
+        stop = len(self._ids) if stop is None else stop
+        if start >= stop:
+            return
+        name_data, ids = self._name_data, self._ids
+        name_offsets = self._name_offsets[start:stop + 1].tolist()
+        course_offsets = self._course_offsets[start:stop + 1].tolist()
+        names, extra = self._course_names, self._extra_courses
+        courses = [names[code] for code in self._course_ids[course_offsets[0]:course_offsets[-1]]]
+        # Byte offsets are character offsets too when every name is ASCII
+        name_base, course_base = name_offsets[0], course_offsets[0]
+        text = str(name_data[name_base:name_offsets[-1]], "utf-8")
+        ascii_names = len(text) == name_offsets[-1] - name_base
+        for i, row in enumerate(range(start, stop)):
+            if ascii_names:
+                name = text[name_offsets[i] - name_base:name_offsets[i + 1] - name_base]
+            else:
+                name = str(name_data[name_offsets[i]:name_offsets[i + 1]], "utf-8")
+            row_courses = courses[course_offsets[i] - course_base:course_offsets[i + 1] - course_base]
+            if row in extra:
+                row_courses += [names[code] for code in extra[row]]
+            yield name, ids[row], row_courses
+
+    def student_ids(self):
+        """
+        Return every student id, in row order.
+        """
+        return self._ids.tolist()
+
+    def _detach(self):
+        # Copy memory-mapped columns into growable arrays before the first change
+        def copy(typecode, section):
+            column = array(typecode)
+            column.frombytes(section.cast("B"))
+            return column
+
+        self._ids = copy("q", self._ids)
+        self._name_data = bytearray(self._name_data)
+        self._name_offsets = copy("Q", self._name_offsets)
+        self._course_ids = copy(self._course_ids.format, self._course_ids)
+        self._course_offsets = copy("Q", self._course_offsets)
+        self._mmap = None
+
+    def _compact_courses(self):
+        # Fold the overflow map back into the shared course arrays
+        if not self._extra_courses:
+            return
+        codes = array(self._course_ids.typecode)
+        offsets = array("Q", [0])
+        for row in range(len(self._ids)):
+            codes.extend(self.course_codes(row))
+            offsets.append(len(codes))
+        self._course_ids, self._course_offsets = codes, offsets
+        self._extra_courses = {}
+
+    def save(self, path):
+        """
+        Write the table to a binary snapshot that load() can map back in.
+
+        The snapshot is written to a temporary file next to path and moved
+        over it only when complete, so a table mapped from path (this one or
+        another) keeps reading the old file instead of a truncated one.
+
+        Args:
+            path (str): Snapshot file
+        """
+        self._compact_courses()
+        course_names = [name.encode("utf-8") for name in self._course_names]
+        course_name_offsets = array("Q", [0])
+        for name in course_names:
+            course_name_offsets.append(course_name_offsets[-1] + len(name))
+        course_name_data = b"".join(course_names)
+        header = _SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, b"L" if sys.byteorder == "little" else b"B",
+            memoryview(self._course_ids).format.encode("ascii"), len(self._ids), len(self._name_data),
+            len(self._course_ids), len(course_names), len(course_name_data))
+        sections = (self._ids, self._name_offsets, self._name_data, self._course_offsets,
+                    self._course_ids, course_name_offsets, course_name_data)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                         prefix=".snapshot-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                for section in sections:
+                    data = memoryview(section).cast("B")
+                    f.write(data)
+                    f.write(bytes(-len(data) % 8))
+            del sections, data
+            # Windows cannot replace a file that is still mapped
+            if os.name == "nt" and self._mmap is not None:
+                self._detach()
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """
+        Map a snapshot written by save() without parsing it.
+
+        Only the header and the course names are read up front. Everything
+        else stays in the page cache until a row is accessed.
+
+        Args:
+            path (str): Snapshot file
+
+        Returns:
+            StudentTable: A table backed by the mapped file
+
+        Raises:
+            ValueError: If the file is not a snapshot, was written on a
+                machine with a different byte order, or is truncated
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) < _SNAPSHOT_HEADER.size:
+            raise ValueError(f"'{path}' is not a student snapshot")
+        (magic, byteorder, typecode, count, name_bytes, code_count,
+         course_count, course_name_bytes) = _SNAPSHOT_HEADER.unpack_from(mapped)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"'{path}' is not a student snapshot")
+        if byteorder != (b"L" if sys.byteorder == "little" else b"B"):
+            raise ValueError(f"'{path}' was written on a machine with a different byte order")
+        typecode = typecode.decode("ascii")
+
+        view = memoryview(mapped)
+        offset = _SNAPSHOT_HEADER.size
+
+        def take(size, fmt=None):
+            nonlocal offset
+            if offset + size > len(view):
+                raise ValueError(f"Snapshot '{path}' is truncated")
+            section = view[offset:offset + size]
+            offset += size + -size % 8
+            return section.cast(fmt) if fmt else section
+
+        table = cls()
+        table._ids = take(count * 8, "q")
+        table._name_offsets = take((count + 1) * 8, "Q")
+        table._name_data = take(name_bytes)
+        table._course_offsets = take((count + 1) * 8, "Q")
+        table._course_ids = take(code_count * array(typecode).itemsize, typecode)
+        name_offsets = take((course_count + 1) * 8, "Q")
+        name_data = take(course_name_bytes)
+        table._course_names = [str(name_data[name_offsets[i]:name_offsets[i + 1]], "utf-8")
+                               for i in range(course_count)]
+        table._course_codes = {name: code for code, name in enumerate(table._course_names)}
+        table._mmap = mapped
+        return table
+
+
+class Department:
+    """
+    A department and the students enrolled in it.
+
+    Two indexes are kept up to date as students enroll and take courses:
+    student_id -> position in self.students, and course -> positions of
+    the students taking it. Lookups by id are O(1), and listing a course
+    is O(k) for its k students, with no scan of the whole department.
+    Courses should be added through Department.add_course so the course
+    index sees them.
+    """
+
+    def __init__(self, deptName, students=None, columnar=False):
+        """
+        Args:
+            deptName (str): Department name
+            students (iterable): Students to enroll
+            columnar (bool): Keep students in a StudentTable instead of a list
+
+        Raises:
+            ValueError: If two students share a student_id
+        """
+        self.dept_name = deptName
+        self.students = StudentTable() if columnar else []
+        self._by_id = {}
+        self._by_course = {}
+        for student in students if students is not None else ():
+            self.enroll_student(student)
+
+    @classmethod
+    def from_table(cls, deptName, table):
+        """
+        Build a columnar department around an existing StudentTable.
+
+        The indexes are built in one pass over the table, e.g. straight
+        after load_roster() or StudentTable.load().
+
+        Args:
+            deptName (str): Department name
+            table (StudentTable): Students of the department
+
+        Raises:
+            ValueError: If two students share a student_id
+        """
+        department = cls(deptName, columnar=True)
+        department.students = table
+        ids = table.student_ids()
+        department._by_id = dict(zip(ids, range(len(ids))))
+        if len(department._by_id) != len(ids):
+            raise ValueError(f"Duplicate student ids in {deptName}")
+        by_code = [array("Q") for _ in table.course_names]
+        for row in range(len(ids)):
+            for code in dict.fromkeys(table.course_codes(row)):
+                by_code[code].append(row)
+        department._by_course = {table.course_names[code]: positions
+                                 for code, positions in enumerate(by_code) if positions}
+        return department
+
+    def enroll_student(self, student):
+        """
+        Enroll a student and index it by id and by course.
+
+        Raises:
+            ValueError: If a student with the same student_id is already enrolled
+        """
+        if student.student_id in self._by_id:
+            raise ValueError(f"Student {student.student_id} is already enrolled in {self.dept_name}")
+        if isinstance(self.students, StudentTable):
+            position = self.students.append(student.studentName, student.student_id, student.courses)
+        else:
+            position = len(self.students)
+            self.students.append(student)
+        self._by_id[student.student_id] = position
+        for course in dict.fromkeys(student.courses):
+            self._index_course(course, position)
+
+    def _index_course(self, course, position):
+        positions = self._by_course.get(course)
+        if positions is None:
+            positions = self._by_course[course] = array("Q")
+        positions.append(position)
+
+    def add_course(self, student_id, course):
+        """
+        Add a course to an enrolled student and to the course index.
+
+        Raises:
+            KeyError: If no student with this id is enrolled
+        """
+        position = self._by_id[student_id]
+        student = self.students[position]
+        already_taking = course in student.courses
+        student.add_course(course)
+        if not already_taking:
+            self._index_course(course, position)
+
+    def find_by_id(self, student_id):
+        """
+        Return the student with this id, or None if not enrolled.
+        """
+        position = self._by_id.get(student_id)
+        return None if position is None else self.students[position]
+
+    def students_in_course(self, course):
+        """
+        Return the students taking a course, in enrollment order.
+        """
+        students = self.students
+        return [students[position] for position in self._by_course.get(course, ())]
+
+    def course_counts(self):
+        """
+        Return the number of students taking each course.
+
+        Returns:
+            dict: Course name -> number of students
+        """
+        return {course: len(positions) for course, positions in self._by_course.items()}
+
+    def department_summary(self):
+        return f"Department: {self.dept_name}, Total Students: {len(self.students)}"
+
+    def render_report(self, out=None, fmt="plain"):
+        """
+        Render every enrolled student with render_report().
+        """
+        return render_report(self.students, out, fmt)
+
+
+def _roster_rows(f, path):
+    if path.endswith((".jsonl", ".ndjson")):
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record["name"], int(record["student_id"]), record.get("courses", [])
+    else:
+        for record in csv.DictReader(f):
+            courses = record.get("courses") or ""
+            yield (record["name"], int(record["student_id"]),
+                   courses.split(COURSE_SEPARATOR) if courses else [])
+
+
+def read_roster(path, batch_size=ROSTER_BATCH):
+    """
+    Yield batches of (name, student_id, courses) rows from a roster file.
+
+    Files ending in .jsonl or .ndjson hold one JSON object per line with
+    "name", "student_id" and an optional "courses" list. Anything else is
+    read as CSV with a header row of name, student_id and courses, where
+    courses are separated by COURSE_SEPARATOR.
+
+    Args:
+        path (str): Roster file
+        batch_size (int): Rows per batch
+
+    Yields:
+        list: Up to batch_size (name, student_id, courses) tuples
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = _roster_rows(f, path)
+        batch = list(islice(rows, batch_size))
+        while batch:
+            yield batch
+            batch = list(islice(rows, batch_size))
+
+
+def load_roster(path, batch_size=ROSTER_BATCH):
+    """
+    Build a StudentTable from a CSV or JSON Lines roster, batch by batch.
+
+    Args:
+        path (str): Roster file
+        batch_size (int): Rows parsed and added per batch
+
+    Returns:
+        StudentTable: The students of the roster
+    """
+    table = StudentTable()
+    for batch in read_roster(path, batch_size):
+        table.extend(batch)
+    return table
+
+
+def _student_rows(students):
+    if isinstance(students, StudentTable):
+        return students.rows()
+    return ((student.studentName, student.student_id, student.courses) for student in students)
+
+
+def _summary(name, student_id, courses):
+    return SUMMARY_TEMPLATE.format(name, student_id, ", ".join(courses))
+
+
+_PLAIN_LINE = SUMMARY_TEMPLATE + "\n"
+
+
+# One precompiled template per format, applied to a whole batch at a time
+def _plain_block(batch):
+    line = _PLAIN_LINE.format
+    return "".join([line(name, student_id, ", ".join(courses)) for name, student_id, courses in batch])
+
+
+_JSON_ENCODE = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _json_block(batch):
+    # Encode the batch as one list and drop its brackets
+    return _JSON_ENCODE([{"name": name, "student_id": student_id, "courses": courses}
+                         for name, student_id, courses in batch])[1:-1]
+
+
+def render_report(students, out=None, fmt="plain", batch_size=REPORT_BATCH):
+    """
+    Format many students at once into a single buffered writer.
+
+    Students are formatted batch_size at a time with one template per
+    format, and each batch goes out in a single write. This avoids a
+    print() call (and, on a terminal, a flush) per student. Only one batch
+    is held in memory, so a report can be streamed to a file of any size.
+
+    The plain format matches get_summary(). CSV has a header row of name,
+    student_id and courses, with courses joined by COURSE_SEPARATOR. JSON
+    is one array of {"name", "student_id", "courses"} objects.
+
+    Args:
+        students (iterable): StudentRecord-like objects or a StudentTable
+        out: Path or text file to write to; None returns the report as a string
+        fmt (str): "plain", "csv" or "json"
+        batch_size (int): Students formatted per write
+
+    Returns:
+        str: The report if out is None, otherwise the number of students written
+    """
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'. Use one of: {', '.join(REPORT_FORMATS)}")
+    if out is None:
+        buffer = io.StringIO()
+        render_report(students, buffer, fmt, batch_size)
+        return buffer.getvalue()
+    if isinstance(out, (str, os.PathLike)):
+        with open(out, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            return render_report(students, f, fmt, batch_size)
+
+    rows = _student_rows(students)
+    count = 0
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(("name", "student_id", "courses"))
+    elif fmt == "json":
+        out.write("[")
+    batch = list(islice(rows, batch_size))
+    while batch:
+        if fmt == "plain":
+            out.write(_plain_block(batch))
+        elif fmt == "csv":
+            writer.writerows([(name, student_id, COURSE_SEPARATOR.join(courses))
+                              for name, student_id, courses in batch])
+        else:
+            out.write((", " if count else "") + _json_block(batch))
+        count += len(batch)
+        batch = list(islice(rows, batch_size))
+    if fmt == "json":
+        out.write("]\n")
+    return count
+
+
+class _DictStudentRecord:
+    # The original StudentRecord layout (instance __dict__), for the benchmark
+    def __init__(self, name, student_id, courses=None):
+        self.studentName = name
+        self.student_id = student_id
+        self.courses = list(courses) if courses is not None else []
+
+
+def _sample_students(count, seed=0):
+    rng = random.Random(seed)
+    catalog = [f"{subject}{level}" for subject in ("MATH", "PHYS", "CHEM", "CS", "BIO", "ENG")
+               for level in (101, 102, 201, 202, 301, 302, 401)]
+    for i in range(count):
+        yield f"Student {i}", 100_000 + i, rng.sample(catalog, rng.randint(2, 5))
+
+
+def _build_table(rows):
+    table = StudentTable()
+    for row in rows:
+        table.append(*row)
+    return table
+
+
+def benchmark(count=1_000_000):
+    """
+    Measure the memory held by `count` students in each layout.
+
+    Args:
+        count (int): Number of students
+
+    Returns:
+        dict: Bytes allocated per layout
+    """
+    results = {}
+    layouts = (
+        ("dict records", lambda rows: [_DictStudentRecord(*row) for row in rows]),
+        ("slots records", lambda rows: [StudentRecord(*row) for row in rows]),
+        ("StudentTable", _build_table),
+    )
+    print(f"{count:,} students")
+    print("-" * 50)
+    for name, build in layouts:
+        tracemalloc.start()
+        container = build(_sample_students(count))
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = current
+        print(f"{name:<14} {current / 2**20:8.1f} MB  {current / count:6.1f} B/student")
+        del container
+    return results
+
+
+def benchmark_snapshot(count=1_000_000):
+    """
+    Time loading a roster from CSV against mapping a snapshot of it.
+
+    Args:
+        count (int): Number of students in the roster
+
+    Returns:
+        dict: Seconds per step
+    """
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        roster = os.path.join(tmp, "roster.csv")
+        snapshot = os.path.join(tmp, "roster.snap")
+        with open(roster, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(("name", "student_id", "courses"))
+            for name, student_id, courses in _sample_students(count):
+                writer.writerow((name, student_id, COURSE_SEPARATOR.join(courses)))
+
+        start = time.perf_counter()
+        table = load_roster(roster)
+        timings["csv"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table.save(snapshot)
+        timings["save"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded = StudentTable.load(snapshot)
+        timings["load"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        summaries = [loaded.get_summary(row) for row in range(0, count, 1000)]
+        timings["access"] = time.perf_counter() - start
+        same = summaries == [table.get_summary(row) for row in range(0, count, 1000)]
+
+        print(f"{count:,} students")
+        print(f"  CSV roster:      {os.path.getsize(roster) / 2**20:7.1f} MB, "
+              f"load_roster {timings['csv']:6.2f} s")
+        print(f"  snapshot:        {os.path.getsize(snapshot) / 2**20:7.1f} MB, "
+              f"save {timings['save']:6.2f} s, load {timings['load'] * 1000:6.2f} ms")
+        print(f"  {len(summaries):,} rows from the snapshot: {timings['access'] * 1000:.1f} ms "
+              f"({'match' if same else 'MISMATCH'})")
+        del loaded
+    return timings
+
+
+def benchmark_report(count=500_000):
+    """
+    Time printing get_summary() per student against render_report().
+
+    The print path writes to a line-buffered file, as print() does on a
+    terminal.
+
+    Args:
+        count (int): Number of students
+
+    Returns:
+        dict: Seconds per approach
+    """
+    department = Department("CS")
+    for row in _sample_students(count):
+        department.enroll_student(StudentRecord(*row))
+    columnar = Department.from_table("CS", _build_table(_sample_students(count)))
+
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "report.txt")
+        start = time.perf_counter()
+        with open(path, "w", encoding="utf-8", buffering=1) as f:
+            stdout, sys.stdout = sys.stdout, f
+            try:
+                for student in department.students:
+                    print(student.get_summary())
+            finally:
+                sys.stdout = stdout
+        timings["print"] = time.perf_counter() - start
+        with open(path, encoding="utf-8") as f:
+            expected = f.read()
+
+        runs = [(f"{fmt} (records)", department, fmt) for fmt in REPORT_FORMATS]
+        runs.append(("plain (table)", columnar, "plain"))
+        print(f"{count:,} students")
+        print(f"  {'print per student':<30}{timings['print']:6.2f} s")
+        for name, source, fmt in runs:
+            start = time.perf_counter()
+            source.render_report(path, fmt)
+            timings[name] = time.perf_counter() - start
+            status = ""
+            if fmt == "plain":
+                with open(path, encoding="utf-8") as f:
+                    status = "  match" if f.read() == expected else "  MISMATCH"
+            print(f"  render_report {name:<16}{timings[name]:6.2f} s  "
+                  f"({timings['print'] / timings[name]:.1f}x){status}")
+    return timings
+
+
+def main():
+    """
+    Run the Task 5 example and optionally the benchmarks.
+    """
+    s1 = StudentRecord("Alice", 101, ["Math", "Science"])
+    d1 = Department("Computer Science")
+    d1.enroll_student(s1)
+    print(s1.get_summary())
+    print(d1.department_summary())
+
+    if "--benchmark" in sys.argv:
+        benchmark()
+    if "--snapshot" in sys.argv:
+        benchmark_snapshot()
+    if "--report" in sys.argv:
+        benchmark_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,95 @@
+import csv
+import json
+import sys
+from itertools import islice
+
+# Students built per batch by iter_student_batches()
+BATCH_SIZE = 10_000
+
+# The display() block, shared by Student.display() and display_all()
+STUDENT_TEMPLATE = (
+    "Student class: {cls}\n"
+    "Details of the student:\n"
+    "Name: {name}\n"
+    "Roll No: {roll_no}\n"
+    "Marks: {marks}\n"
+)
+
+
 class Student:
     def __init__(self, name, roll_no, marks):
         self.name = name
         self.roll_no = roll_no
         self.marks = marks
 
+    def format(self):
+        return STUDENT_TEMPLATE.format(
+            cls=self.__class__, name=self.name, roll_no=self.roll_no, marks=self.marks
+        )
+
     def display(self):
-        print("Student class:", self.__class__)
-        print("Details of the student:")
-        print(f"Name: {self.name}")
-        print(f"Roll No: {self.roll_no}")
-        print(f"Marks: {self.marks}")
+        print(self.format(), end="")
+
+
+def display_all(students, out=None, batch_size=BATCH_SIZE):
+    """
+    Write the display() block of every student, a batch at a time.
+
+    Each batch is formatted with the same template as display() and
+    written in a single call, instead of five print() calls per student.
+    """
+    out = sys.stdout if out is None else out
+    students = iter(students)
+    batch = list(islice(students, batch_size))
+    while batch:
+        out.write("".join([student.format() for student in batch]))
+        batch = list(islice(students, batch_size))
+
+
+def _roster_rows(f, path):
+    if path.endswith((".jsonl", ".ndjson")):
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record["name"], str(record["roll_no"]), float(record["marks"])
+    else:
+        for record in csv.DictReader(f):
+            yield record["name"].strip(), record["roll_no"].strip(), float(record["marks"])
+
+
+def iter_student_batches(path, batch_size=BATCH_SIZE):
+    """
+    Read students from a roster file in batches.
+
+    Files ending in .jsonl or .ndjson hold one JSON object per line;
+    anything else is read as CSV. Both need name, roll_no and marks fields.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = _roster_rows(f, path)
+        batch = list(islice(rows, batch_size))
+        while batch:
+            yield [Student(name, roll_no, marks) for name, roll_no, marks in batch]
+            batch = list(islice(rows, batch_size))
+
+
+def load_students(path, batch_size=BATCH_SIZE):
+    """
+    Load every student of a CSV or JSON Lines roster into a list.
+    """
+    students = []
+    for batch in iter_student_batches(path, batch_size):
+        students.extend(batch)
+    return students
+
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        students = load_students(sys.argv[1])
+        print(f"Loaded {len(students)} students from {sys.argv[1]}")
+        if "--show" in sys.argv:
+            display_all(students)
+        sys.exit()
+
     name = input("Enter student name: ").strip()
     roll_no = input("Enter roll number: ").strip()
     marks = float(input("Enter marks: ").strip())
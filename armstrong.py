@@ -0,0 +1,149 @@
+"""
+Armstrong Number Search
+
+- Enumerates all Armstrong numbers up to a given number of digits
+- Searches digit multisets instead of every integer, with the digit powers
+  precomputed once per length
+- Optional process-pool fan-out by digit count
+- Benchmark against the brute-force is_armstrong_number loop from
+  Lab2_1.ipynb, Task 2
+"""
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations_with_replacement
+
+
+DIGITS = "0123456789"
+
+
+def armstrong_numbers_of_length(length):
+    """
+    Return all Armstrong numbers with exactly `length` digits.
+
+    The sum of digit powers depends only on which digits occur, not on their
+    order, so each multiset of digits is evaluated once: if its power sum
+    has `length` digits and those digits are the same multiset, the sum is
+    an Armstrong number. That is C(length + 9, 9) candidates instead of
+    9 * 10**(length - 1).
+
+    Args:
+        length (int): Number of digits (1 or more)
+
+    Returns:
+        list: Armstrong numbers in increasing order
+    """
+    powers = {d: int(d) ** length for d in DIGITS}
+    low = 0 if length == 1 else 10 ** (length - 1)
+    high = 10 ** length
+    found = []
+    for combo in combinations_with_replacement(DIGITS, length):
+        total = 0
+        for d in combo:
+            total += powers[d]
+        if low <= total < high and tuple(sorted(str(total))) == combo:
+            found.append(total)
+    found.sort()
+    return found
+
+
+def armstrong_numbers(max_digits, workers=None):
+    """
+    Yield every Armstrong number with at most `max_digits` digits.
+
+    Args:
+        max_digits (int): Largest number of digits to search (e.g. 15 for 10**15)
+        workers (int): Fan digit counts out across this many processes;
+                       None searches in the current process
+
+    Yields:
+        int: Armstrong numbers in increasing order
+    """
+    lengths = range(1, max_digits + 1)
+    if workers is None or workers <= 1:
+        for length in lengths:
+            yield from armstrong_numbers_of_length(length)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Longest searches first so the pool is not left waiting on them
+        futures = {length: pool.submit(armstrong_numbers_of_length, length)
+                   for length in reversed(lengths)}
+        for length in lengths:
+            yield from futures[length].result()
+
+
+def is_armstrong_number(number):
+    """
+    Check if a number is an Armstrong number (the original per-number test).
+
+    Args:
+        number (int): An integer
+
+    Returns:
+        bool: True if the number is an Armstrong number, False otherwise
+    """
+    num_str = str(number)
+    num_digits = len(num_str)
+    armstrong_sum = 0
+    for digit in num_str:
+        armstrong_sum += int(digit) ** num_digits
+    return armstrong_sum == number
+
+
+def benchmark(max_digits=10, brute_digits=6):
+    """
+    Time the multiset search against the brute-force loop.
+
+    A brute-force scan of all 10-digit numbers takes hours, so it is timed
+    up to brute_digits and extrapolated linearly to max_digits.
+
+    Args:
+        max_digits (int): Digits searched by the multiset search
+        brute_digits (int): Digits actually scanned by the brute-force loop
+
+    Returns:
+        dict: Seconds per approach
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    brute = [n for n in range(10 ** brute_digits) if is_armstrong_number(n)]
+    timings["brute_force"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    small = list(armstrong_numbers(brute_digits))
+    timings["multiset_small"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = list(armstrong_numbers(max_digits))
+    timings["multiset"] = time.perf_counter() - start
+
+    estimate = timings["brute_force"] * 10 ** (max_digits - brute_digits)
+    print(f"Up to {brute_digits} digits:")
+    print(f"  brute force:     {timings['brute_force']:.2f} s ({len(brute)} found)")
+    print(f"  multiset search: {timings['multiset_small']:.3f} s "
+          f"({len(small)} found, {'match' if small == brute else 'MISMATCH'})")
+    print(f"Up to {max_digits} digits:")
+    print(f"  brute force:     ~{estimate:,.0f} s (extrapolated)")
+    print(f"  multiset search: {timings['multiset']:.2f} s ({len(found)} found)")
+    return timings
+
+
+def main():
+    """
+    List Armstrong numbers and optionally run the benchmark.
+    """
+    print("Armstrong Numbers")
+    print("=" * 30)
+    max_digits = 15 if "--all" in sys.argv else 9
+    for number in armstrong_numbers(max_digits):
+        print(number)
+
+    if "--benchmark" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,205 @@
 # Python program to count number of lines in a file
 
-# Ask user for the file name
-file_name = input("Enter the file name: ")
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-try:
-    # Open the file in read mode
-    with open(file_name, "r") as file:
-        # Read all lines into a list
-        lines = file.readlines()
+# Size of the reusable read buffer (1 MiB)
+BUFFER_SIZE = 1 << 20
 
-        # Count number of lines
-        num_lines = len(lines)
+# Bytes that separate words, as in `wc` (ASCII whitespace)
+WHITESPACE = b" \t\n\r\x0b\x0c"
 
-    print(f"Number of lines in '{file_name}': {num_lines}")
 
-except FileNotFoundError:
-    print(f"Error: File '{file_name}' not found.")
-except Exception as e:
-    print(f"An error occurred: {e}")
+def _count_range(path, start, end, count_words, universal_newlines=False):
+    """
+    Count newlines (and optionally words) in bytes [start, end) of a file.
+
+    With universal_newlines, a lone CR also ends a line and a CRLF pair
+    counts once. Returns (lines, words, first byte is a word byte, last
+    byte is a word byte, first byte is LF, last byte is CR) so neighbouring
+    ranges can fix up words and CRLF pairs split across their boundary.
+    """
+    lines = words = 0
+    first_in_word = last_in_word = False
+    starts_with_lf = ends_with_cr = False
+    buf = bytearray(BUFFER_SIZE)
+    with open(path, "rb", buffering=0) as f:
+        f.seek(start)
+        remaining = end - start
+        first = True
+        while remaining > 0:
+            n = f.readinto(buf)
+            if not n:
+                break
+            n = min(n, remaining)
+            remaining -= n
+            chunk = buf if n == len(buf) else buf[:n]
+            lines += chunk.count(b"\n")
+            if universal_newlines:
+                carriage_returns = chunk.count(b"\r")
+                if carriage_returns:
+                    lines += carriage_returns - chunk.count(b"\r\n")
+                # A CRLF pair split across chunks was counted twice
+                if not first and ends_with_cr and chunk[0] == 0x0A:
+                    lines -= 1
+                if first:
+                    starts_with_lf = chunk[0] == 0x0A
+                ends_with_cr = chunk[n - 1] == 0x0D
+            if count_words:
+                chunk_words = len(chunk.split())
+                starts_in_word = chunk[0] not in WHITESPACE
+                # A word running across the previous chunk was already counted
+                if not first and last_in_word and starts_in_word:
+                    chunk_words -= 1
+                if first:
+                    first_in_word = starts_in_word
+                words += chunk_words
+                last_in_word = chunk[n - 1] not in WHITESPACE
+            first = False
+    return lines, words, first_in_word, last_in_word, starts_with_lf, ends_with_cr
+
+
+def wc(path, workers=1, use_processes=True, count_words=True, universal_newlines=False):
+    """
+    Count lines, words and bytes of a file in one pass, like `wc`.
+
+    The file is read with a fixed, reused buffer, so memory stays constant
+    whatever the file size. With workers > 1 the file is split into equal
+    byte ranges counted concurrently, in processes by default or in threads
+    (useful when the disk, not the CPU, is the bottleneck).
+
+    Like `wc`, only LF bytes count as line ends unless universal_newlines
+    is set, which also counts CR-only and CRLF endings as Python's text
+    mode does.
+
+    Args:
+        path (str): File to count
+        workers (int): Number of byte ranges counted concurrently
+        use_processes (bool): Use processes (True) or threads (False) for workers
+        count_words (bool): Also count words (newline counting alone is faster)
+        universal_newlines (bool): Count CR, LF and CRLF line endings
+
+    Returns:
+        tuple: (lines, words, bytes)
+    """
+    size = os.path.getsize(path)
+    workers = max(1, min(workers, size // BUFFER_SIZE or 1))
+    if workers == 1:
+        lines, words = _count_range(path, 0, size, count_words, universal_newlines)[:2]
+        return lines, words, size
+
+    bounds = [size * i // workers for i in range(workers + 1)]
+    pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        parts = list(pool.map(_count_range, [path] * workers, bounds[:-1], bounds[1:],
+                              [count_words] * workers, [universal_newlines] * workers))
+
+    lines = sum(part[0] for part in parts)
+    if universal_newlines:
+        # A CRLF pair split across a range boundary was counted twice
+        lines -= sum(left[5] and right[4] for left, right in zip(parts, parts[1:]))
+    words = sum(part[1] for part in parts)
+    if count_words:
+        # Subtract words that straddle a range boundary and were counted twice
+        for left, right in zip(parts, parts[1:]):
+            if left[3] and right[2]:
+                words -= 1
+    return lines, words, size
+
+
+def _has_partial_last_line(path, line_ends=b"\n"):
+    """
+    Return True if the file is non-empty and its last byte is not a line end.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) not in line_ends
+
+
+def count_lines(path, workers=1, use_processes=True):
+    """
+    Count the lines in a file without loading it into memory.
+
+    Lines end at LF, CRLF or a lone CR, and a last line without a line end
+    still counts, so the result matches len(file.readlines()) in text mode.
+
+    Args:
+        path (str): File to count
+        workers (int): Number of byte ranges counted concurrently
+        use_processes (bool): Use processes (True) or threads (False) for workers
+
+    Returns:
+        int: Number of lines in the file
+    """
+    lines = wc(path, workers, use_processes, count_words=False, universal_newlines=True)[0]
+    return lines + _has_partial_last_line(path, b"\r\n")
+
+
+def _count_lines_readlines(path):
+    # The original approach: read every line into a list just to take len()
+    with open(path, "r") as file:
+        return len(file.readlines())
+
+
+def benchmark(sizes_mb=(100, 1024, 10240), workers=os.cpu_count()):
+    """
+    Time readlines() against count_lines and wc on generated files.
+
+    Args:
+        sizes_mb (tuple): File sizes to generate, in MB
+        workers (int): Workers used for the parallel runs
+    """
+    line = b"2024-01-01 12:00:00 INFO request handled in 12 ms path=/api/items id=42\n"
+    block = line * (BUFFER_SIZE // len(line))
+    for size_mb in sizes_mb:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.log")
+            with open(path, "wb") as f:
+                for _ in range(size_mb * (1 << 20) // len(block)):
+                    f.write(block)
+
+            print(f"\n{size_mb:,} MB file")
+            print("-" * 40)
+            runs = [
+                ("readlines()", lambda: _count_lines_readlines(path)),
+                ("count_lines", lambda: count_lines(path)),
+                (f"count_lines x{workers}", lambda: count_lines(path, workers)),
+                ("wc", lambda: wc(path)[0]),
+            ]
+            for name, run in runs:
+                start = time.perf_counter()
+                try:
+                    result = run()
+                except MemoryError:
+                    print(f"{name:<16} out of memory")
+                    continue
+                elapsed = time.perf_counter() - start
+                print(f"{name:<16} {elapsed:8.2f} s  {size_mb / elapsed:8.0f} MB/s  ({result:,} lines)")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+        sys.exit()
+
+    # Ask user for the file name
+    file_name = input("Enter the file name: ")
+
+    try:
+        # Count lines, words and bytes in a single buffered pass
+        num_lines, num_words, num_bytes = wc(file_name)
+        num_lines += _has_partial_last_line(file_name)
+
+        print(f"Number of lines in '{file_name}': {num_lines}")
+        print(f"Words: {num_words}, Bytes: {num_bytes}")
+
+    except FileNotFoundError:
+        print(f"Error: File '{file_name}' not found.")
+    except Exception as e:
+        print(f"An error occurred: {e}")
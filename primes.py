@@ -0,0 +1,310 @@
+"""
+Prime Number Utilities
+
+- Segmented, bytearray-backed Sieve of Eratosthenes for ranges
+- Deterministic Miller-Rabin test for single 64-bit queries
+- Cached sieve that grows lazily as larger numbers are queried
+- Palindromic primes found by generating palindromes first
+- Benchmark against trial division (is_prime / is_prime_and_palindrome
+  from Lab2_1.ipynb, Task 3)
+"""
+
+import math
+import sys
+import time
+
+
+# Witnesses that make Miller-Rabin exact for every n < 3.3 * 10**24
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Numbers per segment when sieving a range (fits comfortably in L2 cache)
+SEGMENT_SIZE = 1 << 18
+
+
+def _simple_sieve(limit):
+    """
+    Return a bytearray where flags[i] is 1 exactly when i is prime (i <= limit).
+    """
+    flags = bytearray([1]) * (limit + 1)
+    flags[:2] = b"\x00\x00"[:limit + 1]
+    for p in range(2, math.isqrt(limit) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return flags
+
+
+def _base_primes(limit):
+    flags = _simple_sieve(limit)
+    return [i for i in range(2, limit + 1) if flags[i]]
+
+
+def _sieve_segment(lo, hi, base_primes):
+    """
+    Return flags for lo <= n < hi, crossing off multiples of base_primes.
+    """
+    flags = bytearray([1]) * (hi - lo)
+    for p in base_primes:
+        if p * p >= hi:
+            break
+        start = max(p * p, (lo + p - 1) // p * p)
+        flags[start - lo::p] = bytes(len(range(start, hi, p)))
+    for n in range(lo, min(hi, 2)):
+        flags[n - lo] = 0
+    return flags
+
+
+def primes_in_range(lo, hi, segment_size=SEGMENT_SIZE):
+    """
+    Yield the primes p with lo <= p < hi using a segmented sieve.
+
+    Only one segment is held in memory at a time, so memory use is
+    O(sqrt(hi) + segment_size) however wide the range is.
+
+    Args:
+        lo (int): Inclusive lower bound
+        hi (int): Exclusive upper bound
+        segment_size (int): Numbers sieved per segment
+
+    Yields:
+        int: Primes in increasing order
+    """
+    lo = max(lo, 0)
+    if hi <= lo:
+        return
+    base_primes = _base_primes(math.isqrt(hi - 1) + 1)
+    for seg_lo in range(lo, hi, segment_size):
+        seg_hi = min(seg_lo + segment_size, hi)
+        flags = _sieve_segment(seg_lo, seg_hi, base_primes)
+        index = flags.find(1)
+        while index != -1:
+            yield seg_lo + index
+            index = flags.find(1, index + 1)
+
+
+def miller_rabin(n):
+    """
+    Check whether n is prime with the Miller-Rabin test.
+
+    The fixed witness set makes the answer exact for all n < 3.3 * 10**24,
+    which covers every 64-bit integer; above that it is a strong probable
+    prime test.
+
+    Args:
+        n (int): Integer to test
+
+    Returns:
+        bool: True if n is prime
+    """
+    if n < 2:
+        return False
+    for p in _MR_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+class PrimeSieve:
+    """
+    Sieve of Eratosthenes that grows lazily as larger numbers are queried.
+
+    Membership tests below the sieved limit are a single bytearray lookup;
+    when a larger number is requested the sieve is extended segment-wise
+    (at least doubling) up to max_limit, beyond which Miller-Rabin is used.
+    """
+
+    def __init__(self, limit=1 << 16, max_limit=1 << 26):
+        """
+        Args:
+            limit (int): Initial sieve limit
+            max_limit (int): Largest limit the sieve will grow to
+        """
+        self.max_limit = max_limit
+        self._flags = _simple_sieve(max(limit, 2))
+
+    @property
+    def limit(self):
+        """int: Largest number covered by the sieve."""
+        return len(self._flags) - 1
+
+    def _grow(self, n):
+        new_limit = min(max(n, 2 * self.limit), self.max_limit)
+        if new_limit <= self.limit:
+            return
+        base_primes = _base_primes(math.isqrt(new_limit) + 1)
+        self._flags += _sieve_segment(len(self._flags), new_limit + 1, base_primes)
+
+    def __contains__(self, n):
+        if n > self.limit and n <= self.max_limit:
+            self._grow(n)
+        if n <= self.limit:
+            return n >= 0 and self._flags[n] == 1
+        return miller_rabin(n)
+
+    def primes_up_to(self, n):
+        """
+        Return all primes <= n (growing the sieve if n is within max_limit).
+
+        Args:
+            n (int): Upper bound
+
+        Returns:
+            list: Primes in increasing order
+        """
+        if n > self.limit:
+            if n > self.max_limit:
+                return list(primes_in_range(0, n + 1))
+            self._grow(n)
+        flags = self._flags
+        return [i for i in range(2, n + 1) if flags[i]]
+
+
+# Shared sieve behind is_prime()
+_SIEVE = PrimeSieve()
+
+
+def is_prime(n):
+    """
+    Check whether n is prime.
+
+    Small n are answered from the shared cached sieve; large n use
+    deterministic Miller-Rabin instead of trial division.
+
+    Args:
+        n (int): Integer to test
+
+    Returns:
+        bool: True if n is prime
+    """
+    return n in _SIEVE
+
+
+def _palindromes(length):
+    """
+    Yield the palindromes with `length` digits that could be prime, in order.
+
+    Every palindrome with an even number of digits is divisible by 11, and
+    a multi-digit prime must start (and so end) with 1, 3, 7 or 9.
+    """
+    if length == 1:
+        yield from (2, 3, 5, 7)
+        return
+    if length == 2:
+        yield 11
+        return
+    if length % 2 == 0:
+        return
+    half = (length + 1) // 2
+    step = 10 ** (half - 1)
+    for lead in (1, 3, 7, 9):
+        for left in range(lead * step, (lead + 1) * step):
+            text = str(left)
+            yield int(text + text[-2::-1])
+
+
+def palindromic_primes(lo, hi):
+    """
+    Yield primes p with lo <= p < hi that read the same forwards and backwards.
+
+    Palindromes are generated directly and only those are tested for
+    primality, so the work grows with sqrt(hi) candidates rather than hi.
+
+    Args:
+        lo (int): Inclusive lower bound
+        hi (int): Exclusive upper bound
+
+    Yields:
+        int: Palindromic primes in increasing order
+    """
+    if hi <= max(lo, 2):
+        return
+    for length in range(len(str(max(lo, 1))), len(str(hi - 1)) + 1):
+        for candidate in _palindromes(length):
+            if candidate >= hi:
+                return
+            # Candidates are sparse, so test them directly rather than sieving
+            if candidate >= lo and miller_rabin(candidate):
+                yield candidate
+
+
+def _trial_division_is_prime(n):
+    # The original per-call check from Lab2_1.ipynb, kept for benchmarking
+    if n <= 1:
+        return False
+    for i in range(2, int(n ** 0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+def benchmark(scan_limit=1_000_000, palindrome_limit=10 ** 9):
+    """
+    Compare the trial-division scan against the new prime services.
+
+    Args:
+        scan_limit (int): Range scanned with the original per-number check
+        palindrome_limit (int): Range searched with palindromic_primes
+
+    Returns:
+        dict: Seconds per approach
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    slow = [n for n in range(scan_limit)
+            if _trial_division_is_prime(n) and str(n) == str(n)[::-1]]
+    timings["trial_division"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = list(palindromic_primes(0, scan_limit))
+    timings["palindromic_primes"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    count = sum(1 for _ in palindromic_primes(0, palindrome_limit))
+    timings["palindromic_primes_large"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sieved = sum(1 for _ in primes_in_range(0, scan_limit))
+    timings["segmented_sieve"] = time.perf_counter() - start
+
+    print(f"Palindromic primes below {scan_limit:,}:")
+    print(f"  trial division scan: {timings['trial_division']:.3f} s ({len(slow)} found)")
+    print(f"  palindromic_primes:  {timings['palindromic_primes']:.4f} s "
+          f"({len(fast)} found, {'match' if fast == slow else 'MISMATCH'})")
+    print(f"Palindromic primes below {palindrome_limit:,}: {count} in "
+          f"{timings['palindromic_primes_large']:.3f} s")
+    print(f"Segmented sieve below {scan_limit:,}: {sieved:,} primes in "
+          f"{timings['segmented_sieve']:.3f} s")
+    return timings
+
+
+def main():
+    """
+    Demonstrate the prime services and optionally run the benchmark.
+    """
+    print("Prime Number Utilities")
+    print("=" * 30)
+    for n in (131, 123, 121, 2 ** 61 - 1, 18446744073709551557):
+        print(f"{n}: prime={is_prime(n)}")
+    print(f"Primes in [100, 150): {list(primes_in_range(100, 150))}")
+    print(f"Palindromic primes below 1000: {list(palindromic_primes(0, 1000))}")
+
+    if "--benchmark" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+"""
+Streaming Number Statistics
+
+- One-pass mean, minimum and maximum, as analyze_numbers from
+  Lab2_1.ipynb (Task 1) computes with sum/min/max over a list
+- Variance with Welford's update, combined chunk by chunk with Chan's
+  formula so NumPy arrays are folded in without a Python loop per value
+- Approximate quantiles from a merging t-digest of bounded size
+- Partial results from parallel workers merged exactly (t-digest: approximately)
+- analyze_file() streaming whitespace-separated numbers from a file of any
+  size, optionally split across processes
+- Benchmark against the list-based analyze_numbers
+"""
+
+import math
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Values converted to an array at a time when consuming a plain iterable
+CHUNK_VALUES = 1 << 16
+
+# Bytes of a file parsed per chunk by analyze_file
+CHUNK_SIZE = 1 << 20
+
+# t-digest compression: about COMPRESSION / 2 centroids (a few KB) are kept;
+# at 1000 the 0.1% and 99.9% quantiles are within about 0.1%
+COMPRESSION = 1000
+
+# Values buffered before they are merged into the digest
+DIGEST_BUFFER = 1 << 18
+
+WHITESPACE = b" \t\n\r\x0b\x0c"
+
+
+def _require_numpy(name):
+    if np is None:
+        raise ImportError(f"{name} requires NumPy")
+
+
+def _nan_min(a, b):
+    # Unlike min(), a NaN on either side wins whatever the argument order
+    return a if a < b or math.isnan(a) else b
+
+
+def _nan_max(a, b):
+    return a if a > b or math.isnan(a) else b
+
+
+def _compress(means, weights, compression):
+    """
+    Merge sorted centroids into at most about compression / 2 groups.
+
+    Uses the k1 scale function of the t-digest: centroids are kept small near
+    q = 0 and q = 1 and allowed to grow in the middle, so tail quantiles stay
+    accurate. Grouping by the integer part of k is vectorized, so each merge
+    is a few array passes.
+    """
+    total = weights.sum()
+    q_left = (np.cumsum(weights) - weights) / total
+    k = compression / (2 * math.pi) * np.arcsin(2 * q_left - 1)
+    groups = np.floor(k - k[0])
+    starts = np.flatnonzero(np.diff(groups, prepend=-1))
+    merged_weights = np.add.reduceat(weights, starts)
+    merged_means = np.add.reduceat(means * weights, starts) / merged_weights
+    return merged_means, merged_weights
+
+
+class RunningStats:
+    """
+    Single-pass accumulator of count, mean, variance, min, max and quantiles.
+
+    Feed it values with add() or update(); memory stays bounded however many
+    values pass through. Accumulators built separately (e.g. one per worker)
+    are combined with merge(). Quantiles need NumPy; everything else works
+    without it.
+
+    NaN propagates as in NumPy: once a NaN has been added, the mean, min,
+    max, variance and quantiles are all nan.
+    """
+
+    def __init__(self, compression=COMPRESSION):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.compression = compression
+        self._means = self._weights = None
+        self._pending = []
+        self._buffer = []
+        self._buffered = 0
+
+    def add(self, value):
+        """
+        Add one value (Welford's update).
+        """
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = _nan_min(value, self.min)
+        self.max = _nan_max(value, self.max)
+        if np is not None:
+            self._pending.append(value)
+            if len(self._pending) >= CHUNK_VALUES:
+                pending, self._pending = self._pending, []
+                self._buffer_values(np.array(pending))
+        return self
+
+    def update(self, values):
+        """
+        Add every value of an iterable or a NumPy array.
+
+        Arrays are summarized with vectorized operations and combined with
+        the running totals in one step. Other iterables are consumed
+        CHUNK_VALUES at a time, so generators of any length are fine.
+
+        Args:
+            values (iterable): Numbers, or a NumPy array of any shape
+
+        Returns:
+            RunningStats: self
+        """
+        if np is None:
+            for value in values:
+                self.add(value)
+            return self
+        if isinstance(values, np.ndarray):
+            self._update_array(values.astype(np.float64, copy=False).ravel())
+            return self
+        values = iter(values)
+        while True:
+            chunk = np.fromiter(islice(values, CHUNK_VALUES), dtype=np.float64)
+            if not len(chunk):
+                return self
+            self._update_array(chunk)
+
+    def _update_array(self, values):
+        if not len(values):
+            return
+        count = len(values)
+        mean = values.mean()
+        m2 = np.square(values - mean).sum()
+        self._combine(count, float(mean), float(m2), float(values.min()), float(values.max()))
+        self._buffer_values(values)
+
+    def _combine(self, count, mean, m2, low, high):
+        # Chan et al.: pairwise combination of two (count, mean, M2) summaries
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = _nan_min(low, self.min)
+        self.max = _nan_max(high, self.max)
+
+    def _buffer_values(self, values):
+        self._buffer.append(values)
+        self._buffered += len(values)
+        if self._buffered >= DIGEST_BUFFER:
+            self._flush()
+
+    def _flush(self):
+        # Merge the buffered values (and pending scalars) into the digest
+        if self._pending:
+            self._buffer.append(np.array(self._pending))
+            self._pending = []
+        if not self._buffer:
+            return
+        values = np.sort(np.concatenate(self._buffer))
+        weights = np.ones(len(values))
+        self._buffer, self._buffered = [], 0
+        if self._means is not None:
+            # Slot the few centroids into the sorted values instead of re-sorting
+            positions = np.searchsorted(values, self._means)
+            values = np.insert(values, positions, self._means)
+            weights = np.insert(weights, positions, self._weights)
+        self._means, self._weights = _compress(values, weights, self.compression)
+
+    def merge(self, other):
+        """
+        Fold another RunningStats into this one.
+
+        Count, mean, variance, min and max combine exactly; the digests are
+        merged and recompressed.
+
+        Args:
+            other (RunningStats): Accumulator over other values
+
+        Returns:
+            RunningStats: self
+        """
+        if not other.count:
+            return self
+        self._combine(other.count, other.mean, other._m2, other.min, other.max)
+        if np is not None:
+            other._flush()
+            self._flush()
+            if self._means is None:
+                self._means, self._weights = other._means.copy(), other._weights.copy()
+            else:
+                means = np.concatenate((self._means, other._means))
+                order = np.argsort(means, kind="stable")
+                weights = np.concatenate((self._weights, other._weights))[order]
+                self._means, self._weights = _compress(means[order], weights, self.compression)
+        return self
+
+    @property
+    def variance(self):
+        """
+        Population variance (as statistics.pvariance); nan when empty.
+        """
+        return self._m2 / self.count if self.count else math.nan
+
+    @property
+    def sample_variance(self):
+        """
+        Sample variance (as statistics.variance); nan for fewer than two values.
+        """
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        """
+        Return the approximate q-quantile (0 <= q <= 1).
+
+        Interpolates between centroid centres, with the exact min and max at
+        the ends. Error is smallest near the tails, which is where the
+        t-digest keeps its centroids smallest.
+
+        Args:
+            q (float): Quantile, e.g. 0.5 for the median
+
+        Returns:
+            float: Estimated value, nan when empty
+        """
+        _require_numpy("quantile")
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if not self.count or math.isnan(self.min):
+            return math.nan
+        self._flush()
+        means, weights = self._means, self._weights
+        centres = np.cumsum(weights) - weights / 2
+        position = q * self.count
+        points = np.concatenate(([0.0], centres, [float(self.count)]))
+        values = np.concatenate(([self.min], means, [self.max]))
+        return float(np.interp(position, points, values))
+
+    def quantiles(self, qs):
+        """
+        Return [quantile(q) for q in qs].
+        """
+        return [self.quantile(q) for q in qs]
+
+    def result(self):
+        """
+        Return (mean, min, max) like analyze_numbers, or None when empty.
+        """
+        if not self.count:
+            return None
+        return (self.mean, self.min, self.max)
+
+
+def analyze_numbers(numbers):
+    """
+    Calculates the mean, minimum, and maximum values of any iterable in one pass.
+
+    Args:
+        numbers: An iterable (list, generator, NumPy array) of numbers.
+
+    Returns:
+        A tuple containing the mean, minimum, and maximum values.
+        Returns None if there are no numbers.
+    """
+    return RunningStats().update(numbers).result()
+
+
+def _align(f, offset, size):
+    # Move offset forward to the next whitespace byte, so no number is split
+    if offset in (0, size):
+        return offset
+    f.seek(offset - 1)
+    while True:
+        data = f.read(4096)
+        if not data:
+            return size
+        for i, byte in enumerate(data):
+            if byte in WHITESPACE:
+                return offset - 1 + i
+        offset += len(data)
+
+
+def _last_whitespace(block):
+    return max(block.rfind(byte) for byte in (b" ", b"\n", b"\t", b"\r", b"\x0b", b"\x0c"))
+
+
+def _parse(block):
+    if np is not None:
+        return np.fromstring(block, dtype=np.float64, sep=" ") if block.strip() else ()
+    return map(float, block.split())
+
+
+def _analyze_range(path, start, end, chunk_size=CHUNK_SIZE, compression=COMPRESSION):
+    """
+    Return a RunningStats over the numbers in bytes [start, end) of a file.
+    """
+    stats = RunningStats(compression)
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        tail = b""
+        while remaining > 0:
+            data = f.read(min(chunk_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            block = tail + data
+            cut = _last_whitespace(block) + 1
+            tail = block[cut:]
+            if cut:
+                stats.update(_parse(block[:cut]))
+        if tail:
+            stats.update(_parse(tail))
+    return stats
+
+
+def analyze_file(path, workers=1, chunk_size=CHUNK_SIZE, compression=COMPRESSION):
+    """
+    Compute RunningStats over the whitespace-separated numbers in a file.
+
+    The file is parsed chunk by chunk, never as a list, so it may be far
+    larger than memory. With workers > 1 it is split into byte ranges at
+    whitespace, each range is summarized in its own process and the partial
+    results are merged.
+
+    Args:
+        path (str): File of numbers separated by spaces or newlines
+        workers (int): Processes to split the file across
+        chunk_size (int): Bytes parsed at a time
+        compression (int): t-digest compression
+
+    Returns:
+        RunningStats: Statistics of every number in the file
+
+    Raises:
+        ValueError: If the file contains something that is not a number
+    """
+    size = os.path.getsize(path)
+    workers = max(1, min(workers, size // chunk_size or 1))
+    if workers == 1:
+        return _analyze_range(path, 0, size, chunk_size, compression)
+
+    with open(path, "rb") as f:
+        bounds = [_align(f, size * i // workers, size) for i in range(workers + 1)]
+    stats = RunningStats(compression)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_analyze_range, [path] * workers, bounds[:-1], bounds[1:],
+                             [chunk_size] * workers, [compression] * workers):
+            stats.merge(part)
+    return stats
+
+
+def _analyze_numbers_list(numbers):
+    # The original Task 1 function: three passes over a materialized list
+    if not numbers:
+        return None
+    return (sum(numbers) / len(numbers), min(numbers), max(numbers))
+
+
+def benchmark(count=20_000_000, workers=os.cpu_count()):
+    """
+    Time the list-based analyze_numbers against analyze_file on generated data.
+
+    Args:
+        count (int): Number of values in the generated file
+        workers (int): Processes for the parallel run
+    """
+    _require_numpy("benchmark")
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "readings.txt")
+        with open(path, "w") as f:
+            for start in range(0, count, 1_000_000):
+                block = rng.normal(50.0, 10.0, min(1_000_000, count - start)).round(4)
+                f.write("\n".join(map(str, block.tolist())) + "\n")
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"{count:,} values ({size_mb:.0f} MB)")
+
+        start = time.perf_counter()
+        with open(path) as f:
+            numbers = [float(x) for x in f.read().split()]
+        expected = _analyze_numbers_list(numbers)
+        elapsed = time.perf_counter() - start
+        exact = np.quantile(np.array(numbers), [0.01, 0.5, 0.99])
+        del numbers
+        print(f"{'list + sum/min/max':<24} {elapsed:7.2f} s")
+
+        for name, run_workers in (("analyze_file", 1), (f"analyze_file x{workers}", workers)):
+            start = time.perf_counter()
+            stats = analyze_file(path, run_workers)
+            elapsed = time.perf_counter() - start
+            match = all(math.isclose(a, b, rel_tol=1e-9) for a, b in zip(stats.result(), expected))
+            print(f"{name:<24} {elapsed:7.2f} s  {size_mb / elapsed:6.1f} MB/s  "
+                  f"{'match' if match else 'MISMATCH'}")
+        estimate = stats.quantiles([0.01, 0.5, 0.99])
+        print("Quantiles p1/p50/p99: "
+              + ", ".join(f"{a:.4f} (exact {b:.4f})" for a, b in zip(estimate, exact)))
+
+
+def main():
+    """
+    Analyze numbers typed by the user (or a file) and optionally run the benchmark.
+    """
+    print("Streaming Number Statistics")
+    print("=" * 30)
+    if len(sys.argv) > 1 and not sys.argv[1].startswith("--"):
+        stats = analyze_file(sys.argv[1], os.cpu_count())
+    else:
+        input_string = input("Enter a list of numbers separated by spaces: ")
+        try:
+            stats = RunningStats().update(float(x) for x in input_string.split())
+        except ValueError:
+            print("Invalid input. Please enter numbers separated by spaces.")
+            stats = RunningStats()
+
+    if stats.count:
+        print(f"Count: {stats.count}")
+        print(f"Mean: {stats.mean}")
+        print(f"Minimum: {stats.min}")
+        print(f"Maximum: {stats.max}")
+        print(f"Std Dev: {stats.std}")
+        if np is not None:
+            print(f"Median (approx.): {stats.quantile(0.5)}")
+    else:
+        print("The list is empty.")
+
+    if "--benchmark" in sys.argv:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
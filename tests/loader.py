@@ -0,0 +1,27 @@
+"""
+Load the lab scripts as modules (their paths contain spaces).
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_module(relative_path, name):
+    """
+    Import ROOT / relative_path under `name`, with its folder on sys.path
+    so it can import the shared modules next to it.
+    """
+    path = ROOT / relative_path
+    folder = str(path.parent)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
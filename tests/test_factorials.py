@@ -0,0 +1,47 @@
+import math
+import sys
+import tracemalloc
+
+from loader import load_module
+
+factorials = load_module("Lab 3/factorials.py", "factorials")
+
+
+def test_cache_matches_math_factorial():
+    cache = factorials.FactorialCache(max_bytes=64 * 1024)
+    for n in (0, 1, 7, 300, 2500, 1234, 4000, 17):
+        assert cache.factorial(n) == math.factorial(n)
+    assert cache.binomial(300, 120) == math.comb(300, 120)
+
+
+def test_cache_memory_stays_near_budget_while_extending():
+    budget = 1 << 20
+    cache = factorials.FactorialCache(max_bytes=budget)
+    tracemalloc.start()
+    try:
+        result = cache.factorial(15_000)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert cache._bytes <= budget
+    # The budget plus a few copies of 15000! itself (about 23 KB each)
+    assert peak < 2 * budget
+    assert result == math.factorial(15_000)
+
+
+def test_digit_count():
+    for value in (0, 1, 9, 10, 99, 100, 10 ** 50 - 1, 10 ** 50, math.factorial(5000)):
+        with_str = sys.get_int_max_str_digits()
+        sys.set_int_max_str_digits(0)
+        try:
+            expected = len(str(value))
+        finally:
+            sys.set_int_max_str_digits(with_str)
+        assert factorials.digit_count(value) == expected
+
+
+def test_main_runs(capsys, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["factorials.py"])
+    factorials.main()
+    out = capsys.readouterr().out
+    assert "5000! has 16326 digits (all methods agree: True)" in out
@@ -0,0 +1,37 @@
+import pytest
+
+from loader import load_module
+
+task5 = load_module("lab 1/task5.py", "line_count")
+
+SAMPLES = [
+    b"",
+    b"one\ntwo\nthree\n",
+    b"one\r\ntwo\r\nthree",
+    b"one\rtwo\rthree\r",
+    b"mixed\r\n\r\rline\n\n\r\nend",
+    b"\r\r\n\n\r",
+]
+
+
+def _readlines(path):
+    with open(path, "r", newline=None) as f:
+        return len(f.readlines())
+
+
+@pytest.mark.parametrize("data", SAMPLES)
+@pytest.mark.parametrize("buffer_size", [1, 2, 3, 1 << 20])
+def test_count_lines_matches_readlines(tmp_path, monkeypatch, data, buffer_size):
+    monkeypatch.setattr(task5, "BUFFER_SIZE", buffer_size)
+    path = tmp_path / "data.txt"
+    path.write_bytes(data)
+    expected = _readlines(path)
+    assert task5.count_lines(str(path)) == expected
+    # Small buffers allow several byte ranges, so CRLF pairs also split across workers
+    assert task5.count_lines(str(path), workers=4, use_processes=False) == expected
+
+
+def test_wc_counts_only_lf_like_wc(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_bytes(b"one two\rthree\r\nfour\n")
+    assert task5.wc(str(path)) == (2, 4, 20)
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from loader import load_module
+
+login = load_module("Lab 3/Task 4.py", "login_service")
+loadgen = load_module("Lab 3/login_loadgen.py", "login_loadgen")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limiter_limits_bursts(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(login.time, "monotonic", clock)
+    limiter = login.RateLimiter(rate=2.0, burst=3)
+    assert [limiter.allow("10.0.0.1") for _ in range(4)] == [True, True, True, False]
+    clock.now += 0.5
+    assert limiter.allow("10.0.0.1")
+    assert not limiter.allow("10.0.0.1")
+
+
+def test_rate_limiter_evicts_idle_buckets(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(login.time, "monotonic", clock)
+    limiter = login.RateLimiter(rate=5.0, burst=10)
+    # A scan from many addresses, one request each
+    for i in range(10_000):
+        limiter.allow(f"10.{i >> 16}.{(i >> 8) & 255}.{i & 255}")
+        clock.now += 0.001
+    assert len(limiter) <= 2_000 + 1
+    # Once every bucket has refilled (burst / rate = 2 s), all are dropped
+    clock.now += 2.0
+    limiter.allow("192.168.0.1")
+    assert len(limiter) == 1
+
+
+def test_rate_limiter_keeps_partial_buckets(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(login.time, "monotonic", clock)
+    limiter = login.RateLimiter(rate=1.0, burst=2)
+    assert limiter.allow("a") and limiter.allow("a")
+    clock.now += 1.0
+    limiter.allow("b")
+    # "a" has refilled only one token, so its bucket must survive
+    assert len(limiter) == 2
+    assert limiter.allow("a")
+    assert not limiter.allow("a")
+
+
+def test_load_with_cache_hits_needs_warm_users():
+    # Rejected before any connection is made
+    with pytest.raises(ValueError, match="users"):
+        asyncio.run(loadgen.run_load("127.0.0.1", 9, 2, 2, users=0, hit_ratio=0.5))
@@ -0,0 +1,127 @@
+import json
+
+import numpy as np
+import pytest
+
+from loader import load_module
+
+bills = load_module("Lab 3/Task 3.py", "power_bill")
+
+FOUR_SLABS = {
+    "residential": {
+        "fixed_charge": 50,
+        "slabs": [
+            {"limit": 100, "rate": 3.5},
+            {"limit": 200, "rate": 4.5},
+            {"limit": 400, "rate": 5.5},
+            {"limit": None, "rate": 6.5},
+        ],
+    },
+    "agricultural": {
+        "fixed_charge": 10,
+        "slabs": [{"limit": 300, "rate": 1.25}, {"limit": None, "rate": 2.0}],
+    },
+}
+
+
+def _readings(count=5_000, seed=11):
+    rng = np.random.default_rng(seed)
+    units = np.round(rng.uniform(0, 2_000, count), 2)
+    units[:6] = [0, 100, 200, 300, 400, 1_000]
+    return units, rng.integers(0, 3, count)
+
+
+def test_scalar_and_batch_bills_agree():
+    units, codes = _readings()
+    batch = bills.calculate_power_bills(units, np.array(bills.CUSTOMER_TYPES)[codes])
+    scalar = [
+        bills.calculate_power_bill(u, bills.CUSTOMER_TYPES[c])
+        for u, c in zip(units.tolist(), codes.tolist())
+    ]
+    for name in ("fixed_charge", "subtotal", "gst", "surcharge", "total_amount"):
+        assert batch[name].tolist() == [bill[name] for bill in scalar]
+    for slab in range(3):
+        expected = [
+            sum(d["units"] for d in bill["slab_details"] if d["slab"] == f"slab{slab + 1}")
+            for bill in scalar
+        ]
+        assert batch[f"slab{slab + 1}_units"].tolist() == expected
+
+
+def test_built_in_tariffs_bill_as_before():
+    bill = bills.calculate_power_bill(150, "residential")
+    assert [(d["slab"], d["units"]) for d in bill["slab_details"]] == [("slab1", 100), ("slab2", 50)]
+    assert bill["total_amount"] == pytest.approx(668.75)
+    assert bills.calculate_power_bill(300, "commercial")["subtotal"] == pytest.approx(1_750)
+    with pytest.raises(ValueError):
+        bills.calculate_power_bill(10, "hospital")
+    with pytest.raises(ValueError):
+        bills.calculate_power_bills([10, -1], "residential")
+
+
+def test_table_with_fourth_slab_and_new_class():
+    table = bills.TariffTable(FOUR_SLABS)
+    units, codes = _readings()
+    codes %= 2
+    batch = table.calculate_bills(units, codes)
+    names = table.customer_types
+    scalar = [table.calculate_bill(u, names[c]) for u, c in zip(units.tolist(), codes.tolist())]
+    assert batch["total_amount"].tolist() == [bill["total_amount"] for bill in scalar]
+    # Agricultural readings have no third or fourth slab to fill
+    assert not batch["slab3_units"][codes == 1].any()
+    assert table.calculate_bill(500, "residential")["subtotal"] == 50 + 350 + 450 + 1_100 + 650
+
+
+def _write_readings(path, count=250):
+    units, codes = _readings(count)
+    with open(path, "w", newline="") as f:
+        f.write("customer_id,customer_type,units\n")
+        for n, (u, c) in enumerate(zip(units.tolist(), codes.tolist())):
+            f.write(f"C{n},{bills.CUSTOMER_TYPES[c].title()},{u}\n")
+    return units.tolist(), [bills.CUSTOMER_TYPES[c] for c in codes.tolist()]
+
+
+def _bill_run(tmp_path, *extra):
+    args = [str(tmp_path / "in.csv"), str(tmp_path / "out.csv"), "--chunk-size", "100", "--workers", "1"]
+    return bills.bill_run(args + list(extra))
+
+
+def test_bill_run_matches_scalar_bills(tmp_path):
+    units, types = _write_readings(tmp_path / "in.csv")
+    assert _bill_run(tmp_path) == 0
+    lines = (tmp_path / "out.csv").read_text().splitlines()
+    assert lines[0] == ",".join(bills.BILL_RUN_COLUMNS)
+    assert len(lines) == len(units) + 1
+    for line, u, t in zip(lines[1:], units, types):
+        fields = line.split(",")
+        assert fields[1:3] == [t, str(u)]
+        assert fields[-1] == f"{bills.calculate_power_bill(u, t)['total_amount']:.2f}"
+
+
+def test_resume_truncates_to_checkpoint(tmp_path):
+    _write_readings(tmp_path / "in.csv")
+    assert _bill_run(tmp_path) == 0
+    expected = (tmp_path / "out.csv").read_bytes()
+
+    # Checkpoint after the first chunk, plus a half-written second chunk
+    input_lines = (tmp_path / "in.csv").read_bytes().splitlines(keepends=True)
+    output_lines = expected.splitlines(keepends=True)
+    state = {
+        "input_offset": len(b"".join(input_lines[:101])),
+        "output_offset": len(b"".join(output_lines[:101])),
+        "chunks": 1,
+        "rows": 100,
+    }
+    (tmp_path / "out.csv.checkpoint").write_text(json.dumps(state))
+    (tmp_path / "out.csv").write_bytes(b"".join(output_lines[:150]) + b"C150,resi")
+    assert _bill_run(tmp_path, "--resume") == 0
+    assert (tmp_path / "out.csv").read_bytes() == expected
+
+
+def test_resume_without_output_fails_cleanly(tmp_path, capsys):
+    _write_readings(tmp_path / "in.csv")
+    state = {"input_offset": 40, "output_offset": 500, "chunks": 1, "rows": 1}
+    (tmp_path / "out.csv.checkpoint").write_text(json.dumps(state))
+    assert _bill_run(tmp_path, "--resume") == 1
+    assert "does not match checkpoint" in capsys.readouterr().err
+    assert not (tmp_path / "out.csv").exists()
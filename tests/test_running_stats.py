@@ -0,0 +1,46 @@
+import math
+import statistics
+
+import numpy as np
+import pytest
+
+from loader import load_module
+
+running_stats = load_module("running_stats.py", "running_stats")
+
+
+def _values(count=50_000, seed=3):
+    return np.random.default_rng(seed).normal(10, 2, count)
+
+
+def test_matches_exact_statistics():
+    values = _values()
+    stats = running_stats.RunningStats().update(values[:20_000])
+    for value in values[20_000:30_000].tolist():
+        stats.add(value)
+    stats.merge(running_stats.RunningStats().update(iter(values[30_000:].tolist())))
+    assert stats.count == len(values)
+    assert stats.result() == pytest.approx((values.mean(), values.min(), values.max()))
+    assert stats.variance == pytest.approx(statistics.pvariance(values.tolist()))
+    assert stats.quantile(0.5) == pytest.approx(np.median(values), rel=1e-3)
+
+
+@pytest.mark.parametrize("nan_first", [True, False])
+def test_nan_propagates_whatever_the_order(nan_first):
+    values = _values(1_000)
+    nan = np.array([math.nan])
+    chunks = [nan, values] if nan_first else [values, nan]
+
+    updated = running_stats.RunningStats()
+    added = running_stats.RunningStats()
+    merged = running_stats.RunningStats()
+    for chunk in chunks:
+        updated.update(chunk)
+        for value in chunk.tolist():
+            added.add(value)
+        merged.merge(running_stats.RunningStats().update(chunk))
+
+    for stats in (updated, added, merged):
+        assert stats.count == len(values) + 1
+        assert all(math.isnan(x) for x in (stats.mean, stats.min, stats.max, stats.variance))
+        assert math.isnan(stats.quantile(0.5))
@@ -0,0 +1,29 @@
+import io
+
+from loader import load_module
+
+info = load_module("Lab 4/Task 3 G.py", "student_info")
+display = load_module("Lab Test 1/Task 2.py", "student_display")
+
+
+def test_students_info_joins_single_student_lines():
+    students = [
+        {"full_name": "Siddu", "branch": "CSE", "sgpa": 9.0},
+        {"full_name": "harsha", "sgpa": 9.2},
+        {},
+    ]
+    expected = "".join(info.get_student_info(student) + "\n" for student in students)
+    assert info.get_students_info(students) == expected
+    assert info.get_student_info(students[1]) == "Full Name : harsha , Branch : N/A , SGPA : 9.2"
+
+
+def test_display_all_matches_display_per_student(capsys):
+    students = [display.Student(f"s{n}", str(n), 50.0 + n) for n in range(7)]
+    for student in students:
+        student.display()
+    expected = capsys.readouterr().out
+    assert expected.startswith("Student class: <class 'student_display.Student'>\nDetails of the student:\nName: s0\n")
+
+    out = io.StringIO()
+    display.display_all(students, out, batch_size=3)
+    assert out.getvalue() == expected
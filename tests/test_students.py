@@ -0,0 +1,42 @@
+import io
+
+from loader import load_module
+
+students = load_module("Lab 7/students.py", "students")
+
+
+def _table(count=2_000):
+    return students._build_table(students._sample_students(count, seed=3))
+
+
+def test_snapshot_round_trip(tmp_path):
+    table = _table()
+    path = tmp_path / "students.snap"
+    table.save(path)
+    loaded = students.StudentTable.load(path)
+    assert list(loaded.rows()) == list(table.rows())
+
+
+def test_save_over_loaded_snapshot(tmp_path):
+    table = _table()
+    path = tmp_path / "students.snap"
+    table.save(path)
+    loaded = students.StudentTable.load(path)
+    loaded.save(path)
+    # The mapped table still reads its original data...
+    assert list(loaded.rows()) == list(table.rows())
+    # ...and the rewritten snapshot is complete
+    assert list(students.StudentTable.load(path).rows()) == list(table.rows())
+    assert [p.name for p in tmp_path.iterdir()] == ["students.snap"]
+
+
+def test_plain_report_matches_get_summary():
+    table = _table(50)
+    records = [students.StudentRecord(name, student_id, courses) for name, student_id, courses in table.rows()]
+    for source, summaries in (
+        (table, [table.get_summary(row) for row in range(len(table))]),
+        (records, [record.get_summary() for record in records]),
+    ):
+        out = io.StringIO()
+        students.render_report(source, out, "plain", batch_size=7)
+        assert out.getvalue() == "".join(summary + "\n" for summary in summaries)
@@ -0,0 +1,144 @@
+import random
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from loader import load_module
+
+words_module = load_module("Lab 4/Task 5 C.py", "word_frequency")
+
+K = 20
+EPSILON = 1e-4
+DELTA = 1e-3
+
+
+def _zipf_words(num_words=200_000, vocabulary=50_000, skew=1.2, seed=7):
+    rng = random.Random(seed)
+    weights = [1 / (rank ** skew) for rank in range(1, vocabulary + 1)]
+    return [f"id{n:x}" for n in rng.choices(range(vocabulary), weights, k=num_words)]
+
+
+def _build(words):
+    approx = words_module.ApproximateTopK(K, epsilon=EPSILON, delta=DELTA)
+    approx.update(words)
+    return approx
+
+
+def _check_against_exact(approx, exact, total):
+    top = approx.top(K)
+    exact_top = {word for word, _ in exact.most_common(K)}
+    recall = len(exact_top & {word for word, _, _ in top}) / K
+    assert recall >= 0.95
+    for word, estimate, error in top:
+        # Never undercounts, never overcounts by more than the reported error,
+        # and the reported error stays within the Count-Min bound
+        assert exact[word] <= estimate <= exact[word] + error
+        assert error <= EPSILON * total
+
+
+def test_top_k_matches_exact_counter():
+    words = _zipf_words()
+    _check_against_exact(_build(words), Counter(words), len(words))
+
+
+def test_count_min_overestimates_within_bounds():
+    words = _zipf_words(skew=0.8)
+    exact = Counter(words)
+    sketch = words_module.CountMinSketch(EPSILON, DELTA)
+    for word in words:
+        sketch.add(word)
+    overcounts = [sketch.estimate(word) - count for word, count in exact.items()]
+    assert min(overcounts) >= 0
+    # Each word exceeds epsilon * N with probability at most delta
+    exceeding = sum(overcount > EPSILON * len(words) for overcount in overcounts)
+    assert exceeding <= max(1, 2 * DELTA * len(exact))
+
+
+def test_space_saving_guarantees_frequent_words():
+    words = _zipf_words()
+    exact = Counter(words)
+    summary = words_module.SpaceSaving(capacity=500)
+    for word in words:
+        summary.add(word)
+    # Every monitored count brackets the true count within its error...
+    for word, count in summary.counts.items():
+        assert count - summary.errors[word] <= exact[word] <= count
+    # ...and every word above N / capacity is monitored
+    for word, count in exact.items():
+        if count > len(words) / summary.capacity:
+            assert word in summary.counts
+
+
+def test_merged_parallel_sketches_equal_serial():
+    words = _zipf_words()
+    parts = [words[i::4] for i in range(4)]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        partials = list(pool.map(_build, parts))
+    merged = partials[0]
+    for part in partials[1:]:
+        merged.merge(part)
+    serial = _build(words)
+    assert merged.sketch.rows == serial.sketch.rows
+    assert merged.total == serial.total == len(words)
+    _check_against_exact(merged, Counter(words), len(words))
+
+
+def test_merge_rejects_mismatched_sketches():
+    with pytest.raises(ValueError):
+        words_module.CountMinSketch(1e-3).merge(words_module.CountMinSketch(1e-4))
+
+
+def _chunks(text, seed):
+    rng = random.Random(seed)
+    start = 0
+    while start < len(text):
+        size = rng.randint(1, 7)
+        yield text[start:start + size]
+        start += size
+
+
+def _fed(chunks):
+    counter = words_module.WordCounter()
+    for chunk in chunks:
+        counter.feed(chunk)
+    counter.flush()
+    return counter.counts
+
+
+def test_chunked_counting_matches_whole_text():
+    rng = random.Random(3)
+    alphabet = "abcXYZÉé_ '',.!-\n\t"
+    for seed in range(200):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 300)))
+        expected = Counter(re.sub(r"[^\w\s]", "", text.lower()).split())
+        assert _fed(_chunks(text, seed)) == expected
+        assert _fed([text]) == expected
+
+
+def test_word_spanning_many_chunks_is_counted_once():
+    chunks = ["lead ", *["x"] * 50_000, ".", "Y", " tail"]
+    assert _fed(chunks) == Counter({"lead": 1, "x" * 50_000 + "y": 1, "tail": 1})
+
+
+def test_parallel_count_matches_serial(tmp_path):
+    rng = random.Random(5)
+    paths = []
+    for n, size in enumerate((30_000, 2_000, 0)):
+        path = tmp_path / f"part{n}.txt"
+        path.write_text(" ".join(rng.choice(["Alpha,", "beta", "Gamma!", "don't", "x\n"]) for _ in range(size)))
+        paths.append(str(path))
+    serial = words_module.WordCounter()
+    for path in paths:
+        serial.update_file(path)
+    timings = {}
+    assert words_module.count_words_parallel(paths, workers=3, timings=timings) == serial.counts
+    assert set(timings) == {"count", "merge"}
+
+
+def test_range_groups_are_contiguous_and_complete():
+    ranges = [("f", start, start + size) for start, size in zip(range(0, 1_000, 100), [100] * 10)]
+    groups = words_module._group_ranges(ranges, 4)
+    assert len(groups) == 4
+    assert [r for group in groups for r in group] == ranges